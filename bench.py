@@ -0,0 +1,200 @@
+"""
+PixelSynth Benchmark Suite
+Measures every effect on the same synthetic input, in a real browser.
+
+`generator.py bench` builds each selected effect into output/bench/<id>/
+with runtime/synthetic.js (a deterministic test pattern in place of the
+webcam) and runtime/bench.js (the frame driver), serves output/ and walks a
+browser through the pages one after another. Each page sweeps paramA and
+paramB over a grid and POSTs its samples to /bench; the reply sends the
+browser on to the next effect. When every effect has reported (or timed
+out) a table is printed and the raw numbers are written as JSON.
+
+With Chromium installed the whole run is headless, so it works on CPU-only
+CI machines:
+
+    python3 generator.py bench all --headless --json bench.json
+"""
+import os
+import json
+import time
+import shutil
+import tempfile
+import threading
+import subprocess
+import webbrowser
+import urllib.parse
+from effects_library import EFFECTS
+from compose import compile_effect
+from server import POST_ROUTES, make_server
+import generator
+
+BENCH_DIR = "bench"
+BROWSERS = ("chromium", "chromium-browser", "google-chrome", "google-chrome-stable", "chrome")
+CHROMIUM_FLAGS = [
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--autoplay-policy=no-user-gesture-required",
+    "--enable-precise-memory-info",  # unquantised performance.memory for the allocation column
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-backgrounding-occluded-windows",
+]
+
+def find_browser(path=None):
+    if path:
+        return shutil.which(path) or path
+    for name in BROWSERS:
+        found = shutil.which(name)
+        if found:
+            return found
+    return None
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+def mean(values):
+    return sum(values) / len(values) if values else None
+
+def summarise(report):
+    """Per-effect row from a page's report: every measured frame of every grid point pooled."""
+    if "error" in report:
+        return {"error": report["error"]}
+    frames = [ms for point in report["points"] for ms in point["frameMs"]]
+    heap = [n for point in report["points"] for n in point["heapBytes"]]
+    if not frames:
+        return {"error": "no frames measured"}
+    slowest = max(report["points"], key=lambda point: mean(point["frameMs"]))
+    return {
+        "mean_ms": mean(frames),
+        "p95_ms": percentile(frames, 0.95),
+        "load_pixels_ms": mean([ms for point in report["points"] for ms in point["loadPixelsMs"]]),
+        "update_pixels_ms": mean([ms for point in report["points"] for ms in point["updatePixelsMs"]]),
+        "draw_calls": mean([n for point in report["points"] for n in point["drawCalls"]]),
+        "alloc_kb": mean(heap) / 1024 if heap else None,
+        "slowest_params": slowest["params"],
+    }
+
+class BenchRun:
+    def __init__(self, keys, warmup, frames, grid):
+        self.keys = keys
+        # Full resolution throughout, so every effect is measured on the same pixel count
+        self.query = urllib.parse.urlencode({"warmup": warmup, "frames": frames, "grid": grid, "adaptive": 0})
+        self.results = {}
+        self.current = keys[0]
+        self.progress = threading.Event()
+        self._lock = threading.Lock()
+
+    def url(self, key):
+        return f"/{BENCH_DIR}/{key}/?{self.query}"
+
+    def next_key(self, key):
+        position = self.keys.index(key) + 1
+        return self.keys[position] if position < len(self.keys) else None
+
+    def record(self, handler, report):
+        # POST /bench from runtime/bench.js
+        key = report["page"].strip("/").split("/")[-1]
+        if key not in self.keys:
+            raise ValueError(f"Not part of this run: {report['page']}")
+        with self._lock:
+            if key != self.current:  # a page we already gave up on
+                return {"next": None}
+            self.finish(key, summarise(report), report)
+            following = self.current
+        return {"next": self.url(following) if following else None}
+
+    def finish(self, key, row, raw=None):
+        self.results[key] = dict(row, raw=raw)
+        if "error" in row:
+            print(f"✗ [{key}] {EFFECTS[key]['name']}: {row['error']}")
+        else:
+            print(f"✓ [{key}] {EFFECTS[key]['name']}: {row['mean_ms']:.2f} ms mean, {row['p95_ms']:.2f} ms p95")
+        self.current = self.next_key(key)
+        self.progress.set()
+
+    def timeout(self):
+        """Gives up on the effect the browser is stuck on; returns the next key."""
+        with self._lock:
+            self.finish(self.current, {"error": "timed out"})
+            return self.current
+
+def launch_browser(browser, url, headless, profile):
+    if browser is None:
+        threading.Thread(target=webbrowser.open, args=(url,), daemon=True).start()
+        return None
+    flags = CHROMIUM_FLAGS + [f"--user-data-dir={profile}"]
+    if headless:
+        # WebGL (runtime/glsl.js) on the SwiftShader software rasteriser, as on a CI machine without a GPU
+        flags += ["--headless=new", "--disable-gpu", "--use-angle=swiftshader", "--enable-unsafe-swiftshader"]
+    return subprocess.Popen([browser, *flags, url], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+def print_table(keys, results):
+    print(f"\n{'id':>4}  {'effect':<28} {'mean ms':>8} {'p95 ms':>8} {'draws':>7} {'alloc KB':>9}")
+    for key in keys:
+        row = results.get(key, {"error": "not run"})
+        name = EFFECTS[key]["name"][:28]
+        if "error" in row:
+            print(f"{key:>4}  {name:<28} {row['error']}")
+            continue
+        alloc = f"{row['alloc_kb']:.1f}" if row["alloc_kb"] is not None else "n/a"
+        print(f"{key:>4}  {name:<28} {row['mean_ms']:8.2f} {row['p95_ms']:8.2f} {row['draw_calls']:7.0f} {alloc:>9}")
+
+def run(keys, warmup=10, frames=30, grid=3, browser=None, headless=False, timeout=60, use_luts=True, json_path=None,
+        source="bars"):
+    if source == "camera":
+        raise ValueError("Benchmarks need a synthetic source so every run sees the same frames")
+    browser = find_browser(browser)
+    if headless and browser is None:
+        raise FileNotFoundError("--headless needs Chromium or Chrome on PATH (or --browser)")
+
+    targets = []
+    for key in keys:
+        effect = generator.with_source(compile_effect(key, use_luts), source)
+        targets.append((f"{BENCH_DIR}/{key}", dict(effect, runtime=["synthetic", "bench"] + effect["runtime"][1:])))
+    generator.build_catalog(targets)
+
+    bench = BenchRun(keys, warmup, frames, grid)
+    POST_ROUTES["/bench"] = bench.record
+    httpd = make_server(generator.OUTPUT_DIR, generator.PORT)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+
+    where = "the system browser" if browser is None else os.path.basename(browser) + (" (headless)" if headless else "")
+    print(f"\nBenchmarking {len(keys)} effect(s) in {where}: {grid}x{grid} params, "
+          f"{warmup} warm-up + {frames} measured frames each")
+
+    base = f"http://localhost:{generator.PORT}"
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix="pixelsynth-bench-") as profile:
+        process = launch_browser(browser, base + bench.url(keys[0]), headless, profile)
+        try:
+            while bench.current is not None:
+                if bench.progress.wait(timeout):
+                    bench.progress.clear()
+                    continue
+                # Stuck page (a hang or a crash we never heard about): move the browser on
+                following = bench.timeout()
+                if following is not None and process is not None:
+                    process.terminate()
+                    process.wait()
+                    process = launch_browser(browser, base + bench.url(following), headless, profile)
+        except KeyboardInterrupt:
+            print("\nBenchmark interrupted.")
+        finally:
+            if process is not None:
+                process.terminate()
+                process.wait()
+            httpd.shutdown()
+            httpd.server_close()
+
+    print_table(keys, bench.results)
+    print(f"\nFinished in {time.perf_counter() - start:.1f} s")
+    json_path = json_path or os.path.join(generator.OUTPUT_DIR, BENCH_DIR, "results.json")
+    with open(json_path, "w") as f:
+        json.dump({
+            "settings": {"warmup": warmup, "frames": frames, "grid": grid, "source": source, "browser": browser, "headless": headless},
+            "effects": {key: dict(name=EFFECTS[key]["name"], **bench.results[key]) for key in keys if key in bench.results},
+        }, f, indent=2)
+    print(f"Results written to {json_path}")
+    return bench.results
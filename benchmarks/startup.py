@@ -0,0 +1,94 @@
+"""
+Startup benchmark for the effect registry.
+
+Measures, in a fresh interpreter each time:
+  - import:  `import effects_library`
+  - menu:    import + formatting every menu line (what `generator.py` does
+             before it can prompt)
+  - compile: menu + loading the JS of a single effect
+
+The real library is measured first, then synthetic libraries of larger sizes
+built by cycling the real effects under new ids, so regressions show up
+before the catalog actually grows that big.
+
+    python benchmarks/startup.py
+    python benchmarks/startup.py --sizes 108 500 2000 --repeat 15 --json startup.jsonl
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import statistics
+import subprocess
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from effects_library import EFFECTS_DIR, INDEX_FILE  # noqa: E402
+
+PROBE = r"""
+import json, time
+t0 = time.perf_counter()
+from effects_library import EFFECTS
+t1 = time.perf_counter()
+lines = [f"[{key}] {effect['name']} - {effect['description']}" for key, effect in EFFECTS.items()]
+t2 = time.perf_counter()
+EFFECTS[next(iter(EFFECTS))]["draw_loop"]
+t3 = time.perf_counter()
+print(json.dumps({"import": t1 - t0, "menu": t2 - t0, "compile": t3 - t0, "effects": len(lines)}))
+"""
+
+def make_synthetic_library(size, target):
+    with open(os.path.join(EFFECTS_DIR, INDEX_FILE), "r", encoding="utf-8") as f:
+        index = json.load(f)
+    originals = list(index.values())
+
+    synthetic = {}
+    for i in range(size):
+        meta = dict(originals[i % len(originals)])
+        filename = f"{i + 1:05d}_{meta['file']}"
+        shutil.copyfile(os.path.join(EFFECTS_DIR, meta["file"]), os.path.join(target, filename))
+        meta["file"] = filename
+        synthetic[str(i + 1)] = meta
+
+    with open(os.path.join(target, INDEX_FILE), "w", encoding="utf-8") as f:
+        json.dump(synthetic, f)
+
+def probe(effects_dir, repeat):
+    env = dict(os.environ, PIXELSYNTH_EFFECTS_DIR=effects_dir, PYTHONDONTWRITEBYTECODE="1")
+    samples = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", PROBE], cwd=REPO_ROOT, env=env,
+                             capture_output=True, text=True, check=True)
+        samples.append(json.loads(out.stdout))
+    return {
+        "effects": samples[0]["effects"],
+        **{phase: statistics.median(s[phase] for s in samples) * 1000 for phase in ("import", "menu", "compile")},
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="*", default=[500, 2000], help="Synthetic library sizes")
+    parser.add_argument("--repeat", type=int, default=9, help="Fresh interpreters per measurement (median is reported)")
+    parser.add_argument("--json", help="Append the results as one JSON line to this file")
+    args = parser.parse_args()
+
+    results = [dict(library="effects/", **probe(EFFECTS_DIR, args.repeat))]
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as target:
+            make_synthetic_library(size, target)
+            results.append(dict(library=f"synthetic x{size}", **probe(target, args.repeat)))
+
+    print(f"{'library':<18}{'effects':>8}{'import ms':>11}{'menu ms':>10}{'compile ms':>12}")
+    for r in results:
+        print(f"{r['library']:<18}{r['effects']:>8}{r['import']:>11.2f}{r['menu']:>10.2f}{r['compile']:>12.2f}")
+
+    if args.json:
+        with open(args.json, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"timestamp": time.time(), "results": results}) + "\n")
+
+if __name__ == "__main__":
+    main()
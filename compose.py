@@ -0,0 +1,391 @@
+"""
+PixelSynth Effect Chaining
+Fuses an ordered list of effects into a single sketch.
+
+Effects can opt into chaining by providing a kernel form next to their
+regular draw_loop (and declaring it as "kernel" in effects/index.json):
+
+  // @kernel_setup  per-frame setup run once before the pixel loop
+  // @pixel         per-pixel body; reads and updates the registers r, g, b, a
+  // @neighbour     like @pixel, but may also read its input frame through
+                    src (RGBA, w x h) at any offset from the current index i
+  // @overlay       p5 drawing done after the fused pass has been written
+
+Both bodies can use x, y, i (RGBA index), w and h, and must not redeclare
+them or the registers. Variables declared at the top level of kernel_setup
+are renamed per stage so two stages never collide.
+
+Consecutive @pixel stages share one loop and hand off through the
+registers. A @neighbour stage needs the previous stage's whole frame, so the
+compiler ends the current pass there, writes it to a reusable typed buffer
+and starts a new pass that reads from it. The first stage always reads the
+grabbed camera frame directly, and the last pass writes straight into the
+canvas' persistent ImageData (grabFrame() / outputFrame() in sketch_base.js).
+
+compile_worker() builds the same fused passes into a Web Worker script
+instead, for kernels that only need p5's math helpers and random() (no
+noise(), frameCount or drawing): the page then only grabs frames and shows
+results. Optionally a pool of workers splits each frame into bands.
+
+compile_effect() also gives an effect with a @glsl section (a fragment
+shader body, see runtime/glsl.js) a GPU path: the sketch runs the shader and
+keeps the CPU draw loop as its fallback. Chains always run on the CPU.
+
+Stages whose effect declares a "lut" (see luts.py) have their @pixel body
+replaced by lookups into a table baked at build time, when NumPy is
+available. Besides the usual fields, the returned effect can then carry
+"preload" code, "runtime" modules (runtime/*.js) and binary "assets".
+"""
+import re
+import textwrap
+from effects_library import EFFECTS
+
+try:
+    import luts
+except ImportError:  # NumPy is optional; without it stages keep their arithmetic kernels
+    luts = None
+
+KERNEL_KINDS = ("pixel", "neighbour")
+RESERVED = ("r", "g", "b", "a", "x", "y", "i", "w", "h", "src", "out", "input", "output")
+WORKER_BUILTINS = {"abs", "atan2", "ceil", "constrain", "cos", "dist", "exp", "floor", "lerp", "log", "mag", "map",
+                   "max", "min", "pow", "random", "round", "sin", "sq", "sqrt", "tan"}  # see runtime/pixelworker_scope.js
+JS_KEYWORDS = {"if", "for", "while", "switch", "return", "function", "catch", "typeof"}
+
+class ChainError(ValueError):
+    pass
+
+def top_level_declarations(code):
+    """Names declared with let/const/var outside of any block in code."""
+    names = []
+    depth = 0
+    for line in code.splitlines():
+        stripped = line.strip()
+        match = re.match(r"(?:let|const|var)\s+(.*)", stripped)
+        if depth == 0 and match:
+            # Split "a = 1, b = f(x, y);" on the commas that separate declarators
+            level, start, declarators = 0, 0, []
+            text = match.group(1)
+            for pos, char in enumerate(text):
+                if char in "([{":
+                    level += 1
+                elif char in ")]}":
+                    level -= 1
+                elif char == "," and level == 0:
+                    declarators.append(text[start:pos])
+                    start = pos + 1
+            declarators.append(text[start:])
+            for declarator in declarators:
+                name = re.match(r"\s*([A-Za-z_$][\w$]*)", declarator)
+                if name:
+                    names.append(name.group(1))
+        depth += stripped.count("{") - stripped.count("}")
+    return names
+
+SKIPPED = r"""'(?:[^'\\\n]|\\.)*'|"(?:[^"\\\n]|\\.)*"|`(?:[^`\\]|\\.)*`|//[^\n]*|/\*.*?\*/"""
+
+def rename(code, names, prefix):
+    """Prefix every reference to names in code.
+
+    String literals, comments and object keys ({name: ...}) are left alone.
+    Template literals are skipped whole, so ${name} inside one is not renamed,
+    and neither is shorthand {name}: spell such uses out.
+    """
+    if not names:
+        return code
+    alternation = "|".join(re.escape(name) for name in names)
+    pattern = re.compile(rf"({SKIPPED})|(?<![\w$.])({alternation})(?![\w$])", re.S)
+
+    def replace(match):
+        if match.group(1):
+            return match.group(1)
+        before = code[:match.start()].rstrip()[-1:]
+        after = code[match.end():].lstrip()[:1]
+        if before in ("{", ",") and after == ":":
+            return match.group(2)
+        return prefix + match.group(2)
+
+    return pattern.sub(replace, code)
+
+def load_stages(keys, use_luts=True):
+    stages = []
+    for n, key in enumerate(keys):
+        if key not in EFFECTS:
+            raise ChainError(f"Unknown effect id: {key}")
+        effect = EFFECTS[key]
+        kind = effect.get("kernel")
+        if kind not in KERNEL_KINDS:
+            raise ChainError(f"[{key}] {effect['name']} has no pixel kernel and cannot be chained")
+
+        setup = effect.get("kernel_setup", "")
+        body = effect.get(kind, "")
+        overlay = effect.get("overlay", "")
+        names = top_level_declarations(setup)
+        clashes = [name for name in names if name in RESERVED]
+        if clashes:
+            raise ChainError(f"[{key}] kernel_setup declares reserved name(s): {', '.join(clashes)}")
+
+        prefix = f"s{n}_"
+        stage = {
+            "key": key,
+            "name": effect["name"],
+            "description": effect["description"],
+            "kind": kind,
+            "cost": effect.get("cost", []),
+            "global_vars": effect["global_vars"],
+            "setup": rename(setup, names, prefix),
+            "body": rename(body, names, prefix),
+            "overlay": rename(overlay, names, prefix),
+            "lut": None,
+            "prefix": prefix,
+            "halo": effect.get("halo"),
+        }
+        lut_kind = effect.get("lut")
+        if use_luts and luts is not None and luts.has_table(key, lut_kind):
+            table, offsets = luts.build_table(key, lut_kind)
+            stage["lut"] = lut_kind
+            stage["lut_offsets"] = f"const {prefix}lutOffsets = [{', '.join(map(str, offsets))}];"
+            if lut_kind == "3d":
+                # Cubes are too big to inline, so they load as a binary asset
+                asset = f"lut3d_{key}.bin"
+                stage["assets"] = {asset: table}
+                stage["lut_data"] = f"let {prefix}lutFile;"
+                stage["preload"] = f"{prefix}lutFile = loadBytes(\"{asset}\");"
+                stage["setup"] += f"const {prefix}lut = {prefix}lutFile.bytes;\n"
+            else:
+                stage["lut_data"] = f"const {prefix}lut = decodeLut(\"{luts.encode(table)}\");"
+            stage["setup"] += f"let {prefix}lutBase = {prefix}lutOffsets[Math.round(paramA * {len(offsets) - 1})];\n"
+        elif not body.strip():
+            raise ChainError(f"[{key}] {effect['name']} only exists as a lookup table and needs NumPy to build")
+        stages.append(stage)
+    return stages
+
+def lut_body(stage, first):
+    """Table lookups replacing a stage's arithmetic. Registers coming straight
+    from src are already bytes; after another stage they are clamped to 0..255
+    and rounded first, so no value can index another bin's table or run past
+    the end (applyLut3d clamps for itself)."""
+    p = stage["prefix"]
+    r, g, b = ("r", "g", "b") if first else (
+        f"((Math.min(255, Math.max(0, {c})) + 0.5) | 0)" for c in ("r", "g", "b"))
+    if stage["lut"] == "3d":
+        return (f"applyLut3d({p}lut, {p}lutBase, {luts.LUT3D_SIZE}, r, g, b);\n"
+                "r = lut3dRGB[0];\n"
+                "g = lut3dRGB[1];\n"
+                "b = lut3dRGB[2];")
+    if stage["lut"] == "channel":
+        return (f"r = {p}lut[{p}lutBase + {r}];\n"
+                f"g = {p}lut[{p}lutBase + {g}];\n"
+                f"b = {p}lut[{p}lutBase + {b}];")
+    return (f"let p = {p}lutBase + ({r} + {g} + {b}) * 3;\n"
+            f"r = {p}lut[p];\n"
+            f"g = {p}lut[p + 1];\n"
+            f"b = {p}lut[p + 2];")
+
+def split_passes(stages):
+    """Each pass starts at a neighbour stage (or the first stage)."""
+    passes = []
+    for stage in stages:
+        if not passes or stage["kind"] == "neighbour":
+            passes.append([])
+        passes[-1].append(stage)
+    return passes
+
+def emit_pass(stages, src, out, rows=None):
+    """One loop over the frame, or over the rows (start, end) given as JS expressions."""
+    loop = "    for (let y = 0, i = 0; y < h; y++) {"
+    if rows:
+        loop = f"    for (let y = {rows[0]}, i = y * w * 4, end = {rows[1]}; y < end; y++) {{"
+    lines = [
+        "  {",
+        f"    const src = {src};",
+        f"    const out = {out};",
+        loop,
+        "      for (let x = 0; x < w; x++, i += 4) {",
+        "        let r = src[i], g = src[i + 1], b = src[i + 2], a = src[i + 3];",
+    ]
+    for n, stage in enumerate(stages):
+        body = lut_body(stage, n == 0) if stage["lut"] else textwrap.dedent(stage["body"])
+        lines.append(f"        {{ // [{stage['key']}] {stage['name']}" + (" (LUT)" if stage["lut"] else ""))
+        lines.append(textwrap.indent(body.strip("\n"), " " * 10))
+        lines.append("        }")
+    lines += [
+        "        out[i] = r;",
+        "        out[i + 1] = g;",
+        "        out[i + 2] = b;",
+        "        out[i + 3] = a;",
+        "      }",
+        "    }",
+        "  }",
+    ]
+    return "\n".join(lines)
+
+def compile_effect(key, use_luts=True):
+    """EFFECTS[key], or its table-driven version when it declares a LUT,
+    behind its fragment shader when it has one."""
+    effect = EFFECTS[key]
+    if use_luts and luts is not None and luts.has_table(key, effect.get("lut")):
+        effect = compile_chain([key], use_luts)
+    glsl = EFFECTS[key].get("glsl", "")
+    if glsl.strip():
+        return with_glsl(effect, glsl, EFFECTS[key].get("overlay", ""))
+    return effect
+
+def with_glsl(effect, glsl, overlay=""):
+    """effect drawn by runtime/glsl.js when WebGL is there, else by its own
+    draw loop. The shader path still runs the @overlay, if any."""
+    shader = textwrap.indent(textwrap.dedent(glsl).strip("\n"), "    ")
+    fallback = textwrap.indent(effect["draw_loop"].strip("\n"), "  ")
+    if overlay.strip():
+        overlay = textwrap.indent(textwrap.dedent(overlay).strip("\n"), "    ")
+        draw = ["  if (glslPass.draw()) {", overlay, "  } else {", fallback, "  }"]
+    else:
+        draw = ["  if (!glslPass.draw()) {", fallback, "  }"]
+    return dict(
+        effect,
+        global_vars=effect["global_vars"] + f"\nconst glslPass = createGlslPass(`\n{shader}\n`);\n",
+        draw_loop="\n" + "\n".join(draw) + "\n",
+        runtime=list(effect.get("runtime", [])) + ["glsl"],
+    )
+
+def band_rows(passes):
+    """(start, end) row expressions per pass for a band y0..y1 of the output.
+    A pass also computes the halo rows the neighbour passes after it read, so
+    a band never needs another band's intermediate results."""
+    rows = []
+    for n in range(len(passes)):
+        extra = sum(later[0]["halo"] or 0 for later in passes[n + 1:] if later[0]["kind"] == "neighbour")
+        rows.append((f"Math.max(0, y0 - {extra})", f"Math.min(h, y1 + {extra})") if extra else ("y0", "y1"))
+    return rows
+
+def fused_frame(stages, src, out, bands=False):
+    """Draw-loop lines that run every stage's kernel_setup and then the fused
+    passes, reading the frame from src and writing it to out (JS expressions).
+    With bands, only rows y0..y1 of out are written (see band_rows)."""
+    passes = split_passes(stages)
+    rows = band_rows(passes) if bands else [None] * len(passes)
+    title = " -> ".join(f"{s['key']} {s['name']}" for s in stages)
+    lines = [
+        f"  // Fused chain: {title}",
+        "  // {} pass(es) over the frame for {} effect(s)".format(len(passes), len(stages)),
+        "  const w = width, h = height;",
+    ]
+    if len(passes) > 1:
+        lines += [
+            "  for (let k = 0; k < 2; k++) {",
+            "    if (!chainBuffers[k] || chainBuffers[k].length !== w * h * 4) chainBuffers[k] = new Uint8ClampedArray(w * h * 4);",
+            "  }",
+        ]
+    for stage in stages:
+        if stage["setup"].strip():
+            lines.append(f"  // [{stage['key']}] {stage['name']}")
+            lines.append(textwrap.indent(textwrap.dedent(stage["setup"]).strip("\n"), "  "))
+
+    # Intermediate frames ping-pong between the two buffers
+    for n, stages_in_pass in enumerate(passes):
+        target = out if n == len(passes) - 1 else f"chainBuffers[{n % 2}]"
+        lines.append(emit_pass(stages_in_pass, src, target, rows[n]))
+        src = target
+    return lines
+
+def fused_parts(stages):
+    """What a fused chain needs besides its frame code: globals, preloads, assets, overlays."""
+    # Global state is shared when the same effect appears twice in a chain
+    global_vars = ["let chainBuffers = [];"]
+    seen = set()
+    for stage in stages:
+        if stage["key"] not in seen and stage["global_vars"].strip():
+            seen.add(stage["key"])
+            global_vars.append(f"// [{stage['key']}] {stage['name']}\n{stage['global_vars'].strip()}")
+    global_vars += [f"// [{stage['key']}] {stage['name']} lookup table\n{stage['lut_data']}\n{stage['lut_offsets']}"
+                    for stage in stages if stage["lut"]]
+    preload = [stage["preload"] for stage in stages if stage.get("preload")]
+    assets = {}
+    for stage in stages:
+        assets.update(stage.get("assets", {}))
+    overlays = []
+    for stage in stages:
+        if stage["overlay"].strip():
+            overlays.append(f"  // [{stage['key']}] {stage['name']} overlay")
+            overlays.append(textwrap.indent(textwrap.dedent(stage["overlay"]).strip("\n"), "  "))
+    return global_vars, preload, assets, overlays
+
+def compile_chain(keys, use_luts=True):
+    """Returns an effect dict (name, description, cost, global_vars, draw_loop) for
+    the ordered chain of EFFECTS keys, ready for generator.compile_sketch."""
+    if not keys:
+        raise ChainError("A chain needs at least one effect")
+    stages = load_stages(keys, use_luts)
+    global_vars, preload, assets, overlays = fused_parts(stages)
+    draw = fused_frame(stages, "grabFrame().rgba", "outputFrame().rgba") + ["  presentFrame();"] + overlays
+    title = " -> ".join(f"{s['key']} {s['name']}" for s in stages)
+
+    return {
+        "name": " + ".join(s["name"] for s in stages),
+        "description": stages[0]["description"] if len(stages) == 1 else f"Fused chain: {title}",
+        "global_vars": "\n" + "\n".join(global_vars) + "\n",
+        "draw_loop": "\n" + "\n".join(draw) + "\n",
+        "cost": sorted({tag for stage in stages for tag in stage["cost"]}),
+        "preload": "\n  ".join(preload),
+        "runtime": ["luts"] if any(stage["lut"] for stage in stages) else [],
+        "assets": assets,
+    }
+
+def worker_blockers(stage):
+    """Why a stage's kernel can't run in a worker: it calls p5 functions other
+    than the math helpers and random() runtime/pixelworker_scope.js provides,
+    depends on the frame count, or leaves state its overlay (run on the page)
+    reads."""
+    code = stage["setup"] + stage["body"]
+    shared = top_level_declarations(stage["setup"]) + top_level_declarations(stage["global_vars"])
+    own = set(re.findall(r"\bfunction\s+([A-Za-z_$][\w$]*)", code)) | set(shared)
+    calls = set(re.findall(r"(?<![\w$.])([A-Za-z_$][\w$]*)\s*\(", code)) - own - JS_KEYWORDS
+    reasons = [f"calls {name}()" for name in sorted(calls - WORKER_BUILTINS)]
+    if re.search(r"\bframeCount\b", code):
+        reasons.append("uses frameCount")
+    if any(re.search(rf"(?<![\w$.]){re.escape(name)}\b", stage["overlay"]) for name in shared):
+        reasons.append("its overlay reads kernel state")
+    return reasons
+
+def compile_worker(keys, use_luts=True, pool=None):
+    """Like compile_chain, but the fused passes run in Web Workers, so a slow
+    chain no longer blocks input or the UI. By default one worker gets each
+    grabbed frame by transfer (runtime/pixelworker.js). With pool, that many
+    workers (0: one per core) each process a horizontal band of frames shared
+    through SharedArrayBuffers (runtime/pixelpool.js); neighbour stages must
+    then declare the rows they read above and below as "halo" in the index.
+    The worker script ships as the "worker.js" asset; generator.sketch_sources
+    prepends the "worker_runtime" modules to "worker_code"."""
+    if not keys:
+        raise ChainError("A chain needs at least one effect")
+    stages = load_stages(keys, use_luts)
+    for stage in stages:
+        reasons = worker_blockers(stage)
+        if pool is not None and stage["kind"] == "neighbour" and stage["halo"] is None:
+            reasons.append('it reads neighbours but declares no "halo"')
+        if reasons:
+            raise ChainError(f"[{stage['key']}] {stage['name']} can't run in a worker: {', '.join(reasons)}")
+    global_vars, preload, assets, overlays = fused_parts(stages)
+    frame = fused_frame(stages, "input", "output", bands=True)
+    title = " -> ".join(f"{s['key']} {s['name']}" for s in stages)
+    worker_code = global_vars + [line.strip() for line in preload] + [
+        "",
+        "function processBand(input, output, width, height, paramA, paramB, y0, y1) {",
+        *frame,
+        "}",
+    ]
+    if pool is None:
+        create = 'const pixelWorker = createPixelWorker("worker.js");'
+    else:
+        create = f'const pixelWorker = createPixelPool("worker.js", {pool});'
+
+    return {
+        "name": " + ".join(s["name"] for s in stages),
+        "description": stages[0]["description"] if len(stages) == 1 else f"Fused chain: {title}",
+        "global_vars": f"\n{create}\n",
+        "draw_loop": "\n" + "\n".join(["  pixelWorker.frame(paramA, paramB);"] + overlays) + "\n",
+        "cost": sorted({tag for stage in stages for tag in stage["cost"]}),
+        "runtime": ["pixelworker"] if pool is None else ["pixelworker", "pixelpool"],
+        "worker_runtime": (["luts"] if any(stage["lut"] for stage in stages) else []) + ["pixelworker_scope"],
+        "worker_code": f"// Fused chain: {title}\n" + "\n".join(worker_code) + "\n",
+        "assets": assets,
+    }
@@ -0,0 +1,199 @@
+"""
+PixelSynth Dev Server
+Rebuilds sketches as their sources are edited and tells open pages to reload.
+
+`generator.py dev` builds the selected effects (and chains) into
+output/<name>/ with a small live-reload client, serves output/ and then polls
+effects/, the templates and runtime/ from an asyncio loop. A change only
+rebuilds the targets that depend on it:
+  - effects/<id>_<slug>.js   every target using that effect
+  - effects/index.json       every target whose compiled sources changed
+  - templates and runtime/   every target
+
+Each rebuild is announced to the pages as a Server-Sent Event on /events.
+With --hot, a rebuild that only touched the draw loop is swapped into the
+running sketch instead, so its state survives the edit.
+"""
+import os
+import json
+import time
+import queue
+import asyncio
+import threading
+import webbrowser
+from effects_library import EFFECTS, INDEX_FILE
+from compose import compile_chain, compile_effect
+from server import GET_ROUTES, make_server, run_shutdown_hooks
+import generator
+
+POLL_INTERVAL = 0.1
+SETTLE_DELAY = 0.05  # editors often save in several writes
+KEEPALIVE = 15
+
+class EventStream:
+    """Fans Server-Sent Events out to every connected page. publish() is
+    called from the asyncio loop, serve() runs on a server thread per page."""
+
+    def __init__(self):
+        self._clients = set()
+        self._lock = threading.Lock()
+
+    def publish(self, event):
+        data = json.dumps(event)
+        with self._lock:
+            for client in self._clients:
+                client.put(data)
+
+    def serve(self, handler):
+        client = queue.Queue()
+        handler.send_response(200)
+        handler.send_header("Content-Type", "text/event-stream")
+        handler.send_header("Cache-Control", "no-cache")
+        handler.end_headers()
+        handler.close_connection = True  # the stream has no length, so it ends with the connection
+        with self._lock:
+            self._clients.add(client)
+        try:
+            handler.wfile.write(b"retry: 500\n\n")
+            while True:
+                try:
+                    data = client.get(timeout=KEEPALIVE)
+                except queue.Empty:
+                    handler.wfile.write(b": ping\n\n")  # also notices pages that went away
+                else:
+                    handler.wfile.write(f"data: {data}\n\n".encode("utf-8"))
+        except OSError:
+            pass
+        finally:
+            with self._lock:
+                self._clients.discard(client)
+
+class DevBuild:
+    """The targets being developed and the sources they were last built from."""
+
+    def __init__(self, targets, use_luts=True, hot=False, source="camera"):
+        self.targets = targets  # output name -> list of EFFECTS keys
+        self.use_luts = use_luts
+        self.hot = hot
+        self.source = source
+        self.built = {}  # output name -> (sources, base_js, base_html)
+        self.p5_name = generator.publish_p5()
+
+    def sources(self, keys):
+        effect = compile_effect(keys[0], self.use_luts) if len(keys) == 1 else compile_chain(keys, self.use_luts)
+        sources = generator.sketch_sources(generator.with_source(effect, self.source))
+        sources["runtime"] += "\n" + generator.load_runtime(["devclient"])
+        return sources
+
+    def invalidate(self, changed):
+        """Drops whatever the registry cached for the changed paths and
+        returns the output names that depend on any of them."""
+        if any(os.path.basename(path) == INDEX_FILE for path in changed):
+            EFFECTS.reload()
+        by_path = {os.path.abspath(EFFECTS[key].path): key for key in EFFECTS}
+        keys = {by_path[path] for path in changed if path in by_path}
+        for key in keys:
+            EFFECTS[key].unload()
+        if len(keys) < len(changed):
+            # index.json, a template or a runtime module
+            return list(self.targets)
+        return [name for name, target_keys in self.targets.items() if keys & set(target_keys)]
+
+    def rebuild(self, names):
+        """Rebuilds the stale targets among names; returns one event per page."""
+        base_js = generator.load_template(generator.SKETCH_TEMPLATE)
+        base_html = generator.load_template(generator.HTML_TEMPLATE)
+        events = []
+        for name in names:
+            start = time.perf_counter()
+            page = f"/{name}/"
+            try:
+                sources = self.sources(self.targets[name])
+            except (ValueError, KeyError, OSError) as e:
+                print(f"✗ [{name}] {e}")
+                events.append({"page": page, "action": "error", "message": str(e)})
+                continue
+            digest = generator.build_hash(sources, base_js, base_html + self.p5_name)
+            if generator.read_build_hash(os.path.join(generator.OUTPUT_DIR, name)) != digest:
+                generator.build_effect(name, sources, base_js, base_html, self.p5_name, digest)
+                ms = (time.perf_counter() - start) * 1000
+                print(f"✓ Rebuilt [{name}] in {ms:.1f} ms")
+                if self.swappable(name, sources, base_js, base_html):
+                    events.append({"page": page, "action": "swap", "draw_loop": sources["draw_loop"], "ms": ms})
+                else:
+                    events.append({"page": page, "action": "reload"})
+            self.built[name] = (sources, base_js, base_html)
+        return events
+
+    def swappable(self, name, sources, base_js, base_html):
+        if not self.hot or name not in self.built:
+            return False
+        old_sources, old_js, old_html = self.built[name]
+        same = [field for field in sources if field != "draw_loop" and sources[field] == old_sources[field]]
+        return len(same) == len(sources) - 1 and (base_js, base_html) == (old_js, old_html)
+
+def watched_files():
+    """path -> (mtime_ns, size) of every file a build can depend on."""
+    here = os.path.dirname(os.path.abspath(__file__))
+    paths = [os.path.join(here, generator.SKETCH_TEMPLATE), os.path.join(here, generator.HTML_TEMPLATE)]
+    for directory in (EFFECTS.root, os.path.join(here, generator.RUNTIME_DIR)):
+        with os.scandir(directory) as entries:
+            paths += [entry.path for entry in entries if entry.is_file()]
+    snapshot = {}
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        snapshot[os.path.abspath(path)] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+async def watch(dev, events):
+    snapshot = watched_files()
+    while True:
+        await asyncio.sleep(POLL_INTERVAL)
+        current = watched_files()
+        if current == snapshot:
+            continue
+        await asyncio.sleep(SETTLE_DELAY)
+        current = watched_files()
+        changed = {path for path in current.keys() | snapshot.keys() if current.get(path) != snapshot.get(path)}
+        snapshot = current
+
+        for path in sorted(changed):
+            print(f"\n• {os.path.relpath(path)} changed")
+        try:
+            names = dev.invalidate(changed)
+        except (ValueError, OSError) as e:  # e.g. index.json caught half-written
+            print(f"✗ {e}")
+            continue
+        for event in await asyncio.to_thread(dev.rebuild, names):
+            events.publish(event)
+
+async def run(dev, path):
+    events = EventStream()
+    GET_ROUTES["/events"] = events.serve
+    httpd = make_server(generator.OUTPUT_DIR, generator.PORT)
+
+    print(f"Building {len(dev.targets)} sketch(es) for development...")
+    await asyncio.to_thread(dev.rebuild, list(dev.targets))
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+
+    url = f"http://localhost:{generator.PORT}/{path}"
+    print(f"Serving '{generator.OUTPUT_DIR}/' at {url} with live reload" + (" and hot swap" if dev.hot else ""))
+    print("Watching for changes. Press Ctrl+C to stop.")
+    threading.Thread(target=webbrowser.open, args=(url,), daemon=True).start()
+    try:
+        await watch(dev, events)
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+def serve(targets, use_luts=True, hot=False, source="camera"):
+    """targets maps output names to the EFFECTS keys they are built from."""
+    dev = DevBuild(targets, use_luts, hot, source)
+    try:
+        asyncio.run(run(dev, f"{next(iter(targets))}/" if len(targets) == 1 else ""))
+    except KeyboardInterrupt:
+        print("\nDev server stopped.")
+        run_shutdown_hooks()
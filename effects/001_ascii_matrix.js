@@ -0,0 +1,37 @@
+// [1] ASCII Matrix
+// @global_vars
+
+const density = "Ñ@#W$9876543210?!abc;:+=-,._ ";
+// @draw_loop
+
+  background(0);
+  video.loadPixels(); // Load webcam pixels into memory
+  
+  // Calculate grid resolution based on paramA (Mouse X)
+  // Ranges from 5px to 20px blocks
+  let w = floor(map(paramA, 0, 1, 5, 20));
+  let h = w;
+  
+  fill(255);
+  textSize(w);
+  
+  // Loop through the video pixels in a grid
+  for (let i = 0; i < width; i += w) {
+    for (let j = 0; j < height; j += h) {
+      // Calculate the index of the pixel in the video array
+      const pixelIndex = (i + j * video.width) * 4;
+      
+      const r = video.pixels[pixelIndex + 0];
+      const g = video.pixels[pixelIndex + 1];
+      const b = video.pixels[pixelIndex + 2];
+      
+      // Calculate brightness
+      const avg = (r + g + b) / 3;
+      
+      // Map brightness to a character in the density string
+      const len = density.length;
+      const charIndex = floor(map(avg, 0, 255, len - 1, 0));
+      
+      text(density.charAt(charIndex), i, j);
+    }
+  }
@@ -0,0 +1,31 @@
+// [2] RGB Channel Split
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels(); // Load webcam pixels
+  loadPixels();       // Load canvas pixels to write to
+  
+  // Determine offset based on paramA (Mouse X)
+  // Max offset of 50 pixels
+  let offset = floor(map(paramA, 0, 1, 0, 50));
+  
+  for (let y = 0; y < height; y++) {
+    for (let x = 0; x < width; x++) {
+      let index = (x + y * width) * 4;
+      
+      // Calculate shifted indices
+      // Red channel: shifted left
+      let rIndex = ((x - offset + width) % width + y * width) * 4;
+      
+      // Blue channel: shifted right
+      let bIndex = ((x + offset) % width + y * width) * 4;
+      
+      // Assign pixels
+      pixels[index + 0] = video.pixels[rIndex + 0]; // Red
+      pixels[index + 1] = video.pixels[index + 1];  // Green (Original)
+      pixels[index + 2] = video.pixels[bIndex + 2]; // Blue
+      pixels[index + 3] = 255;                      // Alpha
+    }
+  }
+  updatePixels(); // Push changes to canvas
@@ -0,0 +1,17 @@
+// [3] Scanline Slit-Scan
+// @global_vars
+let scanX = 0;
+// @draw_loop
+
+  video.loadPixels();
+  
+  // Copy a vertical slice (1px wide) from the center of the video
+  // to the current scanX position on the canvas
+  copy(video, width/2, 0, 1, height, scanX, 0, 1, height);
+  
+  // Move the scanline forward
+  scanX = (scanX + 1) % width;
+  
+  // Draw a red indicator line at the current scan position
+  stroke(255, 0, 0);
+  line(scanX, 0, scanX, height);
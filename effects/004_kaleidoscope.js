@@ -0,0 +1,42 @@
+// [4] Kaleidoscope
+// @global_vars
+// @draw_loop
+
+  background(0);
+  
+  // Kaleidoscope settings
+  // paramA controls number of slices (4 to 24)
+  let slices = int(map(paramA, 0, 1, 4, 24));
+  let angle = TWO_PI / slices;
+  let radius = max(width, height) * 1.5; // Ensure coverage
+  
+  translate(width / 2, height / 2);
+  
+  for (let i = 0; i < slices; i++) {
+    push();
+    rotate(i * angle);
+    
+    // Mirror every other slice for seamless pattern
+    if (i % 2 === 1) scale(1, -1);
+    
+    // Use native Canvas API to clip a triangular wedge
+    drawingContext.save();
+    drawingContext.beginPath();
+    drawingContext.moveTo(0, 0);
+    drawingContext.lineTo(radius, 0);
+    drawingContext.lineTo(radius * cos(angle), radius * sin(angle));
+    drawingContext.closePath();
+    drawingContext.clip();
+    
+    // Draw video
+    // paramB controls the offset/zoom into the texture
+    let zoom = map(paramB, 0, 1, 1.0, 2.5);
+    
+    imageMode(CENTER);
+    // Rotate the source slightly to animate or align
+    rotate(frameCount * 0.01);
+    image(video, 0, 0, width * zoom, height * zoom);
+    
+    drawingContext.restore();
+    pop();
+  }
@@ -0,0 +1,21 @@
+// [5] Standard Pixelate
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  
+  // paramA controls pixel size (from 4px to 40px)
+  let gridSize = floor(map(paramA, 0, 1, 4, 40));
+  
+  noStroke();
+  
+  for (let y = 0; y < height; y += gridSize) {
+    for (let x = 0; x < width; x += gridSize) {
+      // Get pixel color from the video array at the current grid position
+      let index = (x + y * width) * 4;
+      
+      fill(video.pixels[index], video.pixels[index + 1], video.pixels[index + 2]);
+      rect(x, y, gridSize, gridSize);
+    }
+  }
@@ -0,0 +1,28 @@
+// [6] Circle Halftone
+// @global_vars
+// @draw_loop
+
+  background(255);
+  video.loadPixels();
+  noStroke();
+  fill(0);
+
+  // paramA controls grid size (resolution)
+  let gridSize = floor(map(paramA, 0, 1, 6, 20));
+
+  for (let y = 0; y < height; y += gridSize) {
+    for (let x = 0; x < width; x += gridSize) {
+      let index = (x + y * width) * 4;
+      let r = video.pixels[index];
+      let g = video.pixels[index + 1];
+      let b = video.pixels[index + 2];
+      
+      // Calculate brightness
+      let bright = (r + g + b) / 3;
+
+      // Map brightness to circle diameter (darker = larger circle)
+      let diameter = map(bright, 0, 255, gridSize, 0);
+      
+      ellipse(x + gridSize / 2, y + gridSize / 2, diameter);
+    }
+  }
@@ -0,0 +1,27 @@
+// [7] Line Halftone
+// @global_vars
+// @draw_loop
+
+  background(255);
+  video.loadPixels();
+  stroke(0);
+  
+  // paramA controls line density/resolution
+  let step = floor(map(paramA, 0, 1, 5, 20));
+  
+  for (let y = 0; y < height; y += step) {
+    for (let x = 0; x < width; x += step) {
+      const index = (x + y * width) * 4;
+      const r = video.pixels[index];
+      const g = video.pixels[index + 1];
+      const b = video.pixels[index + 2];
+      
+      const bright = (r + g + b) / 3;
+      
+      // Map brightness to line thickness (Darker = thicker lines)
+      let weight = map(bright, 0, 255, step, 0);
+      
+      strokeWeight(weight);
+      line(x, y, x + step, y + step);
+    }
+  }
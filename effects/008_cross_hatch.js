@@ -0,0 +1,37 @@
+// [8] Cross-Hatch
+// @global_vars
+// @draw_loop
+
+  background(255);
+  video.loadPixels();
+  stroke(0);
+  
+  // paramA controls line spacing
+  let step = floor(map(paramA, 0, 1, 8, 20));
+  strokeWeight(1); // Keep lines thin for sketching look
+  
+  for (let y = 0; y < height; y += step) {
+    for (let x = 0; x < width; x += step) {
+      const index = (x + y * width) * 4;
+      const r = video.pixels[index];
+      const g = video.pixels[index + 1];
+      const b = video.pixels[index + 2];
+      
+      const bright = (r + g + b) / 3;
+      
+      // Layer 1: Light shading (Diagonal /)
+      if (bright < 200) {
+        line(x, y, x + step, y + step);
+      }
+      
+      // Layer 2: Mid-tone shading (Diagonal \)
+      if (bright < 150) {
+        line(x + step, y, x, y + step);
+      }
+      
+      // Layer 3: Dark shading (Vertical |)
+      if (bright < 100) {
+        line(x, y, x, y + step);
+      }
+    }
+  }
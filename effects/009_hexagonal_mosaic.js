@@ -0,0 +1,34 @@
+// [9] Hexagonal Mosaic
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  noStroke();
+  
+  // paramA controls hexagon radius
+  let r = floor(map(paramA, 0, 1, 3, 20));
+  let h = r * sqrt(3);
+  
+  // Function to draw a single hexagon
+  function drawHex(cx, cy, rad) {
+    let px = floor(constrain(cx, 0, width-1));
+    let py = floor(constrain(cy, 0, height-1));
+    let idx = (px + py * width) * 4;
+    
+    fill(video.pixels[idx], video.pixels[idx+1], video.pixels[idx+2]);
+    
+    beginShape();
+    for (let i = 0; i < 6; i++) {
+      let angle = TWO_PI / 6 * i;
+      vertex(cx + rad * cos(angle), cy + rad * sin(angle));
+    }
+    endShape(CLOSE);
+  }
+
+  for (let y = -h; y < height + h; y += h) {
+    for (let x = -r; x < width + r * 3; x += r * 3) {
+       drawHex(x, y, r);
+       drawHex(x + r * 1.5, y + h / 2, r);
+    }
+  }
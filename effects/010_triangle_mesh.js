@@ -0,0 +1,43 @@
+// [10] Triangle Mesh
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  noStroke();
+  
+  // paramA controls triangle scale
+  let scale = floor(map(paramA, 0, 1, 10, 50));
+  let h = scale * sqrt(3) / 2;
+  
+  for (let j = 0; j <= height / h + 1; j++) {
+    for (let i = 0; i <= width / (scale / 2) + 1; i++) {
+      let x = i * (scale / 2) - scale;
+      let y = j * h;
+      
+      // Determine orientation: (i + j) % 2 determines if it points up or down
+      let isUp = (i + j) % 2 === 0;
+      
+      let x1, y1, x2, y2, x3, y3;
+      
+      if (isUp) {
+         x1 = x;             y1 = y + h;
+         x2 = x + scale;     y2 = y + h;
+         x3 = x + scale / 2; y3 = y;
+      } else {
+         x1 = x;             y1 = y;
+         x2 = x + scale;     y2 = y;
+         x3 = x + scale / 2; y3 = y + h;
+      }
+      
+      let cx = (x1 + x2 + x3) / 3;
+      let cy = (y1 + y2 + y3) / 3;
+      
+      let px = floor(constrain(cx, 0, width - 1));
+      let py = floor(constrain(cy, 0, height - 1));
+      let idx = (px + py * width) * 4;
+      
+      fill(video.pixels[idx], video.pixels[idx+1], video.pixels[idx+2]);
+      triangle(x1, y1, x2, y2, x3, y3);
+    }
+  }
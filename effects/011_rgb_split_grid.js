@@ -0,0 +1,33 @@
+// [11] RGB Split Grid
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  noStroke();
+  
+  // paramA controls pixel size (CRT phosphor size)
+  let scale = floor(map(paramA, 0, 1, 3, 30));
+  let subW = scale / 3;
+  
+  for (let y = 0; y < height; y += scale) {
+    for (let x = 0; x < width; x += scale) {
+      let index = (x + y * width) * 4;
+      
+      let r = video.pixels[index];
+      let g = video.pixels[index + 1];
+      let b = video.pixels[index + 2];
+      
+      // Red sub-pixel
+      fill(r, 0, 0);
+      rect(x, y, subW, scale);
+      
+      // Green sub-pixel
+      fill(0, g, 0);
+      rect(x + subW, y, subW, scale);
+      
+      // Blue sub-pixel
+      fill(0, 0, b);
+      rect(x + 2 * subW, y, subW, scale);
+    }
+  }
@@ -0,0 +1,52 @@
+// [12] Voronoi Stained Glass
+// @global_vars
+let vSeeds = [];
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  noStroke();
+  
+  // paramA controls number of seeds (10 to 50)
+  let numSeeds = floor(map(paramA, 0, 1, 10, 100));
+  
+  // Regenerate seeds if count changes
+  if (vSeeds.length !== numSeeds) {
+    vSeeds = [];
+    for (let i = 0; i < numSeeds; i++) {
+      vSeeds.push({
+        x: random(width),
+        y: random(height)
+      });
+    }
+  }
+  
+  // Resolution of the Voronoi approximation (higher step = blockier but faster)
+  let step = 6; 
+  
+  for (let y = 0; y < height; y += step) {
+    for (let x = 0; x < width; x += step) {
+      let minDist = Infinity;
+      let closestSeedIndex = -1;
+      
+      // Find closest seed
+      for (let i = 0; i < vSeeds.length; i++) {
+        let dx = x - vSeeds[i].x;
+        let dy = y - vSeeds[i].y;
+        let d = dx*dx + dy*dy; // Squared distance is faster
+        if (d < minDist) {
+          minDist = d;
+          closestSeedIndex = i;
+        }
+      }
+      
+      // Color based on the video pixel at the SEED's location (Stained Glass look)
+      let s = vSeeds[closestSeedIndex];
+      let sx = floor(constrain(s.x, 0, width - 1));
+      let sy = floor(constrain(s.y, 0, height - 1));
+      let idx = (sx + sy * width) * 4;
+      
+      fill(video.pixels[idx], video.pixels[idx+1], video.pixels[idx+2]);
+      rect(x, y, step, step);
+    }
+  }
@@ -0,0 +1,87 @@
+// [13] Delaunay Triangulation
+// @global_vars
+
+let dPoints = [];
+let dTriangles = [];
+let lastParamA = -1;
+
+function circumcircle(a, b, c) {
+  let D = 2 * (a.x * (b.y - c.y) + b.x * (c.y - a.y) + c.x * (a.y - b.y));
+  // Avoid division by zero for collinear points
+  if (abs(D) < 0.001) return {x:0, y:0, r:Infinity};
+  let ux = ((a.x * a.x + a.y * a.y) * (b.y - c.y) + (b.x * b.x + b.y * b.y) * (c.y - a.y) + (c.x * c.x + c.y * c.y) * (a.y - b.y)) / D;
+  let uy = ((a.x * a.x + a.y * a.y) * (c.x - b.x) + (b.x * b.x + b.y * b.y) * (a.x - c.x) + (c.x * c.x + c.y * c.y) * (b.x - a.x)) / D;
+  let r = dist(ux, uy, a.x, a.y);
+  return { x: ux, y: uy, r: r };
+}
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  stroke(0);
+  strokeWeight(1);
+  
+  // paramA controls number of points (10 to 25)
+  // Kept low because brute-force Delaunay is O(N^4)
+  let numPoints = floor(map(paramA, 0, 1, 10, 25));
+  
+  if (numPoints !== lastParamA) {
+    lastParamA = numPoints;
+    dPoints = [];
+    
+    // Add random points
+    for (let i = 0; i < numPoints; i++) {
+      dPoints.push(createVector(random(width), random(height)));
+    }
+    // Add corners to ensure screen coverage
+    dPoints.push(createVector(0, 0));
+    dPoints.push(createVector(width, 0));
+    dPoints.push(createVector(width, height));
+    dPoints.push(createVector(0, height));
+    
+    // Brute force Delaunay
+    dTriangles = [];
+    for (let i = 0; i < dPoints.length; i++) {
+      for (let j = i + 1; j < dPoints.length; j++) {
+        for (let k = j + 1; k < dPoints.length; k++) {
+          let p1 = dPoints[i];
+          let p2 = dPoints[j];
+          let p3 = dPoints[k];
+          
+          let circle = circumcircle(p1, p2, p3);
+          let valid = true;
+          
+          // Check if any other point is inside circumcircle
+          for (let m = 0; m < dPoints.length; m++) {
+            if (m === i || m === j || m === k) continue;
+            if (dist(dPoints[m].x, dPoints[m].y, circle.x, circle.y) < circle.r - 0.1) {
+              valid = false;
+              break;
+            }
+          }
+          
+          if (valid) {
+            dTriangles.push([p1, p2, p3]);
+          }
+        }
+      }
+    }
+  }
+  
+  // Draw triangles
+  for (let t of dTriangles) {
+    let p1 = t[0];
+    let p2 = t[1];
+    let p3 = t[2];
+    
+    // Centroid
+    let cx = (p1.x + p2.x + p3.x) / 3;
+    let cy = (p1.y + p2.y + p3.y) / 3;
+    
+    let px = floor(constrain(cx, 0, width - 1));
+    let py = floor(constrain(cy, 0, height - 1));
+    let idx = (px + py * width) * 4;
+    
+    fill(video.pixels[idx], video.pixels[idx+1], video.pixels[idx+2]);
+    triangle(p1.x, p1.y, p2.x, p2.y, p3.x, p3.y);
+  }
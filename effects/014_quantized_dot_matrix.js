@@ -0,0 +1,27 @@
+// [14] Quantized Dot Matrix
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  noStroke();
+  
+  // paramA controls grid size (LED density)
+  let step = floor(map(paramA, 0, 1, 8, 30));
+  let dotSize = step * 0.8; // Leave some spacing
+  
+  for (let y = 0; y < height; y += step) {
+    for (let x = 0; x < width; x += step) {
+      let index = (x + y * width) * 4;
+      let r = video.pixels[index];
+      let g = video.pixels[index + 1];
+      let b = video.pixels[index + 2];
+      let bright = (r + g + b) / 3;
+      
+      // Threshold check: If bright enough, show color, else show dim 'off' state
+      if (bright > 80) fill(r, g, b);
+      else fill(30);
+      
+      ellipse(x + step/2, y + step/2, dotSize);
+    }
+  }
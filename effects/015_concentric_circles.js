@@ -0,0 +1,39 @@
+// [15] Concentric Circles
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  noFill();
+  
+  let cx = width / 2;
+  let cy = height / 2;
+  let maxRadius = dist(0, 0, cx, cy) + 20;
+  
+  // paramA controls ring thickness
+  let step = floor(map(paramA, 0, 1, 5, 50));
+  strokeWeight(step);
+  
+  for (let r = 0; r < maxRadius; r += step) {
+    let sumR = 0, sumG = 0, sumB = 0;
+    let count = 0;
+    
+    // Sample points along the ring to get an average color
+    for (let angle = 0; angle < TWO_PI; angle += 0.1) {
+      let x = floor(cx + cos(angle) * r);
+      let y = floor(cy + sin(angle) * r);
+      
+      if (x >= 0 && x < width && y >= 0 && y < height) {
+        let idx = (x + y * width) * 4;
+        sumR += video.pixels[idx];
+        sumG += video.pixels[idx+1];
+        sumB += video.pixels[idx+2];
+        count++;
+      }
+    }
+    
+    if (count > 0) {
+      stroke(sumR / count, sumG / count, sumB / count);
+      ellipse(cx, cy, r * 2, r * 2);
+    }
+  }
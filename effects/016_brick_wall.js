@@ -0,0 +1,44 @@
+// [16] Brick Wall
+// @global_vars
+// @draw_loop
+
+  background(50); // Dark mortar color
+  video.loadPixels();
+  stroke(50);
+  strokeWeight(2);
+  
+  // paramA controls brick height (width is 2x height)
+  let bh = floor(map(paramA, 0, 1, 10, 40));
+  let bw = bh * 2;
+  
+  for (let y = 0; y < height; y += bh) {
+    // Stagger every other row
+    let row = floor(y / bh);
+    let startX = (row % 2 === 0) ? 0 : -bw / 2;
+    
+    for (let x = startX; x < width; x += bw) {
+      let rSum = 0, gSum = 0, bSum = 0, count = 0;
+      
+      // Sample pixels within the brick to calculate average
+      // Using a step size of 4 for performance
+      for (let sy = 0; sy < bh; sy += 4) {
+        for (let sx = 0; sx < bw; sx += 4) {
+          let px = floor(x + sx);
+          let py = floor(y + sy);
+          
+          if (px >= 0 && px < width && py >= 0 && py < height) {
+            let idx = (px + py * width) * 4;
+            rSum += video.pixels[idx];
+            gSum += video.pixels[idx+1];
+            bSum += video.pixels[idx+2];
+            count++;
+          }
+        }
+      }
+      
+      if (count > 0) {
+        fill(rSum / count, gSum / count, bSum / count);
+        rect(x, y, bw, bh);
+      }
+    }
+  }
@@ -0,0 +1,25 @@
+// [17] Sine Wave Modulation
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  stroke(255);
+  fill(0); // Fill black to occlude lines behind
+  strokeWeight(1);
+  
+  // paramA controls vertical spacing
+  let step = floor(map(paramA, 0, 1, 10, 40));
+  
+  for (let y = step; y < height; y += step) {
+    beginShape();
+    vertex(0, y); // Anchor start
+    for (let x = 0; x < width; x += 5) {
+      let index = (x + y * width) * 4;
+      let bright = (video.pixels[index] + video.pixels[index+1] + video.pixels[index+2]) / 3;
+      let amp = map(bright, 0, 255, 0, step * 1.5);
+      vertex(x, y - amp);
+    }
+    vertex(width, y); // Anchor end
+    endShape();
+  }
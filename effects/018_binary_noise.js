@@ -0,0 +1,27 @@
+// [18] Binary Noise
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  noStroke();
+  
+  // paramA controls pixel size (resolution)
+  let step = floor(map(paramA, 0, 1, 1, 10));
+  
+  for (let y = 0; y < height; y += step) {
+    for (let x = 0; x < width; x += step) {
+      let index = (x + y * width) * 4;
+      let r = video.pixels[index];
+      let g = video.pixels[index + 1];
+      let b = video.pixels[index + 2];
+      let bright = (r + g + b) / 3;
+      
+      // Stochastic dithering:
+      // Probability of being white is proportional to brightness
+      if (random(255) < bright) fill(255);
+      else fill(0);
+      
+      rect(x, y, step, step);
+    }
+  }
@@ -0,0 +1,60 @@
+// [19] Adaptive Quadtree
+// @global_vars
+
+function qtColor(x, y, w, h) {
+  let r = 0, g = 0, b = 0;
+  let count = 0;
+  let step = 2;
+  for (let j = y; j < y + h; j += step) {
+    for (let i = x; i < x + w; i += step) {
+      if (i >= width || j >= height) continue;
+      let idx = (floor(i) + floor(j) * width) * 4;
+      r += video.pixels[idx];
+      g += video.pixels[idx+1];
+      b += video.pixels[idx+2];
+      count++;
+    }
+  }
+  if (count === 0) return {r:0, g:0, b:0};
+  return {r: r/count, g: g/count, b: b/count};
+}
+
+function drawQuadtree(x, y, w, h, threshold) {
+  let avg = qtColor(x, y, w, h);
+  
+  // Calculate error (variance)
+  let err = 0;
+  let count = 0;
+  let step = 4;
+  for (let j = y; j < y + h; j += step) {
+    for (let i = x; i < x + w; i += step) {
+      if (i >= width || j >= height) continue;
+      let idx = (floor(i) + floor(j) * width) * 4;
+      err += abs(video.pixels[idx] - avg.r) + abs(video.pixels[idx+1] - avg.g) + abs(video.pixels[idx+2] - avg.b);
+      count++;
+    }
+  }
+  err = (count > 0) ? err / count : 0;
+
+  if (err > threshold && w > 6) {
+    let hw = w / 2;
+    let hh = h / 2;
+    drawQuadtree(x, y, hw, hh, threshold);
+    drawQuadtree(x + hw, y, hw, hh, threshold);
+    drawQuadtree(x, y + hh, hw, hh, threshold);
+    drawQuadtree(x + hw, y + hh, hw, hh, threshold);
+  } else {
+    fill(avg.r, avg.g, avg.b);
+    rect(x, y, w, h);
+  }
+}
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  noStroke();
+  
+  // paramA controls threshold (Detail level)
+  let threshold = map(paramA, 0, 1, 100, 15);
+  
+  drawQuadtree(0, 0, width, height, threshold);
@@ -0,0 +1,40 @@
+// [20] Solarization
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  loadPixels();
+  
+  // paramA controls the threshold
+  let threshold = map(paramA, 0, 1, 0, 255);
+  
+  for (let i = 0; i < video.pixels.length; i += 4) {
+    let r = video.pixels[i];
+    let g = video.pixels[i + 1];
+    let b = video.pixels[i + 2];
+    
+    let bright = (r + g + b) / 3;
+    
+    if (bright > threshold) {
+      pixels[i] = 255 - r;
+      pixels[i + 1] = 255 - g;
+      pixels[i + 2] = 255 - b;
+    } else {
+      pixels[i] = r;
+      pixels[i + 1] = g;
+      pixels[i + 2] = b;
+    }
+    pixels[i + 3] = 255;
+  }
+  updatePixels();
+// @kernel_setup
+  let threshold = map(paramA, 0, 1, 0, 255);
+// @pixel
+    if ((r + g + b) / 3 > threshold) {
+      r = 255 - r;
+      g = 255 - g;
+      b = 255 - b;
+    }
+// @glsl
+    if ((color.r + color.g + color.b) / 3.0 > paramA) color.rgb = 1.0 - color.rgb;
@@ -0,0 +1,36 @@
+// [21] Posterization
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  loadPixels();
+  
+  // paramA controls the number of color levels (2 to 8)
+  let levels = floor(map(paramA, 0, 1, 2, 8));
+  
+  // Calculate bin size for quantization
+  let binSize = 255 / (levels - 1);
+  
+  for (let i = 0; i < video.pixels.length; i += 4) {
+    let r = video.pixels[i];
+    let g = video.pixels[i + 1];
+    let b = video.pixels[i + 2];
+    
+    // Quantize each channel to the nearest level
+    pixels[i] = floor(r / 255 * (levels - 1) + 0.5) * binSize;
+    pixels[i + 1] = floor(g / 255 * (levels - 1) + 0.5) * binSize;
+    pixels[i + 2] = floor(b / 255 * (levels - 1) + 0.5) * binSize;
+    pixels[i + 3] = 255;
+  }
+  updatePixels();
+// @kernel_setup
+  let levels = floor(map(paramA, 0, 1, 2, 8));
+  let binSize = 255 / (levels - 1);
+// @pixel
+    r = floor(r / 255 * (levels - 1) + 0.5) * binSize;
+    g = floor(g / 255 * (levels - 1) + 0.5) * binSize;
+    b = floor(b / 255 * (levels - 1) + 0.5) * binSize;
+// @glsl
+    float levels = floor(map(paramA, 0.0, 1.0, 2.0, 8.0));
+    color.rgb = floor(color.rgb * (levels - 1.0) + 0.5) / (levels - 1.0);
@@ -0,0 +1,52 @@
+// [22] Heatmap Mapping
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  loadPixels();
+  
+  // paramA shifts the color spectrum center
+  let shift = map(paramA, 0, 1, -50, 50);
+  
+  for (let i = 0; i < video.pixels.length; i += 4) {
+    let r = video.pixels[i];
+    let g = video.pixels[i + 1];
+    let b = video.pixels[i + 2];
+    let bright = (r + g + b) / 3;
+    
+    let val = constrain(bright + shift, 0, 255);
+    let outR = 0, outG = 0, outB = 0;
+    
+    // Thermal gradient: Blue (cold) -> Green -> Red (hot)
+    if (val < 128) {
+      // Blue to Green
+      outR = 0;
+      outG = map(val, 0, 128, 0, 255);
+      outB = map(val, 0, 128, 255, 0);
+    } else {
+      // Green to Red
+      outR = map(val, 128, 255, 0, 255);
+      outG = map(val, 128, 255, 255, 0);
+      outB = 0;
+    }
+    
+    pixels[i] = outR;
+    pixels[i + 1] = outG;
+    pixels[i + 2] = outB;
+    pixels[i + 3] = 255;
+  }
+  updatePixels();
+// @kernel_setup
+  let shift = map(paramA, 0, 1, -50, 50);
+// @pixel
+    let val = constrain((r + g + b) / 3 + shift, 0, 255);
+    if (val < 128) {
+      r = 0;
+      g = map(val, 0, 128, 0, 255);
+      b = map(val, 0, 128, 255, 0);
+    } else {
+      r = map(val, 128, 255, 0, 255);
+      g = map(val, 128, 255, 255, 0);
+      b = 0;
+    }
@@ -0,0 +1,35 @@
+// [23] Sepia Tone
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  loadPixels();
+  
+  // paramA controls intensity
+  let amount = map(paramA, 0, 1, 0.5, 1.0);
+  
+  for (let i = 0; i < video.pixels.length; i += 4) {
+    let r = video.pixels[i];
+    let g = video.pixels[i + 1];
+    let b = video.pixels[i + 2];
+    
+    let tr = (r * 0.393) + (g * 0.769) + (b * 0.189);
+    let tg = (r * 0.349) + (g * 0.686) + (b * 0.168);
+    let tb = (r * 0.272) + (g * 0.534) + (b * 0.131);
+    
+    pixels[i] = lerp(r, constrain(tr, 0, 255), amount);
+    pixels[i + 1] = lerp(g, constrain(tg, 0, 255), amount);
+    pixels[i + 2] = lerp(b, constrain(tb, 0, 255), amount);
+    pixels[i + 3] = 255;
+  }
+  updatePixels();
+// @kernel_setup
+  let amount = map(paramA, 0, 1, 0.5, 1.0);
+// @pixel
+    let tr = (r * 0.393) + (g * 0.769) + (b * 0.189);
+    let tg = (r * 0.349) + (g * 0.686) + (b * 0.168);
+    let tb = (r * 0.272) + (g * 0.534) + (b * 0.131);
+    r = lerp(r, constrain(tr, 0, 255), amount);
+    g = lerp(g, constrain(tg, 0, 255), amount);
+    b = lerp(b, constrain(tb, 0, 255), amount);
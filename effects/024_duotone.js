@@ -0,0 +1,30 @@
+// [24] Duotone
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  loadPixels();
+  
+  // Define colors: Deep Purple (Shadows) -> Lime Green (Highlights)
+  let r1 = 50, g1 = 0, b1 = 150;
+  let r2 = 200, g2 = 255, b2 = 50;
+  
+  for (let i = 0; i < video.pixels.length; i += 4) {
+    let bright = (video.pixels[i] + video.pixels[i+1] + video.pixels[i+2]) / 3;
+    let t = bright / 255;
+    
+    pixels[i] = r1 + (r2 - r1) * t;
+    pixels[i + 1] = g1 + (g2 - g1) * t;
+    pixels[i + 2] = b1 + (b2 - b1) * t;
+    pixels[i + 3] = 255;
+  }
+  updatePixels();
+// @kernel_setup
+  let r1 = 50, g1 = 0, b1 = 150;
+  let r2 = 200, g2 = 255, b2 = 50;
+// @pixel
+    let t = (r + g + b) / 3 / 255;
+    r = r1 + (r2 - r1) * t;
+    g = g1 + (g2 - g1) * t;
+    b = b1 + (b2 - b1) * t;
@@ -0,0 +1,88 @@
+// [25] Inverted Luma
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  loadPixels();
+  
+  for (let i = 0; i < video.pixels.length; i += 4) {
+    let r = video.pixels[i] / 255;
+    let g = video.pixels[i + 1] / 255;
+    let b = video.pixels[i + 2] / 255;
+    
+    let max = Math.max(r, g, b), min = Math.min(r, g, b);
+    let h, s, l = (max + min) / 2;
+
+    if(max == min){ h = s = 0; } 
+    else {
+        let d = max - min;
+        s = l > 0.5 ? d / (2 - max - min) : d / (max + min);
+        switch(max){
+            case r: h = (g - b) / d + (g < b ? 6 : 0); break;
+            case g: h = (b - r) / d + 2; break;
+            case b: h = (r - g) / d + 4; break;
+        }
+        h /= 6;
+    }
+    
+    // Invert Lightness
+    l = 1 - l;
+    
+    let r1, g1, b1;
+    if(s === 0){ r1 = g1 = b1 = l; } 
+    else {
+        let hue2rgb = function(p, q, t){
+            if(t < 0) t += 1;
+            if(t > 1) t -= 1;
+            if(t < 1/6) return p + (q - p) * 6 * t;
+            if(t < 1/2) return q;
+            if(t < 2/3) return p + (q - p) * (2/3 - t) * 6;
+            return p;
+        }
+        let q = l < 0.5 ? l * (1 + s) : l + s - l * s;
+        let p = 2 * l - q;
+        r1 = hue2rgb(p, q, h + 1/3);
+        g1 = hue2rgb(p, q, h);
+        b1 = hue2rgb(p, q, h - 1/3);
+    }
+    
+    pixels[i] = r1 * 255;
+    pixels[i + 1] = g1 * 255;
+    pixels[i + 2] = b1 * 255;
+    pixels[i + 3] = 255;
+  }
+  updatePixels();
+// @kernel_setup
+  let hue2rgb = function(p, q, t) {
+    if (t < 0) t += 1;
+    if (t > 1) t -= 1;
+    if (t < 1/6) return p + (q - p) * 6 * t;
+    if (t < 1/2) return q;
+    if (t < 2/3) return p + (q - p) * (2/3 - t) * 6;
+    return p;
+  };
+// @pixel
+    let rN = r / 255, gN = g / 255, bN = b / 255;
+    let max = Math.max(rN, gN, bN), min = Math.min(rN, gN, bN);
+    let hue = 0, s = 0, l = (max + min) / 2;
+    if (max != min) {
+      let d = max - min;
+      s = l > 0.5 ? d / (2 - max - min) : d / (max + min);
+      switch (max) {
+        case rN: hue = (gN - bN) / d + (gN < bN ? 6 : 0); break;
+        case gN: hue = (bN - rN) / d + 2; break;
+        case bN: hue = (rN - gN) / d + 4; break;
+      }
+      hue /= 6;
+    }
+    l = 1 - l;
+    if (s === 0) {
+      r = g = b = l * 255;
+    } else {
+      let q = l < 0.5 ? l * (1 + s) : l + s - l * s;
+      let p = 2 * l - q;
+      r = hue2rgb(p, q, hue + 1/3) * 255;
+      g = hue2rgb(p, q, hue) * 255;
+      b = hue2rgb(p, q, hue - 1/3) * 255;
+    }
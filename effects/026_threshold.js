@@ -0,0 +1,24 @@
+// [26] Threshold
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  loadPixels();
+  
+  // paramA controls the threshold level
+  let thresh = map(paramA, 0, 1, 0, 255);
+  
+  for (let i = 0; i < video.pixels.length; i += 4) {
+    let bright = (video.pixels[i] + video.pixels[i+1] + video.pixels[i+2]) / 3;
+    let val = (bright > thresh) ? 255 : 0;
+    pixels[i] = pixels[i+1] = pixels[i+2] = val;
+    pixels[i+3] = 255;
+  }
+  updatePixels();
+// @kernel_setup
+  let thresh = map(paramA, 0, 1, 0, 255);
+// @pixel
+    r = g = b = ((r + g + b) / 3 > thresh) ? 255 : 0;
+// @glsl
+    color.rgb = vec3((color.r + color.g + color.b) / 3.0 > paramA ? 1.0 : 0.0);
@@ -0,0 +1,30 @@
+// [27] Bit-Crush Color
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  loadPixels();
+  
+  // paramA controls bit depth (1 to 8 bits)
+  let bits = floor(map(paramA, 0, 1, 1, 8));
+  let factor = 255 / (pow(2, bits) - 1);
+  
+  for (let i = 0; i < video.pixels.length; i += 4) {
+    let r = video.pixels[i];
+    let g = video.pixels[i + 1];
+    let b = video.pixels[i + 2];
+    
+    pixels[i] = floor(r / factor) * factor;
+    pixels[i + 1] = floor(g / factor) * factor;
+    pixels[i + 2] = floor(b / factor) * factor;
+    pixels[i + 3] = 255;
+  }
+  updatePixels();
+// @kernel_setup
+  let bits = floor(map(paramA, 0, 1, 1, 8));
+  let factor = 255 / (pow(2, bits) - 1);
+// @pixel
+    r = floor(r / factor) * factor;
+    g = floor(g / factor) * factor;
+    b = floor(b / factor) * factor;
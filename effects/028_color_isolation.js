@@ -0,0 +1,68 @@
+// [28] Color Isolation
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  loadPixels();
+  
+  // paramA controls target hue (0-360)
+  let targetHue = map(paramA, 0, 1, 0, 360);
+  let threshold = 30; // Hue tolerance
+  
+  for (let i = 0; i < video.pixels.length; i += 4) {
+    let r = video.pixels[i];
+    let g = video.pixels[i + 1];
+    let b = video.pixels[i + 2];
+    
+    // Convert RGB to Hue
+    let rN = r/255, gN = g/255, bN = b/255;
+    let max = Math.max(rN, gN, bN), min = Math.min(rN, gN, bN);
+    let h = 0;
+
+    if (max !== min) {
+      let d = max - min;
+      switch(max) {
+        case rN: h = (gN - bN) / d + (gN < bN ? 6 : 0); break;
+        case gN: h = (bN - rN) / d + 2; break;
+        case bN: h = (rN - gN) / d + 4; break;
+      }
+      h *= 60;
+    }
+
+    // Calculate distance handling 360 wrap-around
+    let dist = Math.abs(h - targetHue);
+    if (dist > 180) dist = 360 - dist;
+
+    if (dist < threshold) {
+      pixels[i] = r;
+      pixels[i+1] = g;
+      pixels[i+2] = b;
+    } else {
+      let gray = (r + g + b) / 3;
+      pixels[i] = pixels[i+1] = pixels[i+2] = gray;
+    }
+    pixels[i+3] = 255;
+  }
+  updatePixels();
+// @kernel_setup
+  let targetHue = map(paramA, 0, 1, 0, 360);
+  let threshold = 30;
+// @pixel
+    let rN = r / 255, gN = g / 255, bN = b / 255;
+    let max = Math.max(rN, gN, bN), min = Math.min(rN, gN, bN);
+    let h = 0;
+    if (max !== min) {
+      let d = max - min;
+      switch (max) {
+        case rN: h = (gN - bN) / d + (gN < bN ? 6 : 0); break;
+        case gN: h = (bN - rN) / d + 2; break;
+        case bN: h = (rN - gN) / d + 4; break;
+      }
+      h *= 60;
+    }
+    let hueDist = Math.abs(h - targetHue);
+    if (hueDist > 180) hueDist = 360 - hueDist;
+    if (hueDist >= threshold) {
+      r = g = b = (r + g + b) / 3;
+    }
@@ -0,0 +1,29 @@
+// [29] Luma Keying
+// @global_vars
+// @draw_loop
+
+  clear(); // Clear canvas to transparent
+  video.loadPixels();
+  loadPixels();
+  
+  // paramA controls brightness threshold
+  let thresh = map(paramA, 0, 1, 0, 255);
+  
+  for (let i = 0; i < video.pixels.length; i += 4) {
+    let r = video.pixels[i];
+    let g = video.pixels[i + 1];
+    let b = video.pixels[i + 2];
+    let bright = (r + g + b) / 3;
+    
+    pixels[i] = r;
+    pixels[i+1] = g;
+    pixels[i+2] = b;
+    
+    // If brighter than threshold, make transparent
+    pixels[i+3] = (bright > thresh) ? 0 : 255;
+  }
+  updatePixels();
+// @kernel_setup
+  let thresh = map(paramA, 0, 1, 0, 255);
+// @pixel
+    a = ((r + g + b) / 3 > thresh) ? 0 : 255;
@@ -0,0 +1,39 @@
+// [30] False Color
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  loadPixels();
+  
+  // paramA selects channel permutation (0-5)
+  let mode = floor(map(paramA, 0, 1, 0, 6));
+  
+  for (let i = 0; i < video.pixels.length; i += 4) {
+    let r = video.pixels[i];
+    let g = video.pixels[i + 1];
+    let b = video.pixels[i + 2];
+    
+    let newR = r, newG = g, newB = b;
+    
+    if (mode === 1) { newR = r; newG = b; newB = g; }
+    else if (mode === 2) { newR = g; newG = r; newB = b; }
+    else if (mode === 3) { newR = g; newG = b; newB = r; }
+    else if (mode === 4) { newR = b; newG = r; newB = g; }
+    else if (mode === 5) { newR = b; newG = g; newB = r; }
+    
+    pixels[i] = newR;
+    pixels[i+1] = newG;
+    pixels[i+2] = newB;
+    pixels[i+3] = 255;
+  }
+  updatePixels();
+// @kernel_setup
+  let mode = floor(map(paramA, 0, 1, 0, 6));
+// @pixel
+    let r0 = r, g0 = g, b0 = b;
+    if (mode === 1) { g = b0; b = g0; }
+    else if (mode === 2) { r = g0; g = r0; }
+    else if (mode === 3) { r = g0; g = b0; b = r0; }
+    else if (mode === 4) { r = b0; g = r0; b = g0; }
+    else if (mode === 5) { r = b0; b = r0; }
@@ -0,0 +1,30 @@
+// [31] Contrast Stretch
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  loadPixels();
+  
+  // paramA controls contrast factor (1.0 to 5.0)
+  let contrast = map(paramA, 0, 1, 1, 5);
+  let intercept = 128 * (1 - contrast);
+  
+  for (let i = 0; i < video.pixels.length; i += 4) {
+    let r = video.pixels[i];
+    let g = video.pixels[i+1];
+    let b = video.pixels[i+2];
+    
+    pixels[i] = constrain(r * contrast + intercept, 0, 255);
+    pixels[i+1] = constrain(g * contrast + intercept, 0, 255);
+    pixels[i+2] = constrain(b * contrast + intercept, 0, 255);
+    pixels[i+3] = 255;
+  }
+  updatePixels();
+// @kernel_setup
+  let contrast = map(paramA, 0, 1, 1, 5);
+  let intercept = 128 * (1 - contrast);
+// @pixel
+    r = constrain(r * contrast + intercept, 0, 255);
+    g = constrain(g * contrast + intercept, 0, 255);
+    b = constrain(b * contrast + intercept, 0, 255);
@@ -0,0 +1,28 @@
+// [32] Vignette Blur
+// @global_vars
+// @draw_loop
+
+  background(0);
+  
+  // 1. Draw Blurred Base
+  // paramA controls blur amount
+  let blurAmt = map(paramA, 0, 1, 0, 20);
+  push();
+  drawingContext.filter = `blur(${blurAmt}px)`;
+  image(video, 0, 0);
+  pop();
+  
+  // 2. Draw Sharp Center (Clipped)
+  drawingContext.save();
+  drawingContext.beginPath();
+  drawingContext.arc(width/2, height/2, height/2.5, 0, TWO_PI);
+  drawingContext.clip();
+  image(video, 0, 0);
+  drawingContext.restore();
+  
+  // 3. Vignette Overlay (Dark edges)
+  let grad = drawingContext.createRadialGradient(width/2, height/2, height/3, width/2, height/2, height);
+  grad.addColorStop(0, 'rgba(0,0,0,0)');
+  grad.addColorStop(1, 'rgba(0,0,0,0.8)');
+  drawingContext.fillStyle = grad;
+  rect(0, 0, width, height);
@@ -0,0 +1,22 @@
+// [33] Neon Glow
+// @global_vars
+// @draw_loop
+
+  background(0);
+  
+  // 1. Draw base video (dimmed)
+  tint(100);
+  image(video, 0, 0);
+  noTint();
+  
+  // 2. Draw Bloom
+  // paramA controls bloom intensity via threshold/contrast
+  push();
+  blendMode(SCREEN);
+  let blurAmt = 20;
+  // High contrast filter helps isolate brights
+  drawingContext.filter = `blur(${blurAmt}px) brightness(200%) contrast(150%)`;
+  image(video, 0, 0);
+  pop();
+  
+  blendMode(BLEND);
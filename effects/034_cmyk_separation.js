@@ -0,0 +1,45 @@
+// [34] CMYK Separation
+// @global_vars
+// @draw_loop
+
+  background(255);
+  video.loadPixels();
+  noStroke();
+  blendMode(MULTIPLY);
+  
+  // paramA controls offset
+  let offset = map(paramA, 0, 1, 0, 20);
+  let step = 8; // Grid step for performance
+  
+  for (let y = 0; y < height; y += step) {
+    for (let x = 0; x < width; x += step) {
+      let idx = (x + y * width) * 4;
+      let r = video.pixels[idx];
+      let g = video.pixels[idx+1];
+      let b = video.pixels[idx+2];
+      
+      // CMY approximation (Subtractive)
+      let c = 255 - r;
+      let m = 255 - g;
+      let yel = 255 - b;
+      
+      // Cyan (Red channel blocked)
+      if (c > 50) {
+        fill(0, 255, 255, c); 
+        ellipse(x - offset, y - offset, step, step);
+      }
+      
+      // Magenta (Green channel blocked)
+      if (m > 50) {
+        fill(255, 0, 255, m);
+        ellipse(x + offset, y - offset, step, step);
+      }
+      
+      // Yellow (Blue channel blocked)
+      if (yel > 50) {
+        fill(255, 255, 0, yel);
+        ellipse(x, y + offset, step, step);
+      }
+    }
+  }
+  blendMode(BLEND);
@@ -0,0 +1,48 @@
+// [35] Mirror Symmetry
+// @global_vars
+// @draw_loop
+
+  background(0);
+  
+  // paramA controls mode: <0.5 Vertical Mirror, >0.5 Quad Mirror
+  let quad = paramA > 0.5;
+  let hw = width / 2;
+  let hh = height / 2;
+  
+  if (!quad) {
+    // Vertical Mirror (Left side reflected to Right)
+    // Draw Left
+    image(video, 0, 0, hw, height, 0, 0, hw, height);
+    
+    // Draw Right (Mirrored)
+    push();
+    translate(width, 0);
+    scale(-1, 1);
+    image(video, 0, 0, hw, height, 0, 0, hw, height);
+    pop();
+  } else {
+    // Quad Mirror (Top-Left reflected to all quadrants)
+    // TL
+    image(video, 0, 0, hw, hh, 0, 0, hw, hh);
+    
+    // TR
+    push();
+    translate(width, 0);
+    scale(-1, 1);
+    image(video, 0, 0, hw, hh, 0, 0, hw, hh);
+    pop();
+    
+    // BL
+    push();
+    translate(0, height);
+    scale(1, -1);
+    image(video, 0, 0, hw, hh, 0, 0, hw, hh);
+    pop();
+    
+    // BR
+    push();
+    translate(width, height);
+    scale(-1, -1);
+    image(video, 0, 0, hw, hh, 0, 0, hw, hh);
+    pop();
+  }
@@ -0,0 +1,32 @@
+// [36] Fish-Eye Lens
+// @global_vars
+
+// The lens mapping only changes with paramA, so it is cached as a remap table
+const fishEye = createRemap({
+  build: (w, h, a) => {
+    let cx = w / 2;
+    let cy = h / 2;
+    // paramA controls distortion strength
+    let k = map(a, 0, 1, 0.0, 0.00005);
+    return (x, y, out) => {
+      let dx = x - cx;
+      let dy = y - cy;
+      let r2 = dx*dx + dy*dy;
+
+      // Barrel distortion mapping
+      let f = 1 + k * r2;
+      out[0] = cx + dx * f;
+      out[1] = cy + dy * f;
+      return true;
+    };
+  }
+});
+// @draw_loop
+
+  fishEye.apply(grabFrame().rgba, outputFrame().rgba, width, height, paramA);
+  presentFrame();
+// @glsl
+    vec2 center = resolution / 2.0;
+    float k = map(paramA, 0.0, 1.0, 0.0, 0.00005);
+    vec2 d = xy - center;
+    color = sampleVideo(center + d * (1.0 + k * dot(d, d)));
@@ -0,0 +1,35 @@
+// [37] Pinch Distortion
+// @global_vars
+
+// Center of pinch is mouse position (paramA, paramB). The LRU of remap
+// tables keeps recently visited positions, so only new ones cost a rebuild.
+const pinch = createRemap({
+  bins: 128,
+  params: 2,
+  build: (w, h, a, b) => {
+    let cx = a * w;
+    let cy = b * h;
+    let radius = 200;
+    return (x, y, out) => {
+      let dx = x - cx;
+      let dy = y - cy;
+      let dist = sqrt(dx*dx + dy*dy);
+
+      out[0] = x;
+      out[1] = y;
+
+      if (dist < radius) {
+        // Non-linear pinch
+        let amount = 1 - sin((dist / radius) * HALF_PI);
+        let distortion = amount * 0.5; // Strength
+        out[0] = cx + dx / (1 - distortion);
+        out[1] = cy + dy / (1 - distortion);
+      }
+      return true;
+    };
+  }
+});
+// @draw_loop
+
+  pinch.apply(grabFrame().rgba, outputFrame().rgba, width, height, paramA, paramB);
+  presentFrame();
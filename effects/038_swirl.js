@@ -0,0 +1,49 @@
+// [38] Swirl
+// @global_vars
+
+// The twist only changes with paramA, so it is cached as a remap table
+const swirl = createRemap({
+  build: (w, h, a) => {
+    let cx = w / 2;
+    let cy = h / 2;
+    // paramA controls twist amount
+    let maxAngle = map(a, 0, 1, 0, TWO_PI * 2);
+    let radius = min(w, h) / 1.5;
+    return (x, y, out) => {
+      let dx = x - cx;
+      let dy = y - cy;
+      let dist = sqrt(dx*dx + dy*dy);
+
+      out[0] = x;
+      out[1] = y;
+
+      if (dist < radius) {
+        let percent = (radius - dist) / radius;
+        let theta = percent * percent * maxAngle;
+
+        // Rotate coordinate system
+        let s_dx = dx * cos(theta) - dy * sin(theta);
+        let s_dy = dx * sin(theta) + dy * cos(theta);
+        out[0] = cx + s_dx;
+        out[1] = cy + s_dy;
+      }
+      return true;
+    };
+  }
+});
+// @draw_loop
+
+  swirl.apply(grabFrame().rgba, outputFrame().rgba, width, height, paramA);
+  presentFrame();
+// @glsl
+    vec2 center = resolution / 2.0;
+    float maxAngle = map(paramA, 0.0, 1.0, 0.0, TWO_PI * 2.0);
+    float radius = min(resolution.x, resolution.y) / 1.5;
+    vec2 d = xy - center;
+    float dist = length(d);
+    if (dist < radius) {
+      float percent = (radius - dist) / radius;
+      float theta = percent * percent * maxAngle;
+      float c = cos(theta), s = sin(theta);
+      color = sampleVideo(center + vec2(d.x * c - d.y * s, d.x * s + d.y * c));
+    }
@@ -0,0 +1,37 @@
+// [39] Sine Wave Ripple
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  loadPixels();
+  
+  // paramA controls frequency
+  let freq = map(paramA, 0, 1, 0.02, 0.2);
+  // paramB controls amplitude
+  let amp = map(paramB, 0, 1, 0, 100);
+  let time = frameCount * 0.1;
+  
+  for (let y = 0; y < height; y++) {
+    // Calculate horizontal offset
+    let offset = sin(y * freq + time) * amp;
+    
+    for (let x = 0; x < width; x++) {
+      let srcX = floor(x + offset);
+      srcX = constrain(srcX, 0, width - 1);
+      
+      let destIdx = (x + y * width) * 4;
+      let srcIdx = (srcX + y * width) * 4;
+      
+      pixels[destIdx] = video.pixels[srcIdx];
+      pixels[destIdx+1] = video.pixels[srcIdx+1];
+      pixels[destIdx+2] = video.pixels[srcIdx+2];
+      pixels[destIdx+3] = 255;
+    }
+  }
+  updatePixels();
+// @glsl
+    float freq = map(paramA, 0.0, 1.0, 0.02, 0.2);
+    float amp = map(paramB, 0.0, 1.0, 0.0, 100.0);
+    float offset = sin(xy.y * freq + frameCount * 0.1) * amp;
+    color = sampleVideo(vec2(clamp(floor(xy.x + offset), 0.0, resolution.x - 1.0), xy.y));
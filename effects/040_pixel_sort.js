@@ -0,0 +1,38 @@
+// [40] Pixel Sort
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  loadPixels();
+  
+  // Sort every row based on brightness
+  // paramA controls sort direction (Left-to-Right or Right-to-Left)
+  let asc = paramA > 0.5;
+  
+  for (let y = 0; y < height; y++) {
+    // Extract row
+    let row = [];
+    for (let x = 0; x < width; x++) {
+      let idx = (x + y * width) * 4;
+      let r = video.pixels[idx];
+      let g = video.pixels[idx+1];
+      let b = video.pixels[idx+2];
+      let bright = (r + g + b) / 3;
+      row.push({r, g, b, bright});
+    }
+    
+    // Sort
+    if (asc) row.sort((a, b) => a.bright - b.bright);
+    else row.sort((a, b) => b.bright - a.bright);
+    
+    // Put back
+    for (let x = 0; x < width; x++) {
+      let idx = (x + y * width) * 4;
+      pixels[idx] = row[x].r;
+      pixels[idx+1] = row[x].g;
+      pixels[idx+2] = row[x].b;
+      pixels[idx+3] = 255;
+    }
+  }
+  updatePixels();
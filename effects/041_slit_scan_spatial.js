@@ -0,0 +1,41 @@
+// [41] Slit-Scan (Spatial)
+// @global_vars
+let slitHistory = [];
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  
+  // Get center column
+  let centerX = floor(width / 2);
+  let col = [];
+  for (let y = 0; y < height; y++) {
+    let idx = (centerX + y * width) * 4;
+    col.push([video.pixels[idx], video.pixels[idx+1], video.pixels[idx+2]]);
+  }
+  
+  // Add to history (Newest at index 0)
+  slitHistory.unshift(col);
+  if (slitHistory.length > width / 2) slitHistory.pop();
+  
+  loadPixels();
+  
+  // Draw history radiating outwards
+  for (let i = 0; i < slitHistory.length; i++) {
+    let c = slitHistory[i];
+    let leftX = centerX - i;
+    let rightX = centerX + i;
+    
+    for (let y = 0; y < height; y++) {
+      let color = c[y];
+      if (leftX >= 0) {
+        let idx = (leftX + y * width) * 4;
+        pixels[idx] = color[0]; pixels[idx+1] = color[1]; pixels[idx+2] = color[2]; pixels[idx+3] = 255;
+      }
+      if (rightX < width) {
+        let idx = (rightX + y * width) * 4;
+        pixels[idx] = color[0]; pixels[idx+1] = color[1]; pixels[idx+2] = color[2]; pixels[idx+3] = 255;
+      }
+    }
+  }
+  updatePixels();
@@ -0,0 +1,46 @@
+// [42] Broken Glass
+// @global_vars
+let glassSeeds = []; let glassMap = null;
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  loadPixels();
+  
+  let numSeeds = floor(map(paramA, 0, 1, 10, 50));
+  
+  // Regenerate map if needed
+  if (glassSeeds.length !== numSeeds || !glassMap) {
+    glassSeeds = [];
+    for (let i = 0; i < numSeeds; i++) {
+      glassSeeds.push({ x: random(width), y: random(height), offsetX: random(-30, 30), offsetY: random(-30, 30) });
+    }
+    glassMap = new Int8Array(width * height);
+    for (let y = 0; y < height; y++) {
+      for (let x = 0; x < width; x++) {
+        let minDist = Infinity, idx = 0;
+        for (let i = 0; i < numSeeds; i++) {
+          let d = (x - glassSeeds[i].x)**2 + (y - glassSeeds[i].y)**2;
+          if (d < minDist) { minDist = d; idx = i; }
+        }
+        glassMap[x + y * width] = idx;
+      }
+    }
+  }
+  
+  for (let y = 0; y < height; y++) {
+    for (let x = 0; x < width; x++) {
+      let s = glassSeeds[glassMap[x + y * width]];
+      let sx = constrain(floor(x + s.offsetX), 0, width - 1);
+      let sy = constrain(floor(y + s.offsetY), 0, height - 1);
+      
+      let destIdx = (x + y * width) * 4;
+      let srcIdx = (sx + sy * width) * 4;
+      
+      pixels[destIdx] = video.pixels[srcIdx];
+      pixels[destIdx+1] = video.pixels[srcIdx+1];
+      pixels[destIdx+2] = video.pixels[srcIdx+2];
+      pixels[destIdx+3] = 255;
+    }
+  }
+  updatePixels();
@@ -0,0 +1,36 @@
+// [43] Scanline Displacement
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  loadPixels();
+  
+  // paramA controls shift amount
+  let shift = floor(map(paramA, 0, 1, 0, 50));
+  
+  for (let y = 0; y < height; y++) {
+    // Determine shift direction based on row parity
+    let xOffset = (y % 2 === 0) ? shift : -shift;
+    
+    for (let x = 0; x < width; x++) {
+      let srcX = x - xOffset;
+      
+      // Wrap around
+      if (srcX < 0) srcX += width;
+      if (srcX >= width) srcX -= width;
+      
+      let destIdx = (x + y * width) * 4;
+      let srcIdx = (srcX + y * width) * 4;
+      
+      pixels[destIdx] = video.pixels[srcIdx];
+      pixels[destIdx+1] = video.pixels[srcIdx+1];
+      pixels[destIdx+2] = video.pixels[srcIdx+2];
+      pixels[destIdx+3] = 255;
+    }
+  }
+  updatePixels();
+// @glsl
+    float shift = floor(map(paramA, 0.0, 1.0, 0.0, 50.0));
+    float xOffset = mod(xy.y, 2.0) == 0.0 ? shift : -shift;
+    color = sampleVideo(vec2(mod(xy.x - xOffset, resolution.x), xy.y));
@@ -0,0 +1,32 @@
+// [44] Polar Coordinates
+// @global_vars
+
+// The polar mapping only changes with paramA, so it is cached as a remap table
+const polar = createRemap({
+  build: (w, h, a) => {
+    let cx = w / 2;
+    let cy = h / 2;
+    let maxRadius = dist(0, 0, cx, cy);
+    // paramA controls zoom/radius mapping
+    let zoom = map(a, 0, 1, 0.5, 2.0);
+    return (x, y, out) => {
+      let dx = x - cx;
+      let dy = y - cy;
+      let angle = atan2(dy, dx); // -PI to PI
+      let r = sqrt(dx*dx + dy*dy);
+
+      if (r >= maxRadius) return false;
+
+      // Map angle to X, radius to Y
+      let srcX = map(angle, -PI, PI, 0, w);
+      let srcY = map(r, 0, maxRadius / zoom, 0, h);
+      out[0] = (srcX + w) % w;
+      out[1] = constrain(srcY, 0, h - 1);
+      return true;
+    };
+  }
+});
+// @draw_loop
+
+  polar.apply(grabFrame().rgba, outputFrame().rgba, width, height, paramA);
+  presentFrame();
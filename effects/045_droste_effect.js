@@ -0,0 +1,22 @@
+// [45] Droste Effect
+// @global_vars
+// @draw_loop
+
+  background(0);
+  
+  // paramA controls scale decay (0.5 to 0.9)
+  let scaleFactor = map(paramA, 0, 1, 0.5, 0.9);
+  let depth = 10;
+  
+  imageMode(CENTER);
+  translate(width / 2, height / 2);
+  
+  let w = width;
+  let h = height;
+  
+  // Draw from outside in
+  for (let i = 0; i < depth; i++) {
+    image(video, 0, 0, w, h);
+    w *= scaleFactor;
+    h *= scaleFactor;
+  }
@@ -0,0 +1,34 @@
+// [46] Tile Scramble
+// @global_vars
+let tileIndices = [];
+// @draw_loop
+
+  background(0);
+  
+  // paramA controls grid size (2 to 10)
+  let tiles = floor(map(paramA, 0, 1, 2, 10));
+  let tileW = width / tiles;
+  let tileH = height / tiles;
+  
+  // Initialize or reset permutation if grid size changes
+  if (tileIndices.length !== tiles * tiles) {
+    tileIndices = [];
+    for (let i = 0; i < tiles * tiles; i++) tileIndices.push(i);
+    // Shuffle
+    for (let i = tileIndices.length - 1; i > 0; i--) {
+      const j = floor(random(i + 1));
+      [tileIndices[i], tileIndices[j]] = [tileIndices[j], tileIndices[i]];
+    }
+  }
+  
+  for (let y = 0; y < tiles; y++) {
+    for (let x = 0; x < tiles; x++) {
+      let idx = tileIndices[x + y * tiles];
+      let sx = (idx % tiles) * tileW;
+      let sy = floor(idx / tiles) * tileH;
+      
+      // Use image() instead of copy() for better compatibility with video elements
+      // image(img, dx, dy, dWidth, dHeight, sx, sy, sWidth, sHeight)
+      image(video, x * tileW, y * tileH, tileW, tileH, sx, sy, tileW, tileH);
+    }
+  }
@@ -0,0 +1,27 @@
+// [47] Barrel Distortion
+// @global_vars
+
+// The distortion only changes with paramA, so it is cached as a remap table
+const barrel = createRemap({
+  build: (w, h, a) => {
+    let cx = w / 2;
+    let cy = h / 2;
+    // paramA controls distortion strength
+    let k = map(a, 0, 1, 0.0, 0.0001);
+    return (x, y, out) => {
+      let dx = x - cx;
+      let dy = y - cy;
+      let r2 = dx*dx + dy*dy;
+
+      // Barrel distortion: pull pixels from further out
+      let f = 1 + k * r2;
+      out[0] = cx + dx * f;
+      out[1] = cy + dy * f;
+      return true;
+    };
+  }
+});
+// @draw_loop
+
+  barrel.apply(grabFrame().rgba, outputFrame().rgba, width, height, paramA);
+  presentFrame();
@@ -0,0 +1,33 @@
+// [48] Liquid Displacement
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  loadPixels();
+  
+  // paramA controls noise scale
+  let scale = map(paramA, 0, 1, 0.002, 0.01);
+  // paramB controls displacement magnitude
+  let mag = map(paramB, 0, 1, 0, 100);
+  let time = frameCount * 0.01;
+  
+  for (let y = 0; y < height; y++) {
+    for (let x = 0; x < width; x++) {
+      let angle = noise(x * scale, y * scale, time) * TWO_PI * 2;
+      let sx = floor(x + cos(angle) * mag);
+      let sy = floor(y + sin(angle) * mag);
+      
+      sx = constrain(sx, 0, width - 1);
+      sy = constrain(sy, 0, height - 1);
+      
+      let destIdx = (x + y * width) * 4;
+      let srcIdx = (sx + sy * width) * 4;
+      
+      pixels[destIdx] = video.pixels[srcIdx];
+      pixels[destIdx+1] = video.pixels[srcIdx+1];
+      pixels[destIdx+2] = video.pixels[srcIdx+2];
+      pixels[destIdx+3] = 255;
+    }
+  }
+  updatePixels();
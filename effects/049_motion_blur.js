@@ -0,0 +1,46 @@
+// [49] Motion Blur
+// @global_vars
+// paramA sets the trail, 2 up to ?trail=N frames (default 120). Either way a
+// frame costs one blend into an accumulation buffer, however long the trail:
+//   ?blur=decay   each frame is laid over the buffer at 1/n opacity, the
+//                 weights the old tint(255, 255 / n) stack gave (the default)
+//   ?blur=box     the plain mean of the last n frames, as running sums
+const mbSettings = new URLSearchParams(location.search);
+const MB_MODE = mbSettings.get('blur') === 'box' ? 'box' : 'decay';
+const MB_TRAIL = Math.min(Math.max(parseInt(mbSettings.get('trail'), 10) || 120, 2), 65535);
+const mbWindow = MB_MODE === 'box' ? createFrameSum({ frames: MB_TRAIL, maxBytes: 256 << 20, format: 'rgb' }) : null;
+let mbBuffer = null; // decay: Float32 RGB
+// @draw_loop
+
+  // paramA controls trail length (2 to MB_TRAIL)
+  let n = floor(map(paramA, 0, 1, 2, MB_TRAIL));
+  const out = outputFrame().rgba;
+
+  if (MB_MODE === 'box') {
+    const sum = mbWindow.push(n);
+    let count = mbWindow.count;
+    for (let i = 0, j = 0; i < out.length; i += 4, j += 3) {
+      out[i] = sum[j] / count;
+      out[i + 1] = sum[j + 1] / count;
+      out[i + 2] = sum[j + 2] / count;
+      out[i + 3] = 255;
+    }
+  } else {
+    const src = grabFrame().rgba;
+    if (!mbBuffer || mbBuffer.length !== width * height * 3) {
+      mbBuffer = new Float32Array(width * height * 3);
+      for (let i = 0, j = 0; i < src.length; i += 4, j += 3) {
+        mbBuffer[j] = src[i];
+        mbBuffer[j + 1] = src[i + 1];
+        mbBuffer[j + 2] = src[i + 2];
+      }
+    }
+    let alpha = 1 / n;
+    for (let i = 0, j = 0; i < out.length; i += 4, j += 3) {
+      out[i] = mbBuffer[j] += (src[i] - mbBuffer[j]) * alpha;
+      out[i + 1] = mbBuffer[j + 1] += (src[i + 1] - mbBuffer[j + 1]) * alpha;
+      out[i + 2] = mbBuffer[j + 2] += (src[i + 2] - mbBuffer[j + 2]) * alpha;
+      out[i + 3] = 255;
+    }
+  }
+  presentFrame();
@@ -0,0 +1,18 @@
+// [50] Ghosting / Trails
+// @global_vars
+// @draw_loop
+
+  // No background() call to preserve previous frames
+  
+  // paramA controls fade speed (alpha of black overlay)
+  // Lower alpha = longer trails
+  let fade = map(paramA, 0, 1, 5, 50);
+  
+  noStroke();
+  fill(0, fade);
+  rect(0, 0, width, height);
+  
+  // Draw current video with transparency to blend with history
+  tint(255, 150);
+  image(video, 0, 0);
+  noTint();
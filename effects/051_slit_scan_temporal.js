@@ -0,0 +1,32 @@
+// [51] Slit-Scan (Temporal)
+// @global_vars
+let tScanY = 0; let tFrozen;
+// @draw_loop
+
+  if (!tFrozen || tFrozen.width !== width || tFrozen.height !== height) {
+    tFrozen = createGraphics(width, height);
+    tFrozen.clear();
+  }
+  
+  // Draw live video background (bottom part)
+  image(video, 0, 0);
+  
+  // paramA controls scan speed
+  let speed = floor(map(paramA, 0, 1, 1, 10));
+  
+  // Copy strip from video to frozen buffer
+  tFrozen.copy(video, 0, tScanY, width, speed, 0, tScanY, width, speed);
+  
+  // Draw frozen part on top
+  image(tFrozen, 0, 0);
+  
+  // Draw scanline indicator
+  stroke(0, 255, 0);
+  strokeWeight(2);
+  line(0, tScanY + speed, width, tScanY + speed);
+  
+  tScanY += speed;
+  if (tScanY >= height) {
+    tScanY = 0;
+    tFrozen.clear();
+  }
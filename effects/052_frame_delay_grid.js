@@ -0,0 +1,59 @@
+// [52] Frame Delay Grid
+// @global_vars
+// History is kept at cell size, in a ring just long enough for the oldest
+// cell, so its memory follows the pixels on screen rather than the frames.
+//   ?step=N        frames of delay between neighbouring cells (default 15)
+//   ?delays=a,b,.. each cell's delay in reading order; cells past the list
+//                  continue from its last delay in steps of N
+const fdSettings = new URLSearchParams(location.search);
+const fdStep = parseInt(fdSettings.get('step'), 10);
+const FD_DELAY_STEP = Number.isNaN(fdStep) ? 15 : Math.max(fdStep, 0); // Frames delay per cell
+const FD_DELAYS = (fdSettings.get('delays') || '').split(',').filter((value) => value.trim() !== '')
+  .map((value) => Math.max(Math.floor(Number(value)) || 0, 0));
+let fdGrid = 0;
+let fdHistory = null;
+let fdDelays = null;
+
+function fdCellDelays(cells) {
+  const delays = [];
+  for (let k = 0; k < cells; k++) {
+    if (k < FD_DELAYS.length) delays.push(FD_DELAYS[k]);
+    else if (FD_DELAYS.length) delays.push(FD_DELAYS[FD_DELAYS.length - 1] + (k - FD_DELAYS.length + 1) * FD_DELAY_STEP);
+    else delays.push(k * FD_DELAY_STEP);
+  }
+  return delays;
+}
+// @draw_loop
+
+  // paramA controls grid size (2 to 5)
+  let grid = floor(map(paramA, 0, 1, 2, 5));
+  if (grid !== fdGrid) {
+    fdGrid = grid;
+    fdDelays = fdCellDelays(grid * grid);
+    fdHistory = createFrameRing({ frames: Math.max(...fdDelays) + 1, scale: 1 / grid, maxBytes: 64 << 20 });
+  }
+  fdHistory.push();
+  
+  const out = outputFrame().rgba32;
+  out.fill(0xff000000);
+  let cellW = fdHistory.width;
+  
+  for (let y = 0; y < grid; y++) {
+    for (let x = 0; x < grid; x++) {
+      let cellIdx = x + y * grid;
+      // Cell 0 is newest, Cell N is oldest (by default)
+      let age = fdDelays[cellIdx];
+      if (age >= fdHistory.length) continue;
+      
+      const frame = fdHistory.get32(age);
+      // Stored cells are round(width / grid) wide, so clip each to its span
+      let left = floor(x * width / grid);
+      let top = floor(y * height / grid);
+      let rowW = min(cellW, floor((x + 1) * width / grid) - left);
+      let rows = min(fdHistory.height, floor((y + 1) * height / grid) - top);
+      for (let row = 0; row < rows; row++) {
+        out.set(frame.subarray(row * cellW, row * cellW + rowW), (top + row) * width + left);
+      }
+    }
+  }
+  presentFrame();
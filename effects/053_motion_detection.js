@@ -0,0 +1,41 @@
+// [53] Motion Detection
+// @global_vars
+let prevFrame;
+// @draw_loop
+
+  if (!prevFrame || prevFrame.width !== width) {
+    prevFrame = createGraphics(width, height);
+    prevFrame.pixelDensity(1);
+  }
+  
+  video.loadPixels();
+  prevFrame.loadPixels();
+  loadPixels();
+  
+  // paramA controls threshold
+  let thresh = map(paramA, 0, 1, 10, 100);
+  
+  if (video.pixels.length > 0 && prevFrame.pixels.length === video.pixels.length) {
+    for (let i = 0; i < video.pixels.length; i += 4) {
+      let r = video.pixels[i];
+      let g = video.pixels[i+1];
+      let b = video.pixels[i+2];
+      
+      let pr = prevFrame.pixels[i];
+      let pg = prevFrame.pixels[i+1];
+      let pb = prevFrame.pixels[i+2];
+      
+      let diff = abs(r - pr) + abs(g - pg) + abs(b - pb);
+      
+      if (diff > thresh) {
+        pixels[i] = 255; pixels[i+1] = 255; pixels[i+2] = 255;
+      } else {
+        pixels[i] = 0; pixels[i+1] = 0; pixels[i+2] = 0;
+      }
+      pixels[i+3] = 255;
+    }
+    updatePixels();
+  }
+  
+  // Save current frame
+  prevFrame.image(video, 0, 0, width, height);
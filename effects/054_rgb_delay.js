@@ -0,0 +1,45 @@
+// [54] RGB Delay
+// @global_vars
+// Each channel shows the camera some frames ago: ?delay=r,g,b (default 0,5,10).
+// Only delayed channels keep history, one byte per pixel in a delay line just
+// long enough for their delay. Fractional delays (?delay=0,2.5,60) blend the
+// two frames either side.
+const RGB_DELAYS = (new URLSearchParams(location.search).get('delay') || '0,5,10')
+  .split(',').concat(['0', '0', '0']).slice(0, 3)
+  .map((value) => Math.min(Math.max(Number(value) || 0, 0), 600));
+const rgbLines = RGB_DELAYS.map((delay, c) => delay > 0
+  ? createFrameRing({ frames: Math.ceil(delay) + 1, maxBytes: 64 << 20, format: 'rgb'[c] })
+  : null);
+const RGB_WARMUP = Math.ceil(Math.max(...RGB_DELAYS)); // frames before every line is full
+let rgbFrames = 0;
+// @draw_loop
+
+  // Store current frame
+  const frame = grabFrame();
+  for (const line of rgbLines) if (line) line.push(frame);
+  rgbFrames = rgbLines.some((line) => line && line.length === 1) ? 1 : rgbFrames + 1;
+
+  if (rgbFrames > RGB_WARMUP) {
+    const src = frame.rgba;
+    const out = outputFrame().rgba;
+    for (let c = 0; c < 3; c++) {
+      const line = rgbLines[c];
+      if (!line) {
+        for (let i = c; i < out.length; i += 4) out[i] = src[i]; // instant
+        continue;
+      }
+      const delay = RGB_DELAYS[c], age = Math.floor(delay), t = delay - age;
+      const newer = line.get(age);
+      if (t === 0) {
+        for (let p = 0, i = c; i < out.length; p++, i += 4) out[i] = newer[p];
+      } else {
+        const older = line.get(age + 1);
+        for (let p = 0, i = c; i < out.length; p++, i += 4) out[i] = newer[p] + (older[p] - newer[p]) * t;
+      }
+    }
+    for (let i = 3; i < out.length; i += 4) out[i] = 255;
+    presentFrame();
+  } else {
+    background(0);
+    image(video, 0, 0);
+  }
@@ -0,0 +1,31 @@
+// [55] Video Feedback
+// @global_vars
+// @draw_loop
+
+  // Capture the canvas before clearing
+  let prev = get();
+  
+  background(0);
+  
+  push();
+  imageMode(CENTER);
+  translate(width/2, height/2);
+  
+  // paramA controls zoom (1.0 to 1.2)
+  let zoom = map(paramA, 0, 1, 1.0, 1.2);
+  // paramB controls rotation
+  let rot = map(paramB, 0, 1, -0.1, 0.1);
+  
+  scale(zoom);
+  rotate(rot);
+  
+  // Draw previous frame with slight transparency to create decay
+  tint(255, 240);
+  image(prev, 0, 0);
+  pop();
+  
+  // Draw new video frame on top with blend
+  blendMode(SCREEN);
+  tint(255, 150);
+  image(video, 0, 0);
+  blendMode(BLEND);
@@ -0,0 +1,61 @@
+// [56] Pixel Accumulation
+// @global_vars
+let sandPg; let sandPile = []; let activeSand = [];
+// @draw_loop
+
+  if (!sandPg || sandPg.width !== width) {
+    sandPg = createGraphics(width, height);
+    sandPg.clear();
+    sandPile = new Array(width).fill(height);
+  }
+  
+  background(0);
+  
+  // Spawn sand from dark pixels
+  video.loadPixels();
+  let spawnRate = 50;
+  for(let i=0; i<spawnRate; i++) {
+    let x = floor(random(width));
+    let y = floor(random(height));
+    let idx = (x + y * width) * 4;
+    let b = (video.pixels[idx] + video.pixels[idx+1] + video.pixels[idx+2])/3;
+    
+    // paramA controls brightness threshold
+    let thresh = map(paramA, 0, 1, 50, 150);
+    
+    if (b < thresh) {
+      activeSand.push({
+        x: x, 
+        y: y, 
+        c: [video.pixels[idx], video.pixels[idx+1], video.pixels[idx+2]]
+      });
+    }
+  }
+  
+  // Update physics
+  for (let i = activeSand.length - 1; i >= 0; i--) {
+    let s = activeSand[i];
+    s.y += 5; // Gravity
+    
+    let floorY = sandPile[s.x];
+    if (s.y >= floorY) {
+      s.y = floorY;
+      sandPile[s.x] -= 2; // Pile grows
+      
+      // Draw to persistent buffer
+      sandPg.noStroke();
+      sandPg.fill(s.c[0], s.c[1], s.c[2]);
+      sandPg.rect(s.x, s.y, 2, 2);
+      
+      activeSand.splice(i, 1);
+    }
+  }
+  
+  // Draw buffer and active sand
+  image(sandPg, 0, 0);
+  
+  noStroke();
+  for (let s of activeSand) {
+    fill(s.c[0], s.c[1], s.c[2]);
+    rect(s.x, s.y, 2, 2);
+  }
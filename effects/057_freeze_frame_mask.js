@@ -0,0 +1,51 @@
+// [57] Freeze Frame Mask
+// @global_vars
+let ffBuffer; let ffPrev;
+// @draw_loop
+
+  if (!ffPrev || ffPrev.width !== width) {
+    ffPrev = createGraphics(width, height);
+    ffPrev.pixelDensity(1);
+    ffPrev.image(video, 0, 0, width, height);
+  }
+  
+  if (!ffBuffer || ffBuffer.width !== width) {
+    ffBuffer = createGraphics(width, height);
+    ffBuffer.pixelDensity(1);
+    ffBuffer.image(video, 0, 0, width, height);
+  }
+
+  video.loadPixels();
+  ffPrev.loadPixels();
+  ffBuffer.loadPixels();
+  
+  // paramA controls sensitivity
+  let thresh = map(paramA, 0, 1, 10, 100);
+  
+  if (video.pixels.length > 0 && ffPrev.pixels.length === video.pixels.length) {
+    for (let i = 0; i < video.pixels.length; i += 4) {
+      let r = video.pixels[i];
+      let g = video.pixels[i+1];
+      let b = video.pixels[i+2];
+      
+      let pr = ffPrev.pixels[i];
+      let pg = ffPrev.pixels[i+1];
+      let pb = ffPrev.pixels[i+2];
+      
+      let diff = abs(r - pr) + abs(g - pg) + abs(b - pb);
+      
+      // If motion detected, update buffer with NEW video pixel
+      if (diff > thresh) {
+         ffBuffer.pixels[i] = r;
+         ffBuffer.pixels[i+1] = g;
+         ffBuffer.pixels[i+2] = b;
+         ffBuffer.pixels[i+3] = 255;
+      }
+    }
+    ffBuffer.updatePixels();
+  }
+  
+  image(ffBuffer, 0, 0);
+  
+  // Update previous frame
+  ffPrev.image(video, 0, 0, width, height);
@@ -0,0 +1,104 @@
+// [58] Time Displacement Map
+// @global_vars
+// Every pixel shows the past frame its delay map points at: a radial
+// gradient by default, with the centre oldest (newest once paramA > 0.5).
+// The map is turned into a per-pixel age table whenever the size, the number
+// of frames held or the flip changes, so a frame costs one gather.
+//   ?delaymap=luma      the live frame's brightness is the delay
+//   ?delaymap=<image>   a grayscale image next to the sketch is the delay
+//   ?window=N           frames of delay (default 50)
+// History is packed RGB and held to TD_BUDGET: when the window doesn't fit,
+// its frames are kept at a lower resolution (about 770x580 for the default
+// window on a 1000x750 canvas).
+const tdSettings = new URLSearchParams(location.search);
+const TD_WINDOW = Math.min(Math.max(parseInt(tdSettings.get('window'), 10) || 50, 2), 65535);
+const TD_MAP = tdSettings.get('delaymap') || 'radial';
+const TD_BUDGET = 64 << 20;
+const tdHistory = createFrameRing({ frames: TD_WINDOW, maxBytes: TD_BUDGET, format: 'rgb', keepFrames: true });
+const tdBase = new Int32Array(TD_WINDOW); // first byte of the frame of each age in tdHistory.data
+let tdImage = null;
+let tdDepth = null; // 0 (centre / black) .. 1 per pixel, for the radial and image maps
+let tdAge = null;
+let tdSource = null; // history pixel under each canvas pixel, when history is smaller
+let tdShape = '';
+let tdAgeKey = '';
+
+function tdPrepare() {
+  // Everything that only changes with the canvas or history size
+  const shape = [width, height, tdHistory.width, tdHistory.height].join();
+  if (shape === tdShape) return;
+  tdShape = shape;
+  tdAgeKey = '';
+  tdAge = new Uint16Array(width * height);
+  tdSource = tdHistory.pixelMap(width, height);
+  if (TD_MAP === 'luma') return;
+  tdDepth = new Float64Array(width * height);
+  if (tdImage) {
+    const map = tdImage.get();
+    map.resize(width, height);
+    map.loadPixels();
+    for (let p = 0, i = 0; p < tdDepth.length; p++, i += 4) tdDepth[p] = (map.pixels[i] + map.pixels[i + 1] + map.pixels[i + 2]) / 765;
+  } else {
+    const cx = width / 2, cy = height / 2;
+    const maxD = dist(0, 0, cx, cy);
+    for (let y = 0, p = 0; y < height; y++) {
+      for (let x = 0; x < width; x++, p++) tdDepth[p] = dist(x, y, cx, cy) / maxD;
+    }
+  }
+}
+
+function tdAges(count, flip) {
+  // delay 0 is the oldest frame held, count - 1 the newest
+  const key = count + ':' + flip;
+  if (key === tdAgeKey) return tdAge;
+  tdAgeKey = key;
+  for (let p = 0; p < tdAge.length; p++) {
+    const delay = Math.min(Math.floor(tdDepth[p] * (count - 1)), count - 1);
+    tdAge[p] = flip ? delay : count - 1 - delay;
+  }
+  return tdAge;
+}
+// @preload
+  if (TD_MAP !== 'radial' && TD_MAP !== 'luma') {
+    tdImage = loadImage(TD_MAP, undefined, () => {
+      // p5 still returns a placeholder image, which would read as all black
+      tdImage = null;
+      console.warn(`Time Displacement Map: could not load ${TD_MAP}, using the radial map`);
+    });
+  }
+// @draw_loop
+
+  tdHistory.push();
+  tdPrepare();
+  let count = tdHistory.length;
+  let flip = paramA > 0.5; // paramA flips the pattern
+
+  let frameSize = tdHistory.width * tdHistory.height * 3;
+  for (let age = 0; age < count; age++) tdBase[age] = tdHistory.index(age) * frameSize;
+
+  const frames = tdHistory.data;
+  const out = outputFrame().rgba;
+  if (TD_MAP === 'luma') {
+    // Brighter is older (newer when flipped), recomputed every frame
+    const luma = featureLuma();
+    let scale = (count - 1) / 255;
+    for (let p = 0, i = 0; i < out.length; p++, i += 4) {
+      let delay = Math.floor(luma[p] * scale);
+      let age = flip ? delay : count - 1 - delay;
+      const s = tdBase[age] + (tdSource ? tdSource[p] : p) * 3;
+      out[i] = frames[s];
+      out[i + 1] = frames[s + 1];
+      out[i + 2] = frames[s + 2];
+      out[i + 3] = 255;
+    }
+  } else {
+    const ages = tdAges(count, flip);
+    for (let p = 0, i = 0; i < out.length; p++, i += 4) {
+      const s = tdBase[ages[p]] + (tdSource ? tdSource[p] : p) * 3;
+      out[i] = frames[s];
+      out[i + 1] = frames[s + 1];
+      out[i + 2] = frames[s + 2];
+      out[i + 3] = 255;
+    }
+  }
+  presentFrame();
@@ -0,0 +1,56 @@
+// [59] Optical Flow Particles
+// @global_vars
+let ofParticles = [];
+// @draw_loop
+
+  background(0, 50); // Trails
+  
+  if (ofParticles.length === 0) {
+    for(let i=0; i<200; i++) ofParticles.push({x: random(width), y: random(height), vx: 0, vy: 0});
+  }
+  
+  const luma = featureLuma();
+  const prevLuma = featurePrevLuma();
+  
+  for (let p of ofParticles) {
+    let x = floor(p.x);
+    let y = floor(p.y);
+    let idx = x + y * width;
+    
+    if (x > 0 && x < width-1 && y > 0 && y < height-1) {
+       let curr = luma[idx];
+       let prev = prevLuma[idx];
+       
+       // Simplified Gradient-based Flow
+       let left = luma[idx - 1];
+       let right = luma[idx + 1];
+       let up = luma[idx - width];
+       let down = luma[idx + width];
+       
+       let Ix = (right - left) * 0.5;
+       let Iy = (down - up) * 0.5;
+       let It = curr - prev;
+       
+       let denom = Ix*Ix + Iy*Iy + 100; // Epsilon to prevent div by zero
+       let u = -It * Ix / denom;
+       let v = -It * Iy / denom;
+       
+       let scale = map(paramA, 0, 1, 10, 100);
+       p.vx += u * scale;
+       p.vy += v * scale;
+    }
+    
+    p.vx *= 0.9; // Friction
+    p.vy *= 0.9;
+    p.x += p.vx;
+    p.y += p.vy;
+    
+    if (p.x < 0) p.x = width;
+    if (p.x > width) p.x = 0;
+    if (p.y < 0) p.y = height;
+    if (p.y > height) p.y = 0;
+    
+    stroke(255);
+    point(p.x, p.y);
+  }
+
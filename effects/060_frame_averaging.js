@@ -0,0 +1,65 @@
+// [60] Frame Averaging
+// @global_vars
+// paramA sets how many frames are averaged, 2 up to ?window=N (default 100).
+//   ?average=window   the mean of the last N frames (the default), kept as
+//                     integer running sums over a ring of packed RGB frames:
+//                     per frame one frame is added and one subtracted, and
+//                     changing N adds or subtracts only the frames in between
+//   ?average=ema      an exponential moving average with the same span,
+//                     holding one accumulator whatever N is
+//   ?half=1           keep the window's frames at half resolution
+const faSettings = new URLSearchParams(location.search);
+const FA_MODE = faSettings.get('average') === 'ema' ? 'ema' : 'window';
+const FA_WINDOW = Math.min(Math.max(parseInt(faSettings.get('window'), 10) || 100, 2), 65535);
+const FA_BUDGET = 240 << 20;
+const faWindow = FA_MODE === 'window'
+  ? createFrameSum({ frames: FA_WINDOW, maxBytes: FA_BUDGET, format: 'rgb', scale: faSettings.get('half') === '1' ? 0.5 : 1 })
+  : null;
+let faAverage = null; // ema: Float32 average
+// @draw_loop
+
+  // paramA controls the window (2 to FA_WINDOW frames)
+  let n = floor(map(paramA, 0, 1, 2, FA_WINDOW));
+  const out = outputFrame().rgba;
+
+  if (FA_MODE === 'ema') {
+    // Same centre of mass as an n-frame mean
+    const src = grabFrame().rgba;
+    let alpha = 2 / (n + 1);
+    if (!faAverage || faAverage.length !== width * height * 3) {
+      faAverage = new Float32Array(width * height * 3);
+      for (let i = 0, j = 0; i < src.length; i += 4, j += 3) {
+        faAverage[j] = src[i];
+        faAverage[j + 1] = src[i + 1];
+        faAverage[j + 2] = src[i + 2];
+      }
+    }
+    for (let i = 0, j = 0; i < out.length; i += 4, j += 3) {
+      out[i] = faAverage[j] += (src[i] - faAverage[j]) * alpha;
+      out[i + 1] = faAverage[j + 1] += (src[i + 1] - faAverage[j + 1]) * alpha;
+      out[i + 2] = faAverage[j + 2] += (src[i + 2] - faAverage[j + 2]) * alpha;
+      out[i + 3] = 255;
+    }
+  } else {
+    const sum = faWindow.push(n);
+    const source = faWindow.ring.pixelMap(width, height);
+    let count = faWindow.count;
+
+    if (source) {
+      for (let p = 0, i = 0; i < out.length; p++, i += 4) {
+        const j = source[p] * 3;
+        out[i] = sum[j] / count;
+        out[i + 1] = sum[j + 1] / count;
+        out[i + 2] = sum[j + 2] / count;
+        out[i + 3] = 255;
+      }
+    } else {
+      for (let i = 0, j = 0; i < out.length; i += 4, j += 3) {
+        out[i] = sum[j] / count;
+        out[i + 1] = sum[j + 1] / count;
+        out[i + 2] = sum[j + 2] / count;
+        out[i + 3] = 255;
+      }
+    }
+  }
+  presentFrame();
@@ -0,0 +1,19 @@
+// [61] Stroboscope
+// @global_vars
+let lastUpdate = 0; let strobeFrame;
+// @draw_loop
+
+  if (!strobeFrame || strobeFrame.width !== width) {
+    strobeFrame = createGraphics(width, height);
+    strobeFrame.pixelDensity(1);
+  }
+
+  // paramA controls delay (200ms to 2000ms)
+  let delay = map(paramA, 0, 1, 200, 2000);
+  
+  if (millis() - lastUpdate > delay) {
+    strobeFrame.image(video, 0, 0, width, height);
+    lastUpdate = millis();
+  }
+  
+  image(strobeFrame, 0, 0);
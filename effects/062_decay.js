@@ -0,0 +1,25 @@
+// [62] Decay
+// @global_vars
+let decayBuffer;
+// @draw_loop
+
+  if (!decayBuffer || decayBuffer.width !== width) {
+    decayBuffer = createGraphics(width, height);
+    decayBuffer.pixelDensity(1);
+    decayBuffer.background(0);
+  }
+  
+  // Draw semi-transparent black rect to fade out old pixels
+  // paramA controls decay speed (fade amount)
+  let fade = map(paramA, 0, 1, 1, 20);
+  
+  decayBuffer.noStroke();
+  decayBuffer.fill(0, fade);
+  decayBuffer.rect(0, 0, width, height);
+  
+  // Draw current video on top using LIGHTEST blend mode to keep bright pixels
+  decayBuffer.blendMode(LIGHTEST);
+  decayBuffer.image(video, 0, 0, width, height);
+  decayBuffer.blendMode(BLEND);
+  
+  image(decayBuffer, 0, 0);
@@ -0,0 +1,36 @@
+// [63] Difference Clouds
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  loadPixels();
+  
+  let scale = 0.02;
+  let time = frameCount * 0.01;
+  // paramA controls noise intensity/mix
+  let mix = map(paramA, 0, 1, 0.5, 1.0);
+  
+  for (let y = 0; y < height; y++) {
+    for (let x = 0; x < width; x++) {
+      let idx = (x + y * width) * 4;
+      
+      let n = noise(x * scale, y * scale, time);
+      let factor = lerp(1, n, mix); // 1 means no effect, n means full noise mult
+      
+      pixels[idx] = video.pixels[idx] * factor;
+      pixels[idx+1] = video.pixels[idx+1] * factor;
+      pixels[idx+2] = video.pixels[idx+2] * factor;
+      pixels[idx+3] = 255;
+    }
+  }
+  updatePixels();
+// @kernel_setup
+  let scale = 0.02;
+  let time = frameCount * 0.01;
+  let mix = map(paramA, 0, 1, 0.5, 1.0);
+// @pixel
+    let factor = lerp(1, noise(x * scale, y * scale, time), mix);
+    r *= factor;
+    g *= factor;
+    b *= factor;
@@ -0,0 +1,27 @@
+// [64] Pointillism
+// @global_vars
+// @draw_loop
+
+  // Don't clear background completely to build up density
+  noStroke();
+  fill(0, 10);
+  rect(0, 0, width, height);
+  
+  video.loadPixels();
+  
+  // paramA controls dot size
+  let dotSize = map(paramA, 0, 1, 4, 15);
+  let numDots = 500;
+  
+  for (let i = 0; i < numDots; i++) {
+    let x = floor(random(width));
+    let y = floor(random(height));
+    let idx = (x + y * width) * 4;
+    
+    let r = video.pixels[idx];
+    let g = video.pixels[idx+1];
+    let b = video.pixels[idx+2];
+    
+    fill(r, g, b, 200);
+    ellipse(x, y, dotSize, dotSize);
+  }
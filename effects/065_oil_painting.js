@@ -0,0 +1,67 @@
+// [65] Oil Painting
+// @global_vars
+// @draw_loop
+
+  video.loadPixels();
+  noStroke();
+  
+  // Simplified Kuwahara Filter (Optimized for performance)
+  // We process a grid instead of every pixel to maintain frame rate
+  
+  // paramA controls brush size / grid step
+  let step = floor(map(paramA, 0, 1, 4, 10));
+  let radius = step;
+  
+  for (let y = radius; y < height - radius; y += step) {
+    for (let x = radius; x < width - radius; x += step) {
+      
+      // Analyze 4 sub-regions (TL, TR, BL, BR)
+      let bestMean = [0,0,0];
+      let minVar = Infinity;
+      
+      // Offsets for 4 quadrants relative to center
+      let quadrants = [
+        [-radius, -radius, 0, 0], // TL
+        [0, -radius, radius, 0],  // TR
+        [-radius, 0, 0, radius],  // BL
+        [0, 0, radius, radius]    // BR
+      ];
+      
+      for (let q of quadrants) {
+        let meanR = 0, meanG = 0, meanB = 0;
+        let count = 0;
+        
+        // Sample pixels in quadrant
+        for (let j = q[1]; j <= q[3]; j+=2) {
+          for (let i = q[0]; i <= q[2]; i+=2) {
+             let idx = ((x + i) + (y + j) * width) * 4;
+             meanR += video.pixels[idx];
+             meanG += video.pixels[idx+1];
+             meanB += video.pixels[idx+2];
+             count++;
+          }
+        }
+        meanR /= count; meanG /= count; meanB /= count;
+        
+        // Calculate Variance (simplified: just brightness variance)
+        let variance = 0;
+        for (let j = q[1]; j <= q[3]; j+=2) {
+          for (let i = q[0]; i <= q[2]; i+=2) {
+             let idx = ((x + i) + (y + j) * width) * 4;
+             let val = (video.pixels[idx] + video.pixels[idx+1] + video.pixels[idx+2])/3;
+             let meanVal = (meanR + meanG + meanB)/3;
+             variance += (val - meanVal) * (val - meanVal);
+          }
+        }
+        
+        if (variance < minVar) {
+          minVar = variance;
+          bestMean = [meanR, meanG, meanB];
+        }
+      }
+      
+      fill(bestMean[0], bestMean[1], bestMean[2]);
+      // Draw slightly overlapping rects for painterly look
+      rect(x - step/2, y - step/2, step + 2, step + 2);
+    }
+  }
@@ -0,0 +1,38 @@
+// [66] Watercolor
+// @global_vars
+// @draw_loop
+
+  // Fade background to white slowly (Wet paper effect)
+  noStroke();
+  fill(255, 10);
+  rect(0, 0, width, height);
+  
+  video.loadPixels();
+  
+  // paramA controls blob spread
+  let spread = map(paramA, 0, 1, 10, 40);
+  let numBlobs = 30;
+  
+  for (let i = 0; i < numBlobs; i++) {
+    let x = random(width);
+    let y = random(height);
+    let idx = (floor(x) + floor(y) * width) * 4;
+    
+    let r = video.pixels[idx];
+    let g = video.pixels[idx+1];
+    let b = video.pixels[idx+2];
+    
+    // Very low opacity for layering
+    fill(r, g, b, 40);
+    
+    beginShape();
+    // Create jagged/organic shape
+    for (let a = 0; a < TWO_PI; a += 0.5) {
+      let offset = random(-5, 5);
+      let rad = spread + offset;
+      let vx = x + cos(a) * rad;
+      let vy = y + sin(a) * rad;
+      curveVertex(vx, vy);
+    }
+    endShape(CLOSE);
+  }
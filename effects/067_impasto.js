@@ -0,0 +1,36 @@
+// [67] Impasto
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  noStroke();
+  
+  // paramA controls stroke size
+  let step = floor(map(paramA, 0, 1, 5, 20));
+  
+  for (let y = 0; y < height; y += step) {
+    for (let x = 0; x < width; x += step) {
+      let idx = (x + y * width) * 4;
+      let r = video.pixels[idx];
+      let g = video.pixels[idx+1];
+      let b = video.pixels[idx+2];
+      let bright = (r + g + b) / 3;
+      
+      // Angle based on brightness
+      let angle = map(bright, 0, 255, 0, TWO_PI);
+      
+      push();
+      translate(x, y);
+      rotate(angle);
+      
+      // Shadow (offset)
+      fill(0, 100);
+      rect(2, 2, step, step/2);
+      
+      // Stroke
+      fill(r, g, b);
+      rect(0, 0, step, step/2);
+      pop();
+    }
+  }
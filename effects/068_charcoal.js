@@ -0,0 +1,51 @@
+// [68] Charcoal
+// @global_vars
+// @draw_loop
+
+  const luma = featureLuma();
+  const frame = outputFrame();
+  frame.rgba32.fill(0xffffffff); // the last row and column stay white
+  const out = frame.rgba;
+  
+  // paramA controls threshold
+  let thresh = map(paramA, 0, 1, 10, 60);
+  
+  for (let y = 0; y < height - 1; y++) {
+    for (let x = 0; x < width - 1; x++) {
+      let p = x + y * width;
+      let b = luma[p];
+      let bRight = luma[p + 1];
+      let bDown = luma[p + width];
+      
+      let diff = abs(b - bRight) + abs(b - bDown);
+      
+      let destIdx = (x + y * width) * 4;
+      
+      if (diff > thresh) {
+        // Edge: Black with some noise
+        let val = random(50);
+        out[destIdx] = val;
+        out[destIdx+1] = val;
+        out[destIdx+2] = val;
+      } else {
+        // Background: White with grain
+        let val = 255 - random(20);
+        out[destIdx] = val;
+        out[destIdx+1] = val;
+        out[destIdx+2] = val;
+      }
+    }
+  }
+  presentFrame();
+// @kernel_setup
+  let thresh = map(paramA, 0, 1, 10, 60);
+// @neighbour
+    if (x >= w - 1 || y >= h - 1) {
+      r = g = b = 255;
+    } else {
+      let right = i + 4, down = i + w * 4;
+      let l = (src[i] + src[i + 1] + src[i + 2]) / 3;
+      let diff = abs(l - (src[right] + src[right + 1] + src[right + 2]) / 3) + abs(l - (src[down] + src[down + 1] + src[down + 2]) / 3);
+      r = g = b = (diff > thresh) ? random(50) : 255 - random(20);
+    }
+    a = 255;
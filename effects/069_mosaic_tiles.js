@@ -0,0 +1,41 @@
+// [69] Mosaic Tiles
+// @global_vars
+// @draw_loop
+
+  background(50); // Dark mortar
+  video.loadPixels();
+  noStroke();
+  
+  // paramA controls tile size
+  let step = floor(map(paramA, 0, 1, 10, 30));
+  
+  for (let y = 0; y < height; y += step) {
+    for (let x = 0; x < width; x += step) {
+      // Sample center color
+      let cx = floor(x + step/2);
+      let cy = floor(y + step/2);
+      if (cx >= width || cy >= height) continue;
+      
+      let idx = (cx + cy * width) * 4;
+      fill(video.pixels[idx], video.pixels[idx+1], video.pixels[idx+2]);
+      
+      // Draw irregular quad inside the grid cell
+      // Shrink slightly to show mortar
+      let gap = 2;
+      let x1 = x + gap + random(2);
+      let y1 = y + gap + random(2);
+      let x2 = x + step - gap - random(2);
+      let y2 = y + gap + random(2);
+      let x3 = x + step - gap - random(2);
+      let y3 = y + step - gap - random(2);
+      let x4 = x + gap + random(2);
+      let y4 = y + step - gap - random(2);
+      
+      beginShape();
+      vertex(x1, y1);
+      vertex(x2, y2);
+      vertex(x3, y3);
+      vertex(x4, y4);
+      endShape(CLOSE);
+    }
+  }
@@ -0,0 +1,68 @@
+// [70] Stained Glass (Glow)
+// @global_vars
+let sgSeeds = []; let sgPg;
+// @draw_loop
+
+  if (!sgPg || sgPg.width !== width) {
+    sgPg = createGraphics(width, height);
+    sgPg.pixelDensity(1);
+  }
+
+  video.loadPixels();
+  
+  // paramA controls cell count
+  let numSeeds = floor(map(paramA, 0, 1, 20, 80));
+  
+  if (sgSeeds.length !== numSeeds) {
+    sgSeeds = [];
+    for (let i = 0; i < numSeeds; i++) {
+      sgSeeds.push({x: random(width), y: random(height)});
+    }
+  }
+  
+  sgPg.background(0);
+  sgPg.noStroke();
+  
+  // Draw Voronoi to offscreen buffer
+  let step = 6;
+  for (let y = 0; y < height; y += step) {
+    for (let x = 0; x < width; x += step) {
+      let minDist = Infinity;
+      let closest = -1;
+      
+      for (let i = 0; i < sgSeeds.length; i++) {
+        let d = (x - sgSeeds[i].x)**2 + (y - sgSeeds[i].y)**2;
+        if (d < minDist) { minDist = d; closest = i; }
+      }
+      
+      let s = sgSeeds[closest];
+      let sx = floor(constrain(s.x, 0, width-1));
+      let sy = floor(constrain(s.y, 0, height-1));
+      let idx = (sx + sy * width) * 4;
+      
+      // Boost saturation simply by increasing max channel and decreasing min
+      let r = video.pixels[idx];
+      let g = video.pixels[idx+1];
+      let b = video.pixels[idx+2];
+      
+      // Simple saturation boost
+      let maxC = Math.max(r, g, b);
+      if (r !== maxC) r *= 0.8;
+      if (g !== maxC) g *= 0.8;
+      if (b !== maxC) b *= 0.8;
+      
+      sgPg.fill(r * 1.2, g * 1.2, b * 1.2);
+      sgPg.rect(x, y, step, step);
+    }
+  }
+  
+  // Draw buffer
+  image(sgPg, 0, 0);
+  
+  // Draw bloom (buffer drawn again with blur and ADD blend)
+  push();
+  blendMode(ADD);
+  drawingContext.filter = 'blur(15px)';
+  image(sgPg, 0, 0);
+  drawingContext.filter = 'none';
+  pop();
@@ -0,0 +1,41 @@
+// [71] Spray Paint
+// @global_vars
+// @draw_loop
+
+  // Fade background slowly
+  noStroke();
+  fill(255, 10);
+  rect(0, 0, width, height);
+  
+  video.loadPixels();
+  
+  // paramA controls spray density
+  let density = map(paramA, 0, 1, 50, 200);
+  
+  for (let i = 0; i < density; i++) {
+    let x = floor(random(width));
+    let y = floor(random(height));
+    let idx = (x + y * width) * 4;
+    
+    let r = video.pixels[idx];
+    let g = video.pixels[idx+1];
+    let b = video.pixels[idx+2];
+    let bright = (r + g + b) / 3;
+    
+    // Only spray on dark areas
+    if (bright < 100) {
+      let radius = random(5, 15);
+      let colorVar = random(-20, 20);
+      
+      fill(r + colorVar, g + colorVar, b + colorVar);
+      
+      // Draw splatter cluster
+      for (let j = 0; j < 5; j++) {
+        let ox = random(-radius, radius);
+        let oy = random(-radius, radius);
+        if (ox*ox + oy*oy < radius*radius) {
+           ellipse(x + ox, y + oy, 2, 2);
+        }
+      }
+    }
+  }
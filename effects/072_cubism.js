@@ -0,0 +1,46 @@
+// [72] Cubism
+// @global_vars
+// @draw_loop
+
+  background(0);
+  
+  // paramA controls fragmentation
+  let cols = floor(map(paramA, 0, 1, 2, 8));
+  let rows = cols;
+  let w = width / cols;
+  let h = height / rows;
+  
+  for (let y = 0; y < rows; y++) {
+    for (let x = 0; x < cols; x++) {
+      let px = x * w;
+      let py = y * h;
+      
+      // Random offset for source rectangle
+      let ox = random(-20, 20);
+      let oy = random(-20, 20);
+      
+      // Random scale/rotation for that block
+      push();
+      translate(px + w/2, py + h/2);
+      rotate(random(-0.1, 0.1));
+      
+      // Draw part of video
+      // source x, y, w, h -> dest x, y, w, h
+      // We are drawing centered at 0,0 because of translate
+      let sx = px + ox;
+      let sy = py + oy;
+      
+      // Ensure source is within bounds
+      sx = constrain(sx, 0, width - w);
+      sy = constrain(sy, 0, height - h);
+      
+      image(video, -w/2, -h/2, w, h, sx, sy, w, h);
+      
+      // Draw border
+      noFill();
+      stroke(0);
+      strokeWeight(2);
+      rect(-w/2, -h/2, w, h);
+      pop();
+    }
+  }
@@ -0,0 +1,35 @@
+// [73] Ink Wash
+// @global_vars
+// @draw_loop
+
+  // Slow fade for trail effect
+  noStroke();
+  fill(255, 20);
+  rect(0, 0, width, height);
+  
+  video.loadPixels();
+  
+  // paramA controls number of drops
+  let drops = floor(map(paramA, 0, 1, 10, 50));
+  
+  for (let i = 0; i < drops; i++) {
+    let x = floor(random(width));
+    let y = floor(random(height));
+    let idx = (x + y * width) * 4;
+    
+    let bright = (video.pixels[idx] + video.pixels[idx+1] + video.pixels[idx+2]) / 3;
+    
+    // Ink is dark
+    if (bright < 150) {
+      let radius = map(bright, 0, 150, 20, 2); // Darker = larger blob
+      
+      fill(0, 50); // Semi-transparent black
+      
+      beginShape();
+      for (let a = 0; a < TWO_PI; a += 0.5) {
+        let r = radius + random(-2, 2);
+        vertex(x + cos(a) * r, y + sin(a) * r);
+      }
+      endShape(CLOSE);
+    }
+  }
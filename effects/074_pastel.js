@@ -0,0 +1,57 @@
+// [74] Pastel
+// @global_vars
+let paperTexture;
+// @draw_loop
+
+  if (!paperTexture) {
+    paperTexture = createGraphics(width, height);
+    paperTexture.noStroke();
+    for (let i = 0; i < 10000; i++) {
+      paperTexture.fill(random(200, 255), 50);
+      paperTexture.rect(random(width), random(height), 2, 2);
+    }
+  }
+
+  video.loadPixels();
+  loadPixels();
+  
+  // paramA controls color simplification
+  let levels = floor(map(paramA, 0, 1, 4, 12));
+  let bin = 255 / levels;
+  
+  for (let i = 0; i < pixels.length; i += 4) {
+    let r = video.pixels[i];
+    let g = video.pixels[i+1];
+    let b = video.pixels[i+2];
+    
+    // Quantize and brighten (Pastel look)
+    r = floor(r / bin) * bin + bin/2 + 20;
+    g = floor(g / bin) * bin + bin/2 + 20;
+    b = floor(b / bin) * bin + bin/2 + 20;
+    
+    pixels[i] = constrain(r, 0, 255);
+    pixels[i+1] = constrain(g, 0, 255);
+    pixels[i+2] = constrain(b, 0, 255);
+    pixels[i+3] = 255;
+  }
+  updatePixels();
+  
+  // Overlay texture
+  image(paperTexture, 0, 0);
+// @kernel_setup
+  if (!paperTexture) {
+    paperTexture = createGraphics(width, height);
+    paperTexture.noStroke();
+    for (let i = 0; i < 10000; i++) {
+      paperTexture.fill(random(200, 255), 50);
+      paperTexture.rect(random(width), random(height), 2, 2);
+    }
+  }
+  let levels = floor(map(paramA, 0, 1, 4, 12));
+  let bin = 255 / levels;
+// @pixel
+    r = constrain(floor(r / bin) * bin + bin/2 + 20, 0, 255);
+    g = constrain(floor(g / bin) * bin + bin/2 + 20, 0, 255);
+    b = constrain(floor(b / bin) * bin + bin/2 + 20, 0, 255);
+// @overlay
+  image(paperTexture, 0, 0);
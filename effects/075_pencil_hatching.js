@@ -0,0 +1,42 @@
+// [75] Pencil Hatching
+// @global_vars
+// @draw_loop
+
+  background(255);
+  video.loadPixels();
+  stroke(0, 150);
+  strokeWeight(1);
+  
+  // paramA controls stroke density
+  let density = floor(map(paramA, 0, 1, 1000, 5000));
+  
+  for (let i = 0; i < density; i++) {
+    let x = floor(random(width));
+    let y = floor(random(height));
+    
+    // Sobel-like gradient approximation
+    let idx = (x + y * width) * 4;
+    let idxRight = (min(x+1, width-1) + y * width) * 4;
+    let idxDown = (x + min(y+1, height-1) * width) * 4;
+    
+    let b = (video.pixels[idx] + video.pixels[idx+1] + video.pixels[idx+2]) / 3;
+    let bRight = (video.pixels[idxRight] + video.pixels[idxRight+1] + video.pixels[idxRight+2]) / 3;
+    let bDown = (video.pixels[idxDown] + video.pixels[idxDown+1] + video.pixels[idxDown+2]) / 3;
+    
+    // Only draw in darker areas
+    if (b < 200) {
+      let dx = bRight - b;
+      let dy = bDown - b;
+      
+      // Angle perpendicular to gradient (contour)
+      let angle = atan2(dy, dx) + HALF_PI;
+      
+      let len = map(b, 0, 200, 10, 2);
+      
+      push();
+      translate(x, y);
+      rotate(angle);
+      line(-len, 0, len, 0);
+      pop();
+    }
+  }
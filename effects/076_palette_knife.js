@@ -0,0 +1,27 @@
+// [76] Palette Knife
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  noStroke();
+  
+  // paramA controls smear intensity
+  let maxSmear = map(paramA, 0, 1, 10, 100);
+  
+  for (let y = 0; y < height; y+=2) {
+    for (let x = 0; x < width; x++) {
+      let idx = (x + y * width) * 4;
+      let r = video.pixels[idx];
+      let g = video.pixels[idx+1];
+      let b = video.pixels[idx+2];
+      let bright = (r+g+b)/3;
+      
+      let smear = map(bright, 0, 255, 0, maxSmear);
+      
+      fill(r, g, b);
+      rect(x, y, smear, 2);
+      
+      x += floor(smear * 0.8); // Skip forward to create smear effect
+    }
+  }
@@ -0,0 +1,33 @@
+// [77] Blueprint
+// @global_vars
+// @draw_loop
+
+  background(0, 50, 150); // Blueprint Blue
+  const luma = featureLuma();
+  stroke(255);
+  noFill();
+  
+  // Grid lines
+  stroke(255, 50);
+  for(let i=0; i<width; i+=50) line(i, 0, i, height);
+  for(let i=0; i<height; i+=50) line(0, i, width, i);
+  
+  stroke(255);
+  // paramA controls threshold
+  let thresh = map(paramA, 0, 1, 20, 100);
+  
+  for (let y = 0; y < height; y++) {
+    for (let x = 0; x < width; x++) {
+      let p = x + y * width;
+      
+      if (x < width-1 && y < height-1) {
+        let b = luma[p];
+        let bR = luma[p + 1];
+        let bD = luma[p + width];
+        
+        if (abs(b - bR) > thresh || abs(b - bD) > thresh) {
+           point(x, y);
+        }
+      }
+    }
+  }
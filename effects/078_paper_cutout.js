@@ -0,0 +1,46 @@
+// [78] Paper Cutout
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  loadPixels();
+  
+  // paramA controls color levels
+  let levels = floor(map(paramA, 0, 1, 3, 8));
+  let bin = 255 / (levels-1);
+  let shadowOffset = 4;
+  
+  for (let y = 0; y < height; y++) {
+    for (let x = 0; x < width; x++) {
+      let idx = (x + y * width) * 4;
+      
+      // Quantize current pixel
+      let r = floor(video.pixels[idx] / 255 * (levels-1) + 0.5) * bin;
+      let g = floor(video.pixels[idx+1] / 255 * (levels-1) + 0.5) * bin;
+      let b = floor(video.pixels[idx+2] / 255 * (levels-1) + 0.5) * bin;
+      
+      // Check bottom-right neighbor for edge (Shadow)
+      let nx = x + shadowOffset;
+      let ny = y + shadowOffset;
+      let isShadow = false;
+      
+      if (nx < width && ny < height) {
+         let nIdx = (nx + ny * width) * 4;
+         let nr = floor(video.pixels[nIdx] / 255 * (levels-1) + 0.5) * bin;
+         let ng = floor(video.pixels[nIdx+1] / 255 * (levels-1) + 0.5) * bin;
+         let nb = floor(video.pixels[nIdx+2] / 255 * (levels-1) + 0.5) * bin;
+         
+         if (r !== nr || g !== ng || b !== nb) {
+           isShadow = true;
+         }
+      }
+      
+      if (isShadow) {
+        pixels[idx] = 0; pixels[idx+1] = 0; pixels[idx+2] = 0; pixels[idx+3] = 255;
+      } else {
+        pixels[idx] = r; pixels[idx+1] = g; pixels[idx+2] = b; pixels[idx+3] = 255;
+      }
+    }
+  }
+  updatePixels();
@@ -0,0 +1,32 @@
+// [79] Triangle Halftone
+// @global_vars
+// @draw_loop
+
+  background(255);
+  video.loadPixels();
+  noStroke();
+  fill(0);
+  
+  // paramA controls grid size
+  let step = floor(map(paramA, 0, 1, 10, 30));
+  
+  for (let y = 0; y < height; y += step) {
+    for (let x = 0; x < width; x += step) {
+      let idx = (x + y * width) * 4;
+      let r = video.pixels[idx];
+      let g = video.pixels[idx+1];
+      let b = video.pixels[idx+2];
+      let bright = (r + g + b) / 3;
+      
+      // Map brightness to triangle size (Darker = larger)
+      let s = map(bright, 0, 255, step, 0);
+      
+      if (s > 2) {
+        push();
+        translate(x + step/2, y + step/2);
+        let h = s * sqrt(3) / 2;
+        triangle(0, -h/2, -s/2, h/2, s/2, h/2);
+        pop();
+      }
+    }
+  }
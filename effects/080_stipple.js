@@ -0,0 +1,23 @@
+// [80] Stipple
+// @global_vars
+// @draw_loop
+
+  background(255);
+  video.loadPixels();
+  stroke(0);
+  strokeWeight(1);
+  
+  // paramA controls density
+  let density = map(paramA, 0, 1, 1000, 10000);
+  
+  for (let i = 0; i < density; i++) {
+    let x = floor(random(width));
+    let y = floor(random(height));
+    let idx = (x + y * width) * 4;
+    let bright = (video.pixels[idx] + video.pixels[idx+1] + video.pixels[idx+2]) / 3;
+    
+    // Inverse probability: Darker pixels = higher chance of dot
+    if (random(255) > bright) {
+      point(x, y);
+    }
+  }
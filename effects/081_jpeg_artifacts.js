@@ -0,0 +1,51 @@
+// [81] JPEG Artifacts
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  loadPixels();
+  
+  // paramA controls block size (8 to 32)
+  let blockSize = floor(map(paramA, 0, 1, 8, 32));
+  
+  for (let y = 0; y < height; y += blockSize) {
+    for (let x = 0; x < width; x += blockSize) {
+      // Sample color from center of block (Chroma subsampling simulation)
+      let cx = x + blockSize/2;
+      let cy = y + blockSize/2;
+      cx = constrain(cx, 0, width-1);
+      cy = constrain(cy, 0, height-1);
+      let cIdx = (floor(cx) + floor(cy) * width) * 4;
+      
+      let cr = video.pixels[cIdx];
+      let cg = video.pixels[cIdx+1];
+      let cb = video.pixels[cIdx+2];
+      
+      for (let by = 0; by < blockSize; by++) {
+        for (let bx = 0; bx < blockSize; bx++) {
+          let px = x + bx;
+          let py = y + by;
+          if (px >= width || py >= height) continue;
+          
+          let idx = (px + py * width) * 4;
+          
+          // Get original brightness (Luma)
+          let r = video.pixels[idx];
+          let g = video.pixels[idx+1];
+          let b = video.pixels[idx+2];
+          let luma = (r + g + b) / 3;
+          
+          // Apply block color but maintain original luma
+          let blockLuma = (cr + cg + cb) / 3;
+          let factor = luma / (blockLuma + 1); // Avoid div by zero
+          
+          pixels[idx] = constrain(cr * factor, 0, 255);
+          pixels[idx+1] = constrain(cg * factor, 0, 255);
+          pixels[idx+2] = constrain(cb * factor, 0, 255);
+          pixels[idx+3] = 255;
+        }
+      }
+    }
+  }
+  updatePixels();
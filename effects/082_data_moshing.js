@@ -0,0 +1,54 @@
+// [82] Data Moshing
+// @global_vars
+let moshBuffer;
+// @draw_loop
+
+  if (!moshBuffer || moshBuffer.width !== width) {
+    moshBuffer = createGraphics(width, height);
+    moshBuffer.image(video, 0, 0, width, height);
+  }
+  
+  video.loadPixels();
+  const luma = featureLuma();
+  moshBuffer.loadPixels();
+  
+  // paramA controls blend amount (0.01 to 0.2)
+  let blendAmt = map(paramA, 0, 1, 0.01, 0.2);
+  
+  loadPixels();
+  
+  for (let y = 1; y < height - 1; y++) {
+    for (let x = 1; x < width - 1; x++) {
+      let idx = (x + y * width) * 4;
+      
+      // Calculate brightness gradient from VIDEO (the "force")
+      let p = x + y * width;
+      let bLeft = luma[p - 1];
+      let bRight = luma[p + 1];
+      let bUp = luma[p - width];
+      let bDown = luma[p + width];
+      
+      // Flow vector
+      let dx = (bRight - bLeft) * 0.1; 
+      let dy = (bDown - bUp) * 0.1;
+      
+      // Sample from OLD moshBuffer
+      let sx = Math.floor(constrain(x - dx, 0, width - 1));
+      let sy = Math.floor(constrain(y - dy, 0, height - 1));
+      let srcIdx = (sx + sy * width) * 4;
+      
+      // Blend old moved pixel with new video pixel
+      let r = lerp(moshBuffer.pixels[srcIdx], video.pixels[idx], blendAmt);
+      let g = lerp(moshBuffer.pixels[srcIdx+1], video.pixels[idx+1], blendAmt);
+      let b = lerp(moshBuffer.pixels[srcIdx+2], video.pixels[idx+2], blendAmt);
+      
+      pixels[idx] = r;
+      pixels[idx+1] = g;
+      pixels[idx+2] = b;
+      pixels[idx+3] = 255;
+    }
+  }
+  updatePixels();
+  
+  // Update buffer for next frame
+  moshBuffer.image(get(), 0, 0);
@@ -0,0 +1,17 @@
+// [83] Scanlines
+// @global_vars
+// @draw_loop
+
+  image(video, 0, 0);
+  
+  // paramA controls line spacing
+  let spacing = floor(map(paramA, 0, 1, 4, 20));
+  let speed = 1;
+  let scroll = (frameCount * speed) % spacing;
+  
+  stroke(0, 150); // Semi-transparent black
+  strokeWeight(spacing / 2);
+  
+  for (let y = -spacing; y < height; y += spacing) {
+    line(0, y + scroll, width, y + scroll);
+  }
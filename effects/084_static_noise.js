@@ -0,0 +1,29 @@
+// [84] Static Noise
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  loadPixels();
+  
+  // paramA controls noise amount
+  let amount = map(paramA, 0, 1, 0, 150);
+  
+  for (let i = 0; i < video.pixels.length; i += 4) {
+    let r = video.pixels[i];
+    let g = video.pixels[i+1];
+    let b = video.pixels[i+2];
+    
+    // Add random colored noise
+    pixels[i] = constrain(r + random(-amount, amount), 0, 255);
+    pixels[i+1] = constrain(g + random(-amount, amount), 0, 255);
+    pixels[i+2] = constrain(b + random(-amount, amount), 0, 255);
+    pixels[i+3] = 255;
+  }
+  updatePixels();
+// @kernel_setup
+  let amount = map(paramA, 0, 1, 0, 150);
+// @pixel
+    r = constrain(r + random(-amount, amount), 0, 255);
+    g = constrain(g + random(-amount, amount), 0, 255);
+    b = constrain(b + random(-amount, amount), 0, 255);
@@ -0,0 +1,36 @@
+// [85] Channel Shift
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  loadPixels();
+  
+  // paramA controls max shift
+  let maxShift = map(paramA, 0, 1, 0, 20);
+  
+  // Random shift per frame
+  let rShift = floor(random(-maxShift, maxShift));
+  let gShift = floor(random(-maxShift, maxShift));
+  let bShift = floor(random(-maxShift, maxShift));
+  
+  for (let y = 0; y < height; y++) {
+    for (let x = 0; x < width; x++) {
+      let idx = (x + y * width) * 4;
+      
+      // Calculate source indices with wrap
+      let rX = (x + rShift + width) % width;
+      let gX = (x + gShift + width) % width;
+      let bX = (x + bShift + width) % width;
+      
+      let rIdx = (rX + y * width) * 4;
+      let gIdx = (gX + y * width) * 4;
+      let bIdx = (bX + y * width) * 4;
+      
+      pixels[idx] = video.pixels[rIdx];
+      pixels[idx+1] = video.pixels[gIdx+1];
+      pixels[idx+2] = video.pixels[bIdx+2];
+      pixels[idx+3] = 255;
+    }
+  }
+  updatePixels();
@@ -0,0 +1,15 @@
+// [86] Vertical Hold
+// @global_vars
+let vHoldY = 0;
+// @draw_loop
+
+  background(0);
+  
+  // paramA controls roll speed
+  let speed = map(paramA, 0, 1, 0, 20);
+  
+  vHoldY = (vHoldY + speed) % height;
+  
+  // Draw image twice to simulate loop
+  image(video, 0, vHoldY);
+  image(video, 0, vHoldY - height);
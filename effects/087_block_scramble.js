@@ -0,0 +1,34 @@
+// [87] Block Scramble
+// @global_vars
+let bsBlocks = []; let bsLastTime = 0;
+// @draw_loop
+
+  background(0);
+  
+  // paramA controls block size/count
+  let cols = floor(map(paramA, 0, 1, 2, 10));
+  let rows = cols;
+  let w = width / cols;
+  let h = height / rows;
+  
+  // Update shuffle every 0.5 seconds or so
+  if (millis() - bsLastTime > 500 || bsBlocks.length !== cols * rows) {
+    bsBlocks = [];
+    for(let i=0; i<cols*rows; i++) bsBlocks.push(i);
+    // Shuffle
+    for (let i = bsBlocks.length - 1; i > 0; i--) {
+      const j = floor(random(i + 1));
+      [bsBlocks[i], bsBlocks[j]] = [bsBlocks[j], bsBlocks[i]];
+    }
+    bsLastTime = millis();
+  }
+  
+  for (let y = 0; y < rows; y++) {
+    for (let x = 0; x < cols; x++) {
+      let idx = bsBlocks[x + y * cols];
+      let sx = (idx % cols) * w;
+      let sy = floor(idx / cols) * h;
+      
+      image(video, x * w, y * h, w, h, sx, sy, w, h);
+    }
+  }
@@ -0,0 +1,30 @@
+// [88] Color Banding
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  loadPixels();
+  
+  // paramA controls number of bands (2 to 32)
+  let bands = floor(map(paramA, 0, 1, 2, 32));
+  let factor = 255 / (bands - 1);
+  
+  for (let i = 0; i < video.pixels.length; i += 4) {
+    let r = video.pixels[i];
+    let g = video.pixels[i+1];
+    let b = video.pixels[i+2];
+    
+    pixels[i] = floor(r / factor) * factor;
+    pixels[i+1] = floor(g / factor) * factor;
+    pixels[i+2] = floor(b / factor) * factor;
+    pixels[i+3] = 255;
+  }
+  updatePixels();
+// @kernel_setup
+  let bands = floor(map(paramA, 0, 1, 2, 32));
+  let factor = 255 / (bands - 1);
+// @pixel
+    r = floor(r / factor) * factor;
+    g = floor(g / factor) * factor;
+    b = floor(b / factor) * factor;
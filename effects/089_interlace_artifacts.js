@@ -0,0 +1,41 @@
+// [89] Interlace Artifacts
+// @global_vars
+let iaPrev;
+// @draw_loop
+
+  if (!iaPrev || iaPrev.width !== width) {
+    iaPrev = createGraphics(width, height);
+    iaPrev.image(video, 0, 0, width, height);
+  }
+  
+  video.loadPixels();
+  iaPrev.loadPixels();
+  loadPixels();
+  
+  // paramA controls line height (blockiness)
+  let lineH = floor(map(paramA, 0, 1, 1, 10));
+  
+  for (let y = 0; y < height; y++) {
+    let isEven = floor(y / lineH) % 2 === 0;
+    
+    for (let x = 0; x < width; x++) {
+      let idx = (x + y * width) * 4;
+      
+      if (isEven) {
+        // Current frame
+        pixels[idx] = video.pixels[idx];
+        pixels[idx+1] = video.pixels[idx+1];
+        pixels[idx+2] = video.pixels[idx+2];
+      } else {
+        // Previous frame
+        pixels[idx] = iaPrev.pixels[idx];
+        pixels[idx+1] = iaPrev.pixels[idx+1];
+        pixels[idx+2] = iaPrev.pixels[idx+2];
+      }
+      pixels[idx+3] = 255;
+    }
+  }
+  updatePixels();
+  
+  // Update prev
+  iaPrev.image(video, 0, 0, width, height);
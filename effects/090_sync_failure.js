@@ -0,0 +1,40 @@
+// [90] Sync Failure
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  loadPixels();
+  
+  // paramA controls distortion amount
+  let maxShift = map(paramA, 0, 1, 0, 100);
+  
+  for (let y = 0; y < height; y++) {
+    let xOffset = 0;
+    
+    // Only affect top 20% of screen
+    if (y < height * 0.2) {
+       // Exponential decay from top
+       let factor = map(y, 0, height * 0.2, 1, 0);
+       // Sine wave wobble
+       xOffset = sin(y * 0.05 + frameCount * 0.2) * maxShift * factor;
+       // Add some noise
+       xOffset += random(-5, 5) * factor;
+    }
+    
+    for (let x = 0; x < width; x++) {
+      let sx = floor(x - xOffset);
+      
+      // Wrap
+      sx = (sx + width) % width;
+      
+      let destIdx = (x + y * width) * 4;
+      let srcIdx = (sx + y * width) * 4;
+      
+      pixels[destIdx] = video.pixels[srcIdx];
+      pixels[destIdx+1] = video.pixels[srcIdx+1];
+      pixels[destIdx+2] = video.pixels[srcIdx+2];
+      pixels[destIdx+3] = 255;
+    }
+  }
+  updatePixels();
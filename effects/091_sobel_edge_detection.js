@@ -0,0 +1,40 @@
+// [91] Sobel Edge Detection
+// @global_vars
+// @draw_loop
+
+  const magnitude = featureGradient().magnitude; // 0 along the border
+  const out = outputFrame().rgba;
+  
+  // paramA controls threshold
+  let thresh = map(paramA, 0, 1, 20, 100);
+  
+  for (let p = 0, idx = 0; p < magnitude.length; p++, idx += 4) {
+    let mag = magnitude[p];
+    let val = (mag > thresh) ? mag : 0;
+    val = constrain(val, 0, 255);
+    out[idx] = val;
+    out[idx+1] = val;
+    out[idx+2] = val;
+    out[idx+3] = 255;
+  }
+  presentFrame();
+// @kernel_setup
+  let thresh = map(paramA, 0, 1, 20, 100);
+// @neighbour
+    if (x < 1 || y < 1 || x >= w - 1 || y >= h - 1) {
+      r = g = b = 0;
+    } else {
+      let up = i - w * 4, down = i + w * 4;
+      let l00 = (src[up - 4] + src[up - 3] + src[up - 2]) / 3;
+      let l10 = (src[up] + src[up + 1] + src[up + 2]) / 3;
+      let l20 = (src[up + 4] + src[up + 5] + src[up + 6]) / 3;
+      let l01 = (src[i - 4] + src[i - 3] + src[i - 2]) / 3;
+      let l21 = (src[i + 4] + src[i + 5] + src[i + 6]) / 3;
+      let l02 = (src[down - 4] + src[down - 3] + src[down - 2]) / 3;
+      let l12 = (src[down] + src[down + 1] + src[down + 2]) / 3;
+      let l22 = (src[down + 4] + src[down + 5] + src[down + 6]) / 3;
+      let gx = -l00 - 2*l01 - l02 + l20 + 2*l21 + l22;
+      let gy = -l00 - 2*l10 - l20 + l02 + 2*l12 + l22;
+      let mag = sqrt(gx*gx + gy*gy);
+      r = g = b = constrain((mag > thresh) ? mag : 0, 0, 255);
+    }
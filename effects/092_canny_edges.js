@@ -0,0 +1,66 @@
+// [92] Canny Edges
+// @global_vars
+let cDir = null;
+// @draw_loop
+
+  const { ix, iy, magnitude: cMag } = featureGradient(); // Sobel, shared with other effects
+  if (!cDir || cDir.length !== width * height) {
+    cDir = new Uint8Array(width * height);
+  }
+  
+  const frame = outputFrame();
+  frame.rgba32.fill(0xff000000); // opaque black
+  const out = frame.rgba;
+  
+  // paramA controls low threshold
+  let lowThresh = map(paramA, 0, 1, 20, 100);
+  let highThresh = lowThresh * 2;
+  
+  // Pass 1: Gradient Direction
+  for (let y = 1; y < height - 1; y++) {
+    for (let x = 1; x < width - 1; x++) {
+      let idx = x + y * width;
+      
+      // Direction quantization (0, 45, 90, 135)
+      let angle = atan2(iy[idx], ix[idx]) * 180 / PI;
+      if (angle < 0) angle += 180;
+      
+      if ((angle >= 0 && angle < 22.5) || (angle >= 157.5 && angle <= 180)) cDir[idx] = 0; // Horizontal
+      else if (angle >= 22.5 && angle < 67.5) cDir[idx] = 45; // Diagonal /
+      else if (angle >= 67.5 && angle < 112.5) cDir[idx] = 90; // Vertical
+      else if (angle >= 112.5 && angle < 157.5) cDir[idx] = 135; // Diagonal Left
+    }
+  }
+  
+  // Pass 2: Non-maximum Suppression
+  for (let y = 1; y < height - 1; y++) {
+    for (let x = 1; x < width - 1; x++) {
+      let idx = x + y * width;
+      let mag = cMag[idx];
+      
+      if (mag < lowThresh) continue; // Skip weak pixels
+      
+      let dir = cDir[idx];
+      let m1 = 0, m2 = 0;
+      
+      if (dir === 0) { // Horizontal, check Left/Right
+        m1 = cMag[idx - 1]; m2 = cMag[idx + 1];
+      } else if (dir === 90) { // Vertical, check Up/Down
+        m1 = cMag[idx - width]; m2 = cMag[idx + width];
+      } else if (dir === 45) { // Diagonal 45 (TL-BR), check TL/BR
+        m1 = cMag[idx - width - 1]; m2 = cMag[idx + width + 1];
+      } else { // Diagonal 135 (TR-BL), check TR/BL
+        m1 = cMag[idx - width + 1]; m2 = cMag[idx + width - 1];
+      }
+      
+      // If local max, keep it
+      if (mag >= m1 && mag >= m2) {
+         let val = (mag > highThresh) ? 255 : mag; // Simple hysteresis approx
+         let pIdx = idx * 4;
+         out[pIdx] = val;
+         out[pIdx+1] = val;
+         out[pIdx+2] = val;
+      }
+    }
+  }
+  presentFrame();
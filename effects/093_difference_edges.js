@@ -0,0 +1,31 @@
+// [93] Difference Edges
+// @global_vars
+let diffBuffer;
+// @draw_loop
+
+  if (!diffBuffer || diffBuffer.width !== floor(width/8)) {
+    diffBuffer = createGraphics(floor(width/8), floor(height/8));
+    diffBuffer.pixelDensity(1);
+  }
+  
+  background(0);
+  
+  // 1. Blur by downscaling
+  diffBuffer.image(video, 0, 0, diffBuffer.width, diffBuffer.height);
+  
+  // 2. Draw blurred base
+  image(diffBuffer, 0, 0, width, height);
+  
+  // 3. Subtract sharp video
+  blendMode(DIFFERENCE);
+  image(video, 0, 0);
+  blendMode(BLEND);
+  
+  // 4. Boost brightness
+  loadPixels();
+  for (let i = 0; i < pixels.length; i += 4) {
+    pixels[i] *= 4;
+    pixels[i+1] *= 4;
+    pixels[i+2] *= 4;
+  }
+  updatePixels();
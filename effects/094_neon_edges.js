@@ -0,0 +1,33 @@
+// [94] Neon Edges
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  loadPixels();
+  
+  // paramA controls threshold
+  let thresh = map(paramA, 0, 1, 20, 100);
+  
+  for (let y = 0; y < height - 1; y++) {
+    for (let x = 0; x < width - 1; x++) {
+      let idx = (x + y * width) * 4;
+      let idxR = ((x + 1) + y * width) * 4;
+      let idxD = (x + (y + 1) * width) * 4;
+      
+      let r = video.pixels[idx];
+      let g = video.pixels[idx+1];
+      let b = video.pixels[idx+2];
+      
+      // Calculate color distance to neighbors
+      let d1 = dist(r, g, b, video.pixels[idxR], video.pixels[idxR+1], video.pixels[idxR+2]);
+      let d2 = dist(r, g, b, video.pixels[idxD], video.pixels[idxD+1], video.pixels[idxD+2]);
+      
+      if (d1 + d2 > thresh) {
+        pixels[idx] = r; pixels[idx+1] = g; pixels[idx+2] = b; pixels[idx+3] = 255;
+      } else {
+        pixels[idx] = 0; pixels[idx+1] = 0; pixels[idx+2] = 0; pixels[idx+3] = 255;
+      }
+    }
+  }
+  updatePixels();
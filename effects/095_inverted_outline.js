@@ -0,0 +1,31 @@
+// [95] Inverted Outline
+// @global_vars
+// @draw_loop
+
+  const luma = featureLuma();
+  const frame = outputFrame();
+  frame.rgba32.fill(0xffffffff); // the last row and column stay white
+  const out = frame.rgba;
+  
+  // paramA controls threshold
+  let thresh = map(paramA, 0, 1, 15, 80);
+  
+  for (let y = 0; y < height - 1; y++) {
+    for (let x = 0; x < width - 1; x++) {
+      let idx = (x + y * width) * 4;
+      let p = x + y * width;
+      
+      let b = luma[p];
+      let bR = luma[p + 1];
+      let bD = luma[p + width];
+      
+      let diff = abs(b - bR) + abs(b - bD);
+      
+      if (diff > thresh) {
+        out[idx] = 0; out[idx+1] = 0; out[idx+2] = 0;
+      } else {
+        out[idx] = 255; out[idx+1] = 255; out[idx+2] = 255;
+      }
+    }
+  }
+  presentFrame();
@@ -0,0 +1,34 @@
+// [96] Topographic Lines
+// @global_vars
+// @draw_loop
+
+  const luma = featureLuma();
+  const frame = outputFrame();
+  frame.rgba32.fill(0xffffffff); // the last row and column stay white
+  const out = frame.rgba;
+  
+  // paramA controls number of contour levels
+  let levels = floor(map(paramA, 0, 1, 5, 20));
+  let step = 255 / levels;
+  
+  for (let y = 0; y < height - 1; y++) {
+    for (let x = 0; x < width - 1; x++) {
+      let p = x + y * width;
+      let idx = p * 4;
+      let b = luma[p];
+      
+      // Check right neighbor
+      let bR = luma[p + 1];
+      
+      // Check bottom neighbor
+      let bD = luma[p + width];
+      
+      // If neighbors fall in different quantization buckets, draw a contour line (black)
+      if (floor(b / step) !== floor(bR / step) || floor(b / step) !== floor(bD / step)) {
+         out[idx] = 0; out[idx+1] = 0; out[idx+2] = 0;
+      } else {
+         out[idx] = 255; out[idx+1] = 255; out[idx+2] = 255;
+      }
+    }
+  }
+  presentFrame();
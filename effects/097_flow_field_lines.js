@@ -0,0 +1,37 @@
+// [97] Flow Field Lines
+// @global_vars
+// @draw_loop
+
+  background(255);
+  video.loadPixels();
+  stroke(0);
+  strokeWeight(1);
+  
+  // paramA controls grid density
+  let step = floor(map(paramA, 0, 1, 10, 30));
+  
+  for (let y = step; y < height - step; y += step) {
+    for (let x = step; x < width - step; x += step) {
+      // Calculate gradient
+      let idxL = ((x-1) + y * width) * 4;
+      let idxR = ((x+1) + y * width) * 4;
+      let idxU = (x + (y-1) * width) * 4;
+      let idxD = (x + (y+1) * width) * 4;
+      
+      let bL = (video.pixels[idxL] + video.pixels[idxL+1] + video.pixels[idxL+2]) / 3;
+      let bR = (video.pixels[idxR] + video.pixels[idxR+1] + video.pixels[idxR+2]) / 3;
+      let bU = (video.pixels[idxU] + video.pixels[idxU+1] + video.pixels[idxU+2]) / 3;
+      let bD = (video.pixels[idxD] + video.pixels[idxD+1] + video.pixels[idxD+2]) / 3;
+      
+      // Determine angle based on brightness slope
+      let dx = bR - bL;
+      let dy = bD - bU;
+      let angle = atan2(dy, dx);
+      
+      push();
+      translate(x, y);
+      rotate(angle);
+      line(-step/2, 0, step/2, 0);
+      pop();
+    }
+  }
@@ -0,0 +1,31 @@
+// [98] Wireframe
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  stroke(0, 255, 0); // Retro green
+  strokeWeight(1);
+  
+  // paramA controls grid size
+  let step = floor(map(paramA, 0, 1, 5, 20));
+  let thresh = 30;
+  
+  for (let y = 0; y < height - step; y += step) {
+    for (let x = 0; x < width - step; x += step) {
+      let idx = (x + y * width) * 4;
+      let b = (video.pixels[idx] + video.pixels[idx+1] + video.pixels[idx+2]) / 3;
+      
+      // Check Right
+      let idxR = ((x+step) + y * width) * 4;
+      let bR = (video.pixels[idxR] + video.pixels[idxR+1] + video.pixels[idxR+2]) / 3;
+      
+      // Check Down
+      let idxD = (x + (y+step) * width) * 4;
+      let bD = (video.pixels[idxD] + video.pixels[idxD+1] + video.pixels[idxD+2]) / 3;
+      
+      // Connect if high contrast (Edge wireframe)
+      if (abs(b - bR) > thresh) line(x, y, x + step, y);
+      if (abs(b - bD) > thresh) line(x, y, x, y + step);
+    }
+  }
@@ -0,0 +1,60 @@
+// [99] Text Rain
+// @global_vars
+let rainDrops = [];
+// @draw_loop
+
+  background(255);
+  
+  // Draw faint video for reference
+  tint(255, 100);
+  image(video, 0, 0);
+  noTint();
+  
+  video.loadPixels();
+  
+  // Initialize drops
+  let spacing = 10;
+  if (rainDrops.length === 0) {
+    for (let x = 0; x < width; x += spacing) {
+      rainDrops.push({
+        x: x,
+        y: random(-height, 0),
+        speed: random(2, 5),
+        char: String.fromCharCode(65 + floor(random(26)))
+      });
+    }
+  }
+  
+  fill(0);
+  textSize(12);
+  textAlign(CENTER);
+  
+  // paramA controls threshold for "solid" pixels
+  let thresh = map(paramA, 0, 1, 50, 150);
+  
+  for (let d of rainDrops) {
+    d.y += d.speed;
+    
+    // Check collision with dark pixels (User silhouette)
+    let checkY = floor(d.y);
+    
+    // If inside screen
+    if (checkY >= 0 && checkY < height) {
+      let idx = (floor(d.x) + checkY * width) * 4;
+      let b = (video.pixels[idx] + video.pixels[idx+1] + video.pixels[idx+2]) / 3;
+      
+      // If dark (silhouette), push up until it sits on top
+      while (b < thresh && d.y > 0) {
+        d.y -= 1;
+        checkY = floor(d.y);
+        if (checkY < 0) break;
+        
+        idx = (floor(d.x) + checkY * width) * 4;
+        b = (video.pixels[idx] + video.pixels[idx+1] + video.pixels[idx+2]) / 3;
+      }
+    }
+    
+    if (d.y > height) d.y = -20; // Reset to top
+    
+    text(d.char, d.x, d.y);
+  }
@@ -0,0 +1,35 @@
+// [100] Binary Stream
+// @global_vars
+let mStreams = [];
+// @draw_loop
+
+  background(0, 40); // Fade trail
+  video.loadPixels();
+  
+  let fontSize = 14;
+  let cols = floor(width / fontSize);
+  
+  if (mStreams.length !== cols) {
+    mStreams = new Array(cols).fill(0).map(() => random(-height, 0));
+  }
+  
+  textSize(fontSize);
+  
+  for (let i = 0; i < cols; i++) {
+    let x = i * fontSize;
+    let y = mStreams[i];
+    
+    let vy = floor(y);
+    if (vy >= 0 && vy < height) {
+       let idx = (x + vy * width) * 4;
+       let b = (video.pixels[idx] + video.pixels[idx+1] + video.pixels[idx+2]) / 3;
+       
+       // Green characters, opacity based on brightness
+       fill(0, 255, 0, b);
+       let char = (random(1) > 0.5) ? "1" : "0";
+       text(char, x, y);
+    }
+    
+    mStreams[i] += fontSize; // Move down
+    if (mStreams[i] > height) mStreams[i] = random(-100, 0);
+  }
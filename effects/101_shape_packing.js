@@ -0,0 +1,42 @@
+// [101] Shape Packing
+// @global_vars
+let packCircles = [];
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  
+  // Reset if full
+  if (packCircles.length > 2000) packCircles = [];
+  
+  // Attempt to add circles
+  let attempts = 50;
+  for (let i = 0; i < attempts; i++) {
+    let x = random(width);
+    let y = random(height);
+    
+    let idx = (floor(x) + floor(y) * width) * 4;
+    let r = video.pixels[idx];
+    let g = video.pixels[idx+1];
+    let b = video.pixels[idx+2];
+    let bright = (r+g+b)/3;
+    
+    if (bright > 30) {
+      let closestD = 50; // Max radius
+      for (let c of packCircles) {
+        let d = dist(x, y, c.x, c.y) - c.rad;
+        if (d < closestD) closestD = d;
+        if (closestD < 2) break;
+      }
+      
+      if (closestD > 2) {
+        packCircles.push({x: x, y: y, rad: closestD, c: [r,g,b]});
+      }
+    }
+  }
+  
+  noStroke();
+  for (let c of packCircles) {
+    fill(c.c[0], c.c[1], c.c[2]);
+    ellipse(c.x, c.y, c.rad * 2);
+  }
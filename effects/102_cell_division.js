@@ -0,0 +1,92 @@
+// [102] Cell Division
+// @global_vars
+let cdSeeds = []; let cdPrev;
+// @draw_loop
+
+  if (!cdPrev || cdPrev.width !== width) {
+    cdPrev = createGraphics(width, height);
+    cdPrev.image(video, 0, 0, width, height);
+    cdSeeds = [];
+    for(let i=0; i<10; i++) cdSeeds.push({x: random(width), y: random(height)});
+  }
+  
+  video.loadPixels();
+  cdPrev.loadPixels();
+  
+  // 1. Update Seeds (Split on motion)
+  let motionThresh = map(paramA, 0, 1, 20, 100);
+  let maxSeeds = 100;
+  
+  for (let i = cdSeeds.length - 1; i >= 0; i--) {
+    let s = cdSeeds[i];
+    let x = floor(constrain(s.x, 0, width-1));
+    let y = floor(constrain(s.y, 0, height-1));
+    let idx = (x + y * width) * 4;
+    
+    let r = video.pixels[idx];
+    let g = video.pixels[idx+1];
+    let b = video.pixels[idx+2];
+    let pr = cdPrev.pixels[idx];
+    let pg = cdPrev.pixels[idx+1];
+    let pb = cdPrev.pixels[idx+2];
+    
+    let diff = abs(r-pr) + abs(g-pg) + abs(b-pb);
+    
+    // Move slightly
+    s.x += random(-1, 1);
+    s.y += random(-1, 1);
+    
+    // Split
+    if (diff > motionThresh && cdSeeds.length < maxSeeds) {
+      cdSeeds.push({x: s.x + random(-10, 10), y: s.y + random(-10, 10)});
+    }
+  }
+  
+  // Randomly kill seeds to prevent saturation
+  if (cdSeeds.length > maxSeeds || (cdSeeds.length > 10 && random(1) < 0.05)) {
+    cdSeeds.splice(floor(random(cdSeeds.length)), 1);
+  }
+  
+  // 2. Draw Voronoi (Pixel approximation)
+  loadPixels();
+  let step = 4; 
+  for (let y = 0; y < height; y += step) {
+    for (let x = 0; x < width; x += step) {
+      let minDist = Infinity;
+      let closest = 0;
+      
+      for (let i = 0; i < cdSeeds.length; i++) {
+        let d = (x - cdSeeds[i].x)**2 + (y - cdSeeds[i].y)**2;
+        if (d < minDist) { minDist = d; closest = i; }
+      }
+      
+      // Color based on video at seed location
+      let s = cdSeeds[closest];
+      let sx = floor(constrain(s.x, 0, width-1));
+      let sy = floor(constrain(s.y, 0, height-1));
+      let idx = (sx + sy * width) * 4;
+      
+      let r = video.pixels[idx];
+      let g = video.pixels[idx+1];
+      let b = video.pixels[idx+2];
+      
+      for(let dy=0; dy<step; dy++){
+         for(let dx=0; dx<step; dx++){
+            let pIdx = ((x+dx) + (y+dy)*width)*4;
+            if (pIdx < pixels.length) {
+                pixels[pIdx] = r; pixels[pIdx+1] = g; pixels[pIdx+2] = b; pixels[pIdx+3] = 255;
+            }
+         }
+      }
+    }
+  }
+  updatePixels();
+  
+  // Draw cell centers
+  for (let s of cdSeeds) {
+    fill(255);
+    noStroke();
+    ellipse(s.x, s.y, 4, 4);
+  }
+  
+  cdPrev.image(video, 0, 0, width, height);
@@ -0,0 +1,80 @@
+// [103] Lichen Growth
+// @global_vars
+let lichenGrid = null;
+// @draw_loop
+
+  if (!lichenGrid || lichenGrid.length !== width * height) {
+    lichenGrid = new Uint8Array(width * height); // 0 = empty, 1 = lichen
+    // Seed center
+    lichenGrid[floor(width/2) + floor(height/2) * width] = 1;
+  }
+  
+  background(0);
+  video.loadPixels();
+  loadPixels();
+  
+  // Draw existing lichen
+  for (let i = 0; i < lichenGrid.length; i++) {
+    if (lichenGrid[i] === 1) {
+      let idx = i * 4;
+      // Greenish color mixed with video
+      pixels[idx] = video.pixels[idx];
+      pixels[idx+1] = min(255, video.pixels[idx+1] + 100);
+      pixels[idx+2] = video.pixels[idx+2];
+      pixels[idx+3] = 255;
+    } else {
+      let idx = i * 4;
+      pixels[idx] = video.pixels[idx] * 0.3;
+      pixels[idx+1] = video.pixels[idx+1] * 0.3;
+      pixels[idx+2] = video.pixels[idx+2] * 0.3;
+      pixels[idx+3] = 255;
+    }
+  }
+  updatePixels();
+  
+  // Simulation steps per frame
+  let steps = 10000;
+  let growthThresh = map(paramA, 0, 1, 50, 150); // Darker pixels allow growth
+  
+  for (let n = 0; n < steps; n++) {
+    // Spawn walker
+    let wx = floor(random(width));
+    let wy = floor(random(height));
+    
+    // Walk
+    let maxWalk = 50;
+    for (let w = 0; w < maxWalk; w++) {
+      wx += floor(random(-2, 2));
+      wy += floor(random(-2, 2));
+      wx = constrain(wx, 1, width-2);
+      wy = constrain(wy, 1, height-2);
+      
+      let idx = wx + wy * width;
+      
+      // Check neighbors for lichen
+      if (lichenGrid[idx] === 0) {
+        if (lichenGrid[idx-1] || lichenGrid[idx+1] || lichenGrid[idx-width] || lichenGrid[idx+width]) {
+           // Found neighbor, check if environment (video) allows growth
+           let pIdx = idx * 4;
+           let bright = (video.pixels[pIdx] + video.pixels[pIdx+1] + video.pixels[pIdx+2]) / 3;
+           
+           if (bright < growthThresh) {
+             lichenGrid[idx] = 1;
+             break; // Stuck
+           }
+        }
+      }
+    }
+  }
+  
+  // Random decay (lichen dies in bright light)
+  for (let i = 0; i < 10000; i++) {
+    let rx = floor(random(width));
+    let ry = floor(random(height));
+    let idx = rx + ry * width;
+    if (lichenGrid[idx] === 1) {
+       let pIdx = idx * 4;
+       let bright = (video.pixels[pIdx] + video.pixels[pIdx+1] + video.pixels[pIdx+2]) / 3;
+       if (bright > growthThresh + 20) lichenGrid[idx] = 0;
+    }
+  }
@@ -0,0 +1,91 @@
+// [104] Reaction-Diffusion
+// @global_vars
+let rdGrid = []; let rdNext = []; let rdW = 100; let rdH = 100;
+// @draw_loop
+
+  // Initialize low-res grid for performance
+  if (rdGrid.length !== rdW * rdH) {
+    rdGrid = []; rdNext = [];
+    for (let i = 0; i < rdW * rdH; i++) {
+      rdGrid.push({a: 1, b: 0});
+      rdNext.push({a: 1, b: 0});
+    }
+  }
+  
+  video.loadPixels();
+  
+  // Parameters (Gray-Scott)
+  let dA = 1.0;
+  let dB = 0.5;
+  let feed = 0.055;
+  let k = 0.062;
+  
+  // Interactive feed/kill based on paramA
+  feed = map(paramA, 0, 1, 0.01, 0.1);
+  
+  // Seed B from video brightness
+  for (let y = 0; y < rdH; y++) {
+    for (let x = 0; x < rdW; x++) {
+      // Map low-res coord to video coord
+      let vx = floor(map(x, 0, rdW, 0, width));
+      let vy = floor(map(y, 0, rdH, 0, height));
+      let vIdx = (vx + vy * width) * 4;
+      let bright = (video.pixels[vIdx] + video.pixels[vIdx+1] + video.pixels[vIdx+2]) / 3;
+      
+      let idx = x + y * rdW;
+      if (bright > 200) rdGrid[idx].b = 1; // Add chemical B in bright areas
+    }
+  }
+  
+  // Simulation Step
+  for (let x = 1; x < rdW - 1; x++) {
+    for (let y = 1; y < rdH - 1; y++) {
+      let i = x + y * rdW;
+      
+      let a = rdGrid[i].a;
+      let b = rdGrid[i].b;
+      
+      let lapA = 
+        (rdGrid[i-1].a + rdGrid[i+1].a + rdGrid[i-rdW].a + rdGrid[i+rdW].a) * 0.2 +
+        (rdGrid[i-rdW-1].a + rdGrid[i-rdW+1].a + rdGrid[i+rdW-1].a + rdGrid[i+rdW+1].a) * 0.05 -
+        a;
+        
+      let lapB = 
+        (rdGrid[i-1].b + rdGrid[i+1].b + rdGrid[i-rdW].b + rdGrid[i+rdW].b) * 0.2 +
+        (rdGrid[i-rdW-1].b + rdGrid[i-rdW+1].b + rdGrid[i+rdW-1].b + rdGrid[i+rdW+1].b) * 0.05 -
+        b;
+
+      let nextA = a + (dA * lapA - a * b * b + feed * (1 - a));
+      let nextB = b + (dB * lapB + a * b * b - (k + feed) * b);
+      
+      rdNext[i].a = constrain(nextA, 0, 1);
+      rdNext[i].b = constrain(nextB, 0, 1);
+    }
+  }
+  
+  // Swap
+  let temp = rdGrid;
+  rdGrid = rdNext;
+  rdNext = temp;
+  
+  // Render
+  loadPixels();
+  for (let y = 0; y < height; y++) {
+    for (let x = 0; x < width; x++) {
+      // Map screen pixel to grid
+      let gx = floor(map(x, 0, width, 0, rdW));
+      let gy = floor(map(y, 0, height, 0, rdH));
+      let idx = gx + gy * rdW;
+      
+      let c = floor((rdGrid[idx].a - rdGrid[idx].b) * 255);
+      c = constrain(c, 0, 255);
+      
+      let pIdx = (x + y * width) * 4;
+      // Colorize: Black to Cyan/White
+      pixels[pIdx] = c;
+      pixels[pIdx+1] = c;
+      pixels[pIdx+2] = 255;
+      pixels[pIdx+3] = 255;
+    }
+  }
+  updatePixels();
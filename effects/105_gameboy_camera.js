@@ -0,0 +1,88 @@
+// [105] Gameboy Camera
+// @global_vars
+// @draw_loop
+
+  background(15, 56, 15);
+  video.loadPixels();
+  loadPixels();
+  
+  // GB Palette
+  const palette = [
+    [15, 56, 15],   // Darkest
+    [48, 98, 48],   // Dark
+    [139, 172, 15], // Light
+    [155, 188, 15]  // Lightest
+  ];
+  
+  // Bayer Matrix 4x4
+  const bayer = [
+    [0, 8, 2, 10],
+    [12, 4, 14, 6],
+    [3, 11, 1, 9],
+    [15, 7, 13, 5]
+  ];
+  
+  // paramA controls pixelation/downsampling
+  let step = floor(map(paramA, 0, 1, 1, 4));
+  
+  for (let y = 0; y < height; y += step) {
+    for (let x = 0; x < width; x += step) {
+      let idx = (x + y * width) * 4;
+      let r = video.pixels[idx];
+      let g = video.pixels[idx+1];
+      let b = video.pixels[idx+2];
+      let avg = (r + g + b) / 3;
+      
+      // Map to 0-255 range with dither
+      let mapX = x % 4;
+      let mapY = y % 4;
+      let threshold = (bayer[mapY][mapX] / 16.0) * 255;
+      
+      // Adjust brightness based on threshold
+      let val = avg + (threshold - 128) * 0.5;
+      
+      // Quantize to 4 levels
+      let level = floor(map(val, 0, 255, 0, 4));
+      level = constrain(level, 0, 3);
+      
+      let c = palette[level];
+      
+      // Fill block
+      for(let dy=0; dy<step; dy++) {
+        for(let dx=0; dx<step; dx++) {
+          if(x+dx < width && y+dy < height) {
+             let pIdx = ((x+dx) + (y+dy)*width) * 4;
+             pixels[pIdx] = c[0];
+             pixels[pIdx+1] = c[1];
+             pixels[pIdx+2] = c[2];
+             pixels[pIdx+3] = 255;
+          }
+        }
+      }
+    }
+  }
+  updatePixels();
+// @kernel_setup
+  const palette = [
+    [15, 56, 15],
+    [48, 98, 48],
+    [139, 172, 15],
+    [155, 188, 15]
+  ];
+  const bayer = [
+    [0, 8, 2, 10],
+    [12, 4, 14, 6],
+    [3, 11, 1, 9],
+    [15, 7, 13, 5]
+  ];
+  let step = floor(map(paramA, 0, 1, 1, 4));
+// @neighbour
+    // Every pixel of a step x step block takes the block origin's value
+    let bx = x - x % step, by = y - y % step;
+    let o = (bx + by * w) * 4;
+    let avg = (src[o] + src[o + 1] + src[o + 2]) / 3;
+    let val = avg + ((bayer[by % 4][bx % 4] / 16.0) * 255 - 128) * 0.5;
+    let c = palette[constrain(floor(map(val, 0, 255, 0, 4)), 0, 3)];
+    r = c[0];
+    g = c[1];
+    b = c[2];
@@ -0,0 +1,41 @@
+// [106] Vector Display
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  
+  stroke(0, 255, 0);
+  strokeWeight(1);
+  noFill();
+  
+  // Glow effect
+  drawingContext.shadowBlur = 10;
+  drawingContext.shadowColor = 'lime';
+  
+  // paramA controls edge threshold
+  let thresh = map(paramA, 0, 1, 20, 80);
+  let step = 2; // Skip pixels for performance/style
+  
+  beginShape(LINES);
+  for (let y = 0; y < height - step; y += step) {
+    for (let x = 0; x < width - step; x += step) {
+      let idx = (x + y * width) * 4;
+      let idxR = ((x+step) + y * width) * 4;
+      let idxD = (x + (y+step) * width) * 4;
+      
+      let b = (video.pixels[idx] + video.pixels[idx+1] + video.pixels[idx+2]) / 3;
+      let bR = (video.pixels[idxR] + video.pixels[idxR+1] + video.pixels[idxR+2]) / 3;
+      let bD = (video.pixels[idxD] + video.pixels[idxD+1] + video.pixels[idxD+2]) / 3;
+      
+      if (abs(b - bR) > thresh) {
+         vertex(x, y); vertex(x, y+step);
+      }
+      if (abs(b - bD) > thresh) {
+         vertex(x, y); vertex(x+step, y);
+      }
+    }
+  }
+  endShape();
+  
+  drawingContext.shadowBlur = 0;
@@ -0,0 +1,46 @@
+// [107] Bad Cable
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  loadPixels();
+  
+  // paramA controls glitch intensity
+  let intensity = map(paramA, 0, 1, 0, 50);
+  
+  for (let y = 0; y < height; y++) {
+    // Calculate horizontal shift (H-Sync failure)
+    // Noise based on y and time
+    let xOffset = 0;
+    
+    // Occasional large tears
+    if (random(1) < 0.05 * (intensity/10)) {
+       xOffset = random(-width/2, width/2);
+    } else {
+       // Jitter
+       xOffset = (noise(y * 0.01, frameCount * 0.1) - 0.5) * intensity * 4;
+    }
+    
+    for (let x = 0; x < width; x++) {
+      let sx = floor(x - xOffset);
+      // Wrap
+      sx = (sx + width) % width;
+      
+      let destIdx = (x + y * width) * 4;
+      let srcIdx = (sx + y * width) * 4;
+      
+      // Color channel separation (chromatic aberration on glitch)
+      if (abs(xOffset) > 5) {
+         pixels[destIdx] = video.pixels[((sx + 5) % width + y * width) * 4];
+         pixels[destIdx+1] = video.pixels[srcIdx+1];
+         pixels[destIdx+2] = video.pixels[((sx - 5 + width) % width + y * width) * 4 + 2];
+      } else {
+         pixels[destIdx] = video.pixels[srcIdx];
+         pixels[destIdx+1] = video.pixels[srcIdx+1];
+         pixels[destIdx+2] = video.pixels[srcIdx+2];
+      }
+      pixels[destIdx+3] = 255;
+    }
+  }
+  updatePixels();
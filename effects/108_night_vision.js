@@ -0,0 +1,74 @@
+// [108] Night Vision
+// @global_vars
+// @draw_loop
+
+  background(0);
+  video.loadPixels();
+  loadPixels();
+  
+  // paramA controls noise amount
+  let noiseAmt = map(paramA, 0, 1, 20, 100);
+  let cx = width/2;
+  let cy = height/2;
+  let maxDist = dist(0,0,cx,cy);
+  
+  for (let y = 0; y < height; y++) {
+    for (let x = 0; x < width; x++) {
+      let idx = (x + y * width) * 4;
+      let r = video.pixels[idx];
+      let g = video.pixels[idx+1];
+      let b = video.pixels[idx+2];
+      
+      // Grayscale
+      let bright = (r + g + b) / 3;
+      bright = 255 - bright;
+      
+      // Contrast stretch
+      bright = (bright - 50) * 1.5;
+      bright = constrain(bright, 0, 255);
+      
+      // Vignette
+      let d = dist(x, y, cx, cy);
+      let vig = map(d, 0, maxDist, 1, 0.2);
+      bright *= vig;
+      
+      // Add noise
+      bright += random(-noiseAmt, noiseAmt);
+      bright = constrain(bright, 0, 255);
+      
+      // Night vision green mapping
+      pixels[idx] = 0;
+      pixels[idx+1] = bright;
+      pixels[idx+2] = 0;
+      pixels[idx+3] = 255;
+    }
+  }
+  updatePixels();
+  
+  // Scanlines overlay
+  fill(0, 50);
+  noStroke();
+  for(let y=0; y<height; y+=4) rect(0, y, width, 2);
+// @kernel_setup
+  let noiseAmt = map(paramA, 0, 1, 20, 100);
+  let cx = width/2;
+  let cy = height/2;
+  let maxDist = dist(0, 0, cx, cy);
+// @pixel
+    let bright = constrain((255 - (r + g + b) / 3 - 50) * 1.5, 0, 255);
+    bright *= map(dist(x, y, cx, cy), 0, maxDist, 1, 0.2);
+    bright = constrain(bright + random(-noiseAmt, noiseAmt), 0, 255);
+    r = 0;
+    g = bright;
+    b = 0;
+// @overlay
+  fill(0, 50);
+  noStroke();
+  for (let y = 0; y < height; y += 4) rect(0, y, width, 2);
+// @glsl
+    float bright = clamp((1.0 - (color.r + color.g + color.b) / 3.0 - 50.0 / 255.0) * 1.5, 0.0, 1.0);
+    vec2 center = resolution / 2.0;
+    bright *= map(distance(xy, center), 0.0, length(center), 1.0, 0.2);
+    float noiseAmt = map(paramA, 0.0, 1.0, 20.0, 100.0) / 255.0;
+    bright = clamp(bright + random(-noiseAmt, noiseAmt), 0.0, 1.0);
+    color.rgb = vec3(0.0, bright, 0.0);
@@ -1,78 +1,324 @@
 import os
+import re
 import sys
-import http.server
-import socketserver
+import gzip
+import json
+import time
+import mimetypes
+import hashlib
+import argparse
+import urllib.request
 import webbrowser
 import threading
+from concurrent.futures import ProcessPoolExecutor
 from effects_library import EFFECTS
+from compose import ChainError, compile_chain, compile_effect, compile_worker
+from server import make_server, run_shutdown_hooks
+
+try:
+    import brotli
+except ImportError:  # optional: only used for the precompressed .br variant of p5
+    brotli = None
 
 TEMPLATE_DIR = "."
 OUTPUT_DIR = "output"
 SKETCH_TEMPLATE = "sketch_base.js"
 HTML_TEMPLATE = "template.html"
+RUNTIME_DIR = "runtime"
+VENDOR_DIR = "vendor"
+HASH_FILE = ".build_hash"
+WORKER_SCRIPT = "worker.js"  # compose.compile_worker output, next to the sketch
 PORT = 8000
+FIXED_SCALE_COSTS = ("stateful", "frame-history")  # per-pixel state would not survive a resize
+ANIMATED = re.compile(r"\bframeCount\b|\b(?:millis|random|noise)\s*\(")  # output changes without new input
+SOURCES = ("camera", "bars", "noise", "gradient")  # or "clip:<path>", see runtime/synthetic.js
+
+P5_VERSION = "1.9.0"
+P5_FILE = f"p5-{P5_VERSION}.min.js"
+P5_CDN_URL = f"https://cdnjs.cloudflare.com/ajax/libs/p5.js/{P5_VERSION}/p5.min.js"
+P5_BANNER = f"/*! p5.js v{P5_VERSION} ".encode()  # first bytes of every p5 build
+# sha256 of P5_CDN_URL (`curl -sL <url> | sha256sum`); update with P5_VERSION.
+# While it is empty, p5 builds are only recognised by P5_BANNER.
+P5_SHA256 = ""
 
 def load_template(filename):
     path = os.path.join(os.path.dirname(__file__), TEMPLATE_DIR, filename)
     with open(path, 'r') as f:
         return f.read()
 
-def write_output(filename, content):
-    if not os.path.exists(OUTPUT_DIR):
-        os.makedirs(OUTPUT_DIR)
-    
-    path = os.path.join(OUTPUT_DIR, filename)
-    with open(path, 'w') as f:
+def write_output(filename, content, out_dir=OUTPUT_DIR, quiet=False):
+    if not os.path.exists(out_dir):
+        os.makedirs(out_dir)
+
+    path = os.path.join(out_dir, filename)
+    with open(path, 'wb' if isinstance(content, bytes) else 'w') as f:
         f.write(content)
-    print(f"✓ Generated: {path}")
-
-class Handler(http.server.SimpleHTTPRequestHandler):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, directory=OUTPUT_DIR, **kwargs)
-
-    def do_GET(self):
-        if self.path == '/shutdown':
-            self.send_response(200)
-            self.end_headers()
-            self.wfile.write(b"Server shutting down...")
-            print("\nRemote shutdown requested. Exiting.")
-            threading.Timer(0.5, lambda: os._exit(0)).start()
+    if not quiet:
+        print(f"✓ Generated: {path}")
+    return path
+
+def p5_verified(data):
+    if P5_SHA256:
+        return hashlib.sha256(data).hexdigest() == P5_SHA256
+    return data.startswith(P5_BANNER)
+
+def fetch_p5():
+    """Returns the pinned p5 build from vendor/, downloading it there the
+    first time. Returns None when it is missing and cannot be downloaded, or
+    when it fails p5_verified() (a truncated download or an error page would
+    otherwise be published as p5)."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), VENDOR_DIR, P5_FILE)
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            data = f.read()
+        if p5_verified(data):
+            return data
+        if not P5_SHA256:
+            # Copied in by hand, perhaps another version: leave it for the user
+            print(f"Warning: {path} is not p5.js {P5_VERSION}. Sketches will load it from the CDN.")
+            return None
+        print(f"Warning: {path} does not match P5_SHA256; removing it.")
+        os.remove(path)
+    print(f"Vendoring p5.js {P5_VERSION} into {VENDOR_DIR}/ ...")
+    try:
+        with urllib.request.urlopen(P5_CDN_URL, timeout=30) as response:
+            data = response.read()
+            expected = response.headers.get("Content-Length")
+    except OSError as e:
+        print(f"Warning: could not download p5.js ({e}). Sketches will load it from the CDN.")
+        return None
+    if (expected is not None and len(data) != int(expected)) or not p5_verified(data):
+        print(f"Warning: the p5.js download ({len(data)} bytes) is not p5.js {P5_VERSION}. Sketches will load it from the CDN.")
+        return None
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return data
+
+def publish_p5():
+    """Copies p5 into output/ under a content-addressed name (so it can be
+    cached forever) next to gzip and brotli variants. Returns the file name,
+    or the CDN URL when no vendored copy is available."""
+    data = fetch_p5()
+    if data is None:
+        return P5_CDN_URL
+    name = f"p5.{hashlib.sha256(data).hexdigest()[:12]}.min.js"
+    if not os.path.exists(os.path.join(OUTPUT_DIR, name)):
+        write_output(name + ".gz", gzip.compress(data, 9, mtime=0), quiet=True)
+        if brotli is not None:
+            write_output(name + ".br", brotli.compress(data), quiet=True)
+        # Written last, it marks the set as complete
+        write_output(name, data, quiet=True)
+    return name
+
+def load_runtime(names):
+    return "\n".join(load_template(os.path.join(RUNTIME_DIR, f"{name}.js")) for name in names)
+
+def sketch_sources(effect):
+    # Everything of an effect that ends up in the output, resolved to plain
+    # strings and bytes so it can be hashed and handed to a pool worker
+    assets = dict(effect.get("assets", {}))
+    if "worker_code" in effect:
+        # compose.compile_worker: the fused passes run from their own script
+        assets[WORKER_SCRIPT] = (load_runtime(effect["worker_runtime"]) + "\n" + effect["worker_code"]).encode("utf-8")
+    return {
+        "runtime": load_runtime(effect.get("runtime", ())),
+        "global_vars": effect["global_vars"],
+        "preload": effect.get("preload", ""),
+        "draw_loop": effect["draw_loop"],
+        "assets": assets,
+        "adaptive_scale": "false" if set(effect.get("cost", ())) & set(FIXED_SCALE_COSTS) else "true",
+        "frame_gated": "true" if is_frame_gated(effect) else "false",
+    }
+
+def is_frame_gated(effect):
+    """True when the effect's output only depends on the camera frame and
+    paramA/B, so the sketch can skip draws that have neither changed."""
+    if set(effect.get("cost", ())) & set(FIXED_SCALE_COSTS):
+        return False
+    if "worker_code" in effect:  # results arrive between camera frames; the worker client skips repeats itself
+        return False
+    return not ANIMATED.search(effect["global_vars"] + effect["draw_loop"])
+
+def worker_effect(key, use_luts=True, pool=None):
+    """The Web Worker build of an effect when its kernel allows one, else the usual build."""
+    if EFFECTS[key].get("kernel"):
+        try:
+            return compile_worker([key], use_luts, pool)
+        except ChainError as e:
+            print(f"• {e}; building it for the page")
+    return compile_effect(key, use_luts)
+
+def with_source(effect, source="camera"):
+    """effect as is for the webcam, otherwise a copy that reads a deterministic
+    synthetic source (runtime/synthetic.js): a test pattern from SOURCES or
+    "clip:<path>" for a looped local video, copied next to the sketch."""
+    if source == "camera":
+        return effect
+    assets = dict(effect.get("assets", {}))
+    if source.startswith("clip:"):
+        path = source[len("clip:"):]
+        with open(path, 'rb') as f:
+            clip = "clip" + os.path.splitext(path)[1].lower()
+            assets[clip] = f.read()
+        config = {"pattern": "clip", "clip": clip}
+    elif source in SOURCES:
+        config = {"pattern": source}
+    else:
+        raise ValueError(f"Unknown source: {source} (expected one of {', '.join(SOURCES)} or clip:<path>)")
+    return dict(
+        effect,
+        runtime=["synthetic"] + [name for name in effect.get("runtime", ()) if name != "synthetic"],
+        global_vars=f"const SYNTHETIC_SOURCE = {json.dumps(config)};\n" + effect["global_vars"],
+        assets=assets,
+    )
+
+def compile_sketch(sources, base_js):
+    # Replace placeholders with effect logic
+    final_js = base_js.replace("{{RUNTIME}}", sources["runtime"])
+    final_js = final_js.replace("{{GLOBAL_VARS}}", sources["global_vars"])
+    final_js = final_js.replace("{{PRELOAD}}", sources["preload"])
+    final_js = final_js.replace("{{ADAPTIVE_SCALE}}", sources["adaptive_scale"])
+    final_js = final_js.replace("{{FRAME_GATED}}", sources["frame_gated"])
+    return final_js.replace("{{DRAW_LOOP_LOGIC}}", sources["draw_loop"])
+
+def build_hash(sources, base_js, base_html):
+    # Everything that ends up in output/<id>/ feeds the hash, so a change to
+    # either template invalidates the whole catalog while an effect edit only
+    # invalidates that effect.
+    h = hashlib.sha256()
+    parts = [sources["runtime"], sources["global_vars"], sources["preload"], sources["draw_loop"],
+             sources["adaptive_scale"], sources["frame_gated"], base_js, base_html]
+    for filename, data in sorted(sources["assets"].items()):
+        parts += [filename, data]
+    for part in parts:
+        h.update(part if isinstance(part, bytes) else part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+def read_build_hash(out_dir):
+    try:
+        with open(os.path.join(out_dir, HASH_FILE), 'r') as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return None
+
+def parse_selection(tokens):
+    """Turns ["21", "40-45", "all"] style tokens into an ordered list of EFFECTS keys."""
+    if not tokens or "all" in tokens:
+        return list(EFFECTS.keys())
+
+    keys = []
+    for token in ",".join(tokens).split(","):
+        token = token.strip()
+        if not token:
+            continue
+        if "-" in token:
+            start, end = token.split("-", 1)
+            candidates = [str(i) for i in range(int(start), int(end) + 1)]
         else:
-            super().do_GET()
+            candidates = [token]
+        for key in candidates:
+            if key not in EFFECTS:
+                raise ValueError(f"Unknown effect id: {key}")
+            if key not in keys:
+                keys.append(key)
+    return keys
+
+def compile_html(sources, base_html, p5_src):
+    hints = [f'<link rel="preload" href="{p5_src}" as="script" crossorigin>',
+             '<link rel="preload" href="sketch.js" as="script">']
+    # Videos are streamed by the <video> element and the worker script is
+    # loaded by new Worker(); neither can reuse a fetch preload
+    hints += [f'<link rel="preload" href="{filename}" as="fetch" crossorigin>' for filename in sorted(sources["assets"])
+              if filename != WORKER_SCRIPT and not (mimetypes.guess_type(filename)[0] or "").startswith("video/")]
+    final_html = base_html.replace("{{PRELOAD_HINTS}}", "\n    ".join(hints))
+    return final_html.replace("{{P5_SRC}}", p5_src)
+
+def p5_src_for(out_dir, p5_name):
+    if "://" in p5_name:
+        return p5_name
+    return os.path.relpath(os.path.join(OUTPUT_DIR, p5_name), out_dir).replace(os.sep, "/")
+
+def write_sketch(out_dir, sources, base_js, base_html, p5_name, quiet=False):
+    write_output("sketch.js", compile_sketch(sources, base_js), out_dir, quiet)
+    write_output("index.html", compile_html(sources, base_html, p5_src_for(out_dir, p5_name)), out_dir, quiet)
+    for filename, data in sources["assets"].items():
+        write_output(filename, data, out_dir, quiet)
+
+def build_effect(name, sources, base_js, base_html, p5_name, digest):
+    # Runs inside a pool worker: everything it needs is passed in explicitly
+    out_dir = os.path.join(OUTPUT_DIR, name)
+    write_sketch(out_dir, sources, base_js, base_html, p5_name, quiet=True)
+    # Written last so an interrupted build is never mistaken for a fresh one
+    write_output(HASH_FILE, digest, out_dir, quiet=True)
+    return name
+
+def build_catalog(targets, jobs=None, force=False):
+    """Builds each (output name, effect) pair of targets into output/<name>/."""
+    start = time.perf_counter()
+    base_js = load_template(SKETCH_TEMPLATE)
+    base_html = load_template(HTML_TEMPLATE)
+    p5_name = publish_p5()
+
+    # 1. Work out what is stale (cheap, done in this process)
+    pending = []
+    for name, effect in targets:
+        sources = sketch_sources(effect)
+        digest = build_hash(sources, base_js, base_html + p5_name)
+        if force or read_build_hash(os.path.join(OUTPUT_DIR, name)) != digest:
+            pending.append((name, effect["name"], sources, digest))
 
-class ReusableTCPServer(socketserver.TCPServer):
-    allow_reuse_address = True
+    # 2. Fan the stale effects out over a process pool
+    if len(pending) == 1 or jobs == 1:
+        for name, title, sources, digest in pending:
+            build_effect(name, sources, base_js, base_html, p5_name, digest)
+            print(f"✓ Built [{name}] {title}")
+    elif pending:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [(title, pool.submit(build_effect, name, sources, base_js, base_html, p5_name, digest))
+                       for name, title, sources, digest in pending]
+            for title, future in futures:
+                print(f"✓ Built [{future.result()}] {title}")
 
-def start_server():
-    print(f"Serving '{OUTPUT_DIR}/' at http://localhost:{PORT}")
-    print("Press Ctrl+C to stop.")
-    webbrowser.open(f"http://localhost:{PORT}")
-    with ReusableTCPServer(("", PORT), Handler) as httpd:
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"\n{len(pending)} built, {len(targets) - len(pending)} up to date ({elapsed:.1f} ms)")
+    return [name for name, _, _, _ in pending]
+
+def start_server(path=""):
+    url = f"http://localhost:{PORT}/{path}"
+    with make_server(OUTPUT_DIR, PORT) as httpd:
+        # The socket is bound and listening once the server exists, so the
+        # browser's first request can never race the server start
+        print(f"Serving '{OUTPUT_DIR}/' at {url}")
+        print("Press Ctrl+C to stop.")
+        threading.Thread(target=webbrowser.open, args=(url,), daemon=True).start()
         try:
             httpd.serve_forever()
         except KeyboardInterrupt:
             print("\nServer stopped.")
             httpd.server_close()
+            run_shutdown_hooks()
 
-def main():
+def interactive():
     print("========================================")
     print("   PixelSynth - Sketch Generator  ")
     print("========================================")
-    
+
     # 1. Menu Selection
     print("\nSelect an effect:")
     for key, effect in EFFECTS.items():
         print(f"[{key}] {effect['name']} - {effect['description']}")
-    
+
     choice = input("\nEnter choice (1-108): ").strip()
-    
+
     if choice not in EFFECTS:
         print("Invalid selection. Exiting.")
         sys.exit(1)
-        
-    selected_effect = EFFECTS[choice]
+
+    selected_effect = compile_effect(choice)
     print(f"\nGenerating '{selected_effect['name']}'...")
-    
+
     # 2. Read Templates
     try:
         base_js = load_template(SKETCH_TEMPLATE)
@@ -81,17 +327,119 @@ def main():
         print(f"Error: Could not find template files. {e}")
         sys.exit(1)
 
-    # 3. Inject Logic
-    # Replace placeholders with effect logic
-    final_js = base_js.replace("{{GLOBAL_VARS}}", selected_effect["global_vars"])
-    final_js = final_js.replace("{{DRAW_LOOP_LOGIC}}", selected_effect["draw_loop"])
-    
-    # 4. Write Output
-    write_output("sketch.js", final_js)
-    write_output("index.html", base_html)
-    
+    # 3. Inject Logic and Write Output
+    write_sketch(OUTPUT_DIR, sketch_sources(selected_effect), base_js, base_html, publish_p5())
+
     print("\nSuccess! Starting server...")
     start_server()
 
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="PixelSynth sketch generator. Runs the interactive menu when no command is given.")
+    commands = parser.add_subparsers(dest="command")
+
+    build = commands.add_parser("build", help="Build effects into output/<id>/ without prompting")
+    build.add_argument("effects", nargs="*", help="Effect ids or ranges (e.g. 21 40-45), or 'all' (default)")
+    build.add_argument("-j", "--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    build.add_argument("-f", "--force", action="store_true", help="Rebuild even if the content hash is unchanged")
+    build.add_argument("--no-lut", action="store_true", help="Keep per-pixel arithmetic instead of baked lookup tables")
+    build.add_argument("--source", default="camera", metavar="SOURCE",
+                       help="Input: camera (default), a synthetic pattern (bars, noise, gradient) or clip:<path>")
+    build.add_argument("--worker", action="store_true",
+                       help="Run pixel kernels in a Web Worker where possible, keeping the page responsive")
+    build.add_argument("--workers", type=int, metavar="N",
+                       help="Like --worker, but N workers (0: one per core) each process a band of the frame")
+    build.add_argument("--serve", action="store_true", help="Start the server after building")
+
+    chain = commands.add_parser("chain", help="Fuse several effects into one sketch in output/chain-<ids>/")
+    chain.add_argument("effects", nargs="+", help="Effect ids in processing order (e.g. 23 88 84)")
+    chain.add_argument("-f", "--force", action="store_true", help="Rebuild even if the content hash is unchanged")
+    chain.add_argument("--no-lut", action="store_true", help="Keep per-pixel arithmetic instead of baked lookup tables")
+    chain.add_argument("--source", default="camera", metavar="SOURCE",
+                       help="Input: camera (default), a synthetic pattern (bars, noise, gradient) or clip:<path>")
+    chain.add_argument("--worker", action="store_true", help="Run the fused passes in a Web Worker")
+    chain.add_argument("--workers", type=int, metavar="N",
+                       help="Like --worker, but N workers (0: one per core) each process a band of the frame")
+    chain.add_argument("--serve", action="store_true", help="Start the server after building")
+
+    dev = commands.add_parser("dev", help="Build, serve and rebuild on every edit, reloading open pages")
+    dev.add_argument("effects", nargs="*", help="Effect ids or ranges (e.g. 21 40-45), or 'all' (default)")
+    dev.add_argument("--chain", action="append", default=[], metavar="IDS",
+                     help="Also develop a fused chain, ids separated by commas (e.g. 23,88,84); repeatable")
+    dev.add_argument("--hot", action="store_true", help="Swap edited draw loops into running sketches instead of reloading")
+    dev.add_argument("--no-lut", action="store_true", help="Keep per-pixel arithmetic instead of baked lookup tables")
+    dev.add_argument("--source", default="camera", metavar="SOURCE",
+                       help="Input: camera (default), a synthetic pattern (bars, noise, gradient) or clip:<path>")
+
+    bench = commands.add_parser("bench", help="Time effects in a browser on a synthetic input and print a table")
+    bench.add_argument("effects", nargs="*", help="Effect ids or ranges (e.g. 21 40-45), or 'all' (default)")
+    bench.add_argument("--warmup", type=int, default=10, help="Untimed frames per param point (default: 10)")
+    bench.add_argument("--frames", type=int, default=30, help="Measured frames per param point (default: 30)")
+    bench.add_argument("--grid", type=int, default=3, help="paramA/paramB steps, giving grid x grid points (default: 3)")
+    bench.add_argument("--browser", help="Chromium/Chrome executable (default: found on PATH, else the system browser)")
+    bench.add_argument("--headless", action="store_true", help="Run Chromium headless, e.g. on CI")
+    bench.add_argument("--timeout", type=float, default=60, help="Seconds to wait for an effect before skipping it")
+    bench.add_argument("--no-lut", action="store_true", help="Keep per-pixel arithmetic instead of baked lookup tables")
+    bench.add_argument("--source", default="bars", metavar="SOURCE",
+                       help="Synthetic input: bars (default), noise, gradient or clip:<path>")
+    bench.add_argument("--json", help="Where to write the results (default: output/bench/results.json)")
+
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    if args.command is None:
+        interactive()
+        return
+
+    if args.command == "dev":
+        import devserver  # imports this module, so it can't be imported at the top
+        try:
+            targets = {}
+            if args.effects or not args.chain:
+                targets = {key: [key] for key in parse_selection(args.effects)}
+            for chain in args.chain:
+                keys = [key.strip() for key in chain.split(",") if key.strip()]
+                compile_chain(keys, not args.no_lut)  # fail early on unknown or unchainable ids
+                targets["chain-" + "-".join(keys)] = keys
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        devserver.serve(targets, not args.no_lut, args.hot, args.source)
+        return
+
+    if args.command == "bench":
+        import bench  # imports this module, so it can't be imported at the top
+        try:
+            bench.run(parse_selection(args.effects), args.warmup, args.frames, args.grid, args.browser,
+                      args.headless, args.timeout, not args.no_lut, args.json, args.source)
+        except (ValueError, FileNotFoundError) as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        return
+
+    try:
+        in_worker = args.worker or args.workers is not None
+        if args.command == "chain":
+            if in_worker:
+                effect = compile_worker(args.effects, not args.no_lut, args.workers)
+            else:
+                effect = compile_chain(args.effects, not args.no_lut)
+            targets = [("chain-" + "-".join(args.effects), with_source(effect, args.source))]
+            build_catalog(targets, jobs=1, force=args.force)
+        else:
+            if in_worker:
+                build_one = lambda key: worker_effect(key, not args.no_lut, args.workers)
+            else:
+                build_one = lambda key: compile_effect(key, not args.no_lut)
+            targets = [(key, with_source(build_one(key), args.source)) for key in parse_selection(args.effects)]
+            build_catalog(targets, jobs=args.jobs, force=args.force)
+    except (ValueError, OSError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    if args.serve:
+        start_server(f"{targets[0][0]}/" if len(targets) == 1 else "")
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,186 @@
+"""
+PixelSynth Lookup Tables
+Build-time NumPy versions of colour effects whose output only depends on the
+input value and paramA, so the sketch can replace their per-pixel arithmetic
+with table lookups.
+
+Three kinds of table are supported, selected by the effect's "lut" field in
+effects/index.json:
+  - "channel": one 256-entry Uint8 table per paramA bin, applied to R, G and B
+  - "luma":    one RGB palette per paramA bin, indexed by r + g + b (0..765)
+               so the (r + g + b) / 3 the effects use never has to be computed
+  - "3d":      a LUT3D_SIZE^3 RGB cube per paramA bin for transforms that mix
+               channels. Cubes are shipped as a binary asset and interpolated
+               tetrahedrally by runtime/luts.js.
+
+New colour grades only need a function in COLOR_CUBES and an index entry
+with "lut": "3d" and "kernel": "pixel"; no per-pixel JS has to be written.
+
+Each function below mirrors its effect's JS (including p5's map()) in float64
+so the tables match what the JS would have written into pixels[].
+"""
+import base64
+import numpy as np
+
+LUT_BINS = 64
+LUMA_SIZE = 766
+LUT3D_SIZE = 33
+
+def p5_map(value, start1, stop1, start2, stop2):
+    return (value - start1) / (stop1 - start1) * (stop2 - start2) + start2
+
+# Channel tables: f(v, paramA) -> output for v = 0..255
+
+def posterization(v, param_a):
+    levels = np.floor(p5_map(param_a, 0, 1, 2, 8))
+    bin_size = 255 / (levels - 1)
+    return np.floor(v / 255 * (levels - 1) + 0.5) * bin_size
+
+def bit_crush(v, param_a):
+    bits = np.floor(p5_map(param_a, 0, 1, 1, 8))
+    factor = 255 / (2 ** bits - 1)
+    return np.floor(v / factor) * factor
+
+def contrast_stretch(v, param_a):
+    contrast = p5_map(param_a, 0, 1, 1, 5)
+    intercept = 128 * (1 - contrast)
+    return np.clip(v * contrast + intercept, 0, 255)
+
+def pastel(v, param_a):
+    levels = np.floor(p5_map(param_a, 0, 1, 4, 12))
+    bin_size = 255 / levels
+    return np.clip(np.floor(v / bin_size) * bin_size + bin_size / 2 + 20, 0, 255)
+
+def color_banding(v, param_a):
+    bands = np.floor(p5_map(param_a, 0, 1, 2, 32))
+    factor = 255 / (bands - 1)
+    return np.floor(v / factor) * factor
+
+# Luma palettes: f(sum, paramA) -> (r, g, b) for sum = r + g + b = 0..765
+
+def heatmap(total, param_a):
+    shift = p5_map(param_a, 0, 1, -50, 50)
+    val = np.clip(total / 3 + shift, 0, 255)
+    cold = val < 128
+    r = np.where(cold, 0, p5_map(val, 128, 255, 0, 255))
+    g = np.where(cold, p5_map(val, 0, 128, 0, 255), p5_map(val, 128, 255, 255, 0))
+    b = np.where(cold, p5_map(val, 0, 128, 255, 0), 0)
+    return r, g, b
+
+def duotone(total, param_a):
+    t = total / 3 / 255
+    return 50 + (200 - 50) * t, 0 + (255 - 0) * t, 150 + (50 - 150) * t
+
+def threshold(total, param_a):
+    val = np.where(total / 3 > p5_map(param_a, 0, 1, 0, 255), 255, 0)
+    return val, val, val
+
+# Colour cubes: f(r, g, b, paramA) -> (r, g, b) on the LUT3D_SIZE^3 grid
+
+def sepia(r, g, b, param_a):
+    amount = p5_map(param_a, 0, 1, 0.5, 1.0)
+    tr = np.clip(r * 0.393 + g * 0.769 + b * 0.189, 0, 255)
+    tg = np.clip(r * 0.349 + g * 0.686 + b * 0.168, 0, 255)
+    tb = np.clip(r * 0.272 + g * 0.534 + b * 0.131, 0, 255)
+    return r + (tr - r) * amount, g + (tg - g) * amount, b + (tb - b) * amount
+
+def rgb_to_hsl(r, g, b):
+    """Vectorised version of the RGB -> HSL conversion the effects use
+    (hue in 0..1, ties between channels resolved in r, g, b order)."""
+    rn, gn, bn = r / 255, g / 255, b / 255
+    high = np.maximum(np.maximum(rn, gn), bn)
+    low = np.minimum(np.minimum(rn, gn), bn)
+    l = (high + low) / 2
+    d = high - low
+    grey = d == 0
+    safe_d = np.where(grey, 1, d)
+    s = np.where(grey, 0, np.where(l > 0.5, d / np.where(grey, 1, 2 - high - low), d / np.where(grey, 1, high + low)))
+    h = np.where(high == rn, (gn - bn) / safe_d + np.where(gn < bn, 6, 0),
+                 np.where(high == gn, (bn - rn) / safe_d + 2, (rn - gn) / safe_d + 4))
+    return np.where(grey, 0, h / 6), s, l
+
+def hue_to_rgb(p, q, t):
+    t = np.where(t < 0, t + 1, t)
+    t = np.where(t > 1, t - 1, t)
+    return np.where(t < 1 / 6, p + (q - p) * 6 * t,
+                    np.where(t < 1 / 2, q, np.where(t < 2 / 3, p + (q - p) * (2 / 3 - t) * 6, p)))
+
+def inverted_luma(r, g, b, param_a):
+    h, s, l = rgb_to_hsl(r, g, b)
+    l = 1 - l
+    q = np.where(l < 0.5, l * (1 + s), l + s - l * s)
+    p = 2 * l - q
+    grey = s == 0
+    return (np.where(grey, l, hue_to_rgb(p, q, h + 1 / 3)) * 255,
+            np.where(grey, l, hue_to_rgb(p, q, h)) * 255,
+            np.where(grey, l, hue_to_rgb(p, q, h - 1 / 3)) * 255)
+
+def color_isolation(r, g, b, param_a):
+    target_hue = p5_map(param_a, 0, 1, 0, 360)
+    h, _, _ = rgb_to_hsl(r, g, b)
+    hue_dist = np.abs(h * 360 - target_hue)
+    hue_dist = np.where(hue_dist > 180, 360 - hue_dist, hue_dist)
+    gray = (r + g + b) / 3
+    keep = hue_dist < 30
+    return np.where(keep, r, gray), np.where(keep, g, gray), np.where(keep, b, gray)
+
+CHANNEL_LUTS = {
+    "21": posterization,
+    "27": bit_crush,
+    "31": contrast_stretch,
+    "74": pastel,
+    "88": color_banding,
+}
+
+LUMA_PALETTES = {
+    "22": heatmap,
+    "24": duotone,
+    "26": threshold,
+}
+
+# Effect id -> (cube function, paramA bins). Effects that ignore paramA need one bin.
+COLOR_CUBES = {
+    "23": (sepia, 16),
+    "25": (inverted_luma, 1),
+    "28": (color_isolation, 24),
+}
+
+def to_bytes(values):
+    # Same conversion Uint8ClampedArray applies on store: clamp, then round half to even
+    return np.rint(np.clip(np.nan_to_num(values), 0, 255)).astype(np.uint8)
+
+def build_table(key, kind, bins=LUT_BINS):
+    """Returns (table, offsets): the concatenated Uint8 tables for every
+    paramA bin, and the start of each bin's table. Bins that produce the same
+    table (e.g. all paramA values that floor() to the same level count) share
+    one copy."""
+    if kind == "channel":
+        fn, inputs = CHANNEL_LUTS[key], np.arange(256, dtype=np.float64)
+        make = lambda a: to_bytes(fn(inputs, a))
+    elif kind == "3d":
+        fn, bins = COLOR_CUBES[key]
+        r, g, b = np.meshgrid(*[np.linspace(0, 255, LUT3D_SIZE)] * 3, indexing="ij")
+        make = lambda a: to_bytes(np.stack(np.broadcast_arrays(*fn(r, g, b, a)), axis=-1)).ravel()
+    elif kind == "luma":
+        fn, inputs = LUMA_PALETTES[key], np.arange(LUMA_SIZE, dtype=np.float64)
+        make = lambda a: to_bytes(np.stack(np.broadcast_arrays(*fn(inputs, a)), axis=1)).ravel()
+    else:
+        raise ValueError(f"Unknown LUT kind: {kind}")
+
+    tables, offsets, seen = [], [], {}
+    size = 0
+    for param_a in np.linspace(0, 1, bins) if bins > 1 else [0.0]:
+        table = make(param_a).tobytes()
+        if table not in seen:
+            seen[table] = size
+            tables.append(table)
+            size += len(table)
+        offsets.append(seen[table])
+    return b"".join(tables), offsets
+
+def has_table(key, kind):
+    tables = {"channel": CHANNEL_LUTS, "luma": LUMA_PALETTES, "3d": COLOR_CUBES}
+    return key in tables.get(kind, {})
+
+def encode(table):
+    return base64.b64encode(table).decode("ascii")
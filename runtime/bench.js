@@ -0,0 +1,100 @@
+// Benchmark driver, only included in pages built by `generator.py bench`
+//
+// Sweeps paramA/paramB over a grid (?grid=3 gives 3 x 3 points). At each
+// point the sketch runs ?warmup= frames untimed, then ?frames= measured
+// frames; for every measured frame it records the time from p5's 'pre' to
+// its 'post' hook, the number of p5 drawing calls and, where the browser
+// exposes performance.memory, how much the JS heap grew. The results are
+// POSTed to /bench, whose reply names the next page to open.
+const BENCH = (() => {
+  const query = new URLSearchParams(location.search);
+  return {
+    warmup: Number(query.get('warmup') || 10),
+    frames: Number(query.get('frames') || 30),
+    grid: Math.max(1, Number(query.get('grid') || 3)),
+  };
+})();
+const BENCH_DRAW_CALLS = ['point', 'line', 'rect', 'square', 'circle', 'ellipse', 'arc', 'triangle', 'quad',
+  'bezier', 'curve', 'vertex', 'image', 'text'];
+
+const bench = {
+  point: 0,
+  frame: 0,
+  start: 0,
+  heap: 0,
+  drawCalls: 0,
+  current: null,
+  points: [],
+  done: false,
+};
+
+function benchPoint(point) {
+  const steps = BENCH.grid - 1;
+  const a = steps ? (point % BENCH.grid) / steps : 0.5;
+  const b = steps ? Math.floor(point / BENCH.grid) / steps : 0.5;
+  return { params: [a, b], frameMs: [], loadPixelsMs: [], updatePixelsMs: [], drawCalls: [], heapBytes: [] };
+}
+
+function benchHeap() {
+  return performance.memory ? performance.memory.usedJSHeapSize : null;
+}
+
+function benchSend(report) {
+  bench.done = true;
+  noLoop();
+  report.page = location.pathname;
+  fetch('/bench', { method: 'POST', body: JSON.stringify(report) })
+    .then((response) => response.json())
+    .then((reply) => { if (reply.next) location.href = reply.next; });
+}
+
+p5.prototype.registerMethod('pre', function () {
+  if (bench.done) return;
+  if (!bench.current) {
+    // First frame: count drawing calls from here on
+    for (const name of BENCH_DRAW_CALLS) {
+      const original = window[name];
+      if (typeof original !== 'function') continue;
+      window[name] = function () {
+        bench.drawCalls++;
+        return original.apply(this, arguments);
+      };
+    }
+    bench.current = benchPoint(0);
+  }
+  // draw() turns the mouse position into paramA/paramB
+  mouseX = bench.current.params[0] * width;
+  mouseY = bench.current.params[1] * height;
+  bench.drawCalls = 0;
+  bench.heap = benchHeap();
+  bench.start = performance.now();
+});
+
+p5.prototype.registerMethod('post', function () {
+  if (bench.done || !bench.current) return;
+  const ms = performance.now() - bench.start;
+  const current = bench.current;
+  if (bench.frame >= BENCH.warmup) {
+    const heap = benchHeap();
+    current.frameMs.push(ms);
+    current.loadPixelsMs.push(phaseMs.loadPixels);
+    current.updatePixelsMs.push(phaseMs.updatePixels);
+    current.drawCalls.push(bench.drawCalls);
+    if (heap !== null) current.heapBytes.push(Math.max(0, heap - bench.heap));
+  }
+  bench.frame++;
+  if (bench.frame < BENCH.warmup + BENCH.frames) return;
+
+  bench.points.push(current);
+  bench.point++;
+  bench.frame = 0;
+  if (bench.point < BENCH.grid * BENCH.grid) {
+    bench.current = benchPoint(bench.point);
+  } else {
+    benchSend({ points: bench.points });
+  }
+});
+
+window.addEventListener('error', (event) => {
+  if (!bench.done) benchSend({ error: event.message });
+});
@@ -0,0 +1,29 @@
+// Live reload client, only included in sketches built by `generator.py dev`
+//
+// The dev server announces every rebuild on /events. A page reloads when its
+// own sketch was rebuilt, or, when the server runs with --hot and only the
+// draw loop changed, swaps in the new drawEffect() and keeps every global
+// (frame history, particles, paused state) as it was.
+(function () {
+  if (!window.EventSource) return;
+  const page = location.pathname.replace(/index\.html$/, '');
+  const events = new EventSource('/events');
+  events.onmessage = (message) => {
+    const change = JSON.parse(message.data);
+    if (change.page !== page && change.page !== '*') return;
+    if (change.action === 'error') {
+      console.error(`Rebuild failed: ${change.message}`);
+      return;
+    }
+    if (change.action === 'swap') {
+      try {
+        drawEffect = new Function(change.draw_loop);
+        console.log(`Hot-swapped draw loop (rebuilt in ${change.ms.toFixed(0)} ms)`);
+        return;
+      } catch (e) {
+        console.warn('Hot swap failed, reloading instead.', e);
+      }
+    }
+    location.reload();
+  };
+})();
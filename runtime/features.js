@@ -0,0 +1,85 @@
+// Per-frame feature planes of the camera image
+//
+// Edge, flow and motion effects start from the same derived images. Each
+// plane is computed from grabFrame() the first time it is asked for in a
+// frame, into typed arrays allocated once per canvas size, and every later
+// caller in that frame gets the same array back. Planes hold one value per
+// pixel, indexed x + y * width.
+//
+//   featureLuma()        Float32Array of (r + g + b) / 3
+//   featureGradient()    { ix, iy, magnitude }: 3x3 Sobel responses on the
+//                        luma plane, 0 along the border
+//   featurePrevLuma()    luma of the frame before, i.e. the last frame
+//                        featureLuma() ran on (the current one at first)
+//   featureDifference()  |luma - previous luma|
+const features = {
+  width: 0,
+  height: 0,
+  luma: null,
+  prevLuma: null,
+  ix: null,
+  iy: null,
+  magnitude: null,
+  difference: null,
+  lumaFrame: -1, // grabFrame().frame each plane was last computed for
+  prevFrame: -1,
+  gradientFrame: -1,
+  differenceFrame: -1,
+};
+
+function featureResize(w, h) {
+  if (features.width === w && features.height === h) return;
+  const n = w * h;
+  features.width = w;
+  features.height = h;
+  for (const plane of ['luma', 'prevLuma', 'ix', 'iy', 'magnitude', 'difference']) features[plane] = new Float32Array(n);
+  features.lumaFrame = features.prevFrame = features.gradientFrame = features.differenceFrame = -1;
+}
+
+function featureLuma() {
+  const frame = grabFrame();
+  featureResize(frame.width, frame.height);
+  if (features.lumaFrame === frame.frame) return features.luma;
+  // The plane being replaced becomes the previous frame's
+  const previous = features.luma;
+  features.luma = features.prevLuma;
+  features.prevLuma = previous;
+  features.prevFrame = features.lumaFrame;
+
+  const src = frame.rgba, luma = features.luma;
+  for (let p = 0, i = 0; p < luma.length; p++, i += 4) luma[p] = (src[i] + src[i + 1] + src[i + 2]) / 3;
+  features.lumaFrame = frame.frame;
+  return luma;
+}
+
+function featureGradient() {
+  const luma = featureLuma();
+  if (features.gradientFrame === features.lumaFrame) return features;
+  const { width: w, height: h, ix, iy, magnitude } = features;
+  for (let y = 1; y < h - 1; y++) {
+    for (let x = 1, p = y * w + 1; x < w - 1; x++, p++) {
+      const up = p - w, down = p + w;
+      const gx = -luma[up - 1] - 2 * luma[p - 1] - luma[down - 1] + luma[up + 1] + 2 * luma[p + 1] + luma[down + 1];
+      const gy = -luma[up - 1] - 2 * luma[up] - luma[up + 1] + luma[down - 1] + 2 * luma[down] + luma[down + 1];
+      ix[p] = gx;
+      iy[p] = gy;
+      magnitude[p] = Math.sqrt(gx * gx + gy * gy);
+    }
+  }
+  features.gradientFrame = features.lumaFrame;
+  return features;
+}
+
+function featurePrevLuma() {
+  featureLuma();
+  return features.prevFrame === -1 ? features.luma : features.prevLuma;
+}
+
+function featureDifference() {
+  const luma = featureLuma();
+  if (features.differenceFrame === features.lumaFrame) return features.difference;
+  const previous = featurePrevLuma(), difference = features.difference;
+  for (let p = 0; p < luma.length; p++) difference[p] = Math.abs(luma[p] - previous[p]);
+  features.differenceFrame = features.lumaFrame;
+  return difference;
+}
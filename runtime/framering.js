@@ -0,0 +1,226 @@
+// Fixed-size history of camera frames
+//
+// Temporal effects keep the last N frames. createFrameRing() allocates all
+// N slots up front in one typed array, so push() only copies a frame into
+// the oldest slot (no p5.Image per frame, no Array.shift(), nothing for the
+// GC), and get(age) is an index computation. Frames can be stored smaller
+// than the canvas (scale) and with fewer channels (format), and every ring
+// declares the most memory it may take: when the frames asked for don't fit
+// in maxBytes, the ring keeps as many as do and says so on the console (or,
+// with keepFrames, stores them at a lower resolution instead).
+//
+//   const history = createFrameRing({
+//     frames: 50,             // slots
+//     maxBytes: 64 << 20,     // hard cap on the slots' memory
+//     format: 'rgba',         // 'rgba', 'rgb' (packed), 'luma' or one of 'r', 'g', 'b'
+//     scale: 1,               // e.g. 0.25 stores a quarter of the width and height
+//     keepFrames: false,      // shrink the slots rather than drop frames to fit maxBytes
+//   });
+//   history.push();           // grabFrame() into the next slot
+//   history.get(0);           // newest frame (Uint8ClampedArray), get(1) the one before...
+//   history.get32(0);         // the same as a Uint32Array, RGBA rings only
+//
+// Slots are history.width x history.height pixels of history.channels bytes,
+// row-major, all in one buffer (so use get32() rather than view32() on
+// them). The ring resizes, and forgets its frames, when the canvas does.
+// Gathers that read many frames at once can index history.data (or .data32)
+// directly: the frame of a given age starts at history.index(age) slots, and
+// history.pixelMap(width, height) gives the stored pixel under each canvas
+// pixel (null when the slots are canvas sized).
+//
+// createFrameSum() keeps Uint32 sums of the newest frames of such a ring, for
+// box averages over a window whose length can change every frame:
+//
+//   const average = createFrameSum({ frames: 100, maxBytes: 256 << 20, format: 'rgb' });
+//   average.push(n);          // push grabFrame(), then sum the newest n frames
+//   average.sum[j] / average.count
+//
+// Each push adds the new frame and subtracts the one leaving the window; a
+// new length adds or subtracts only the frames in between.
+const FRAME_RING_FORMATS = {
+  rgba: { channels: 4, offset: 0 },
+  rgb: { channels: 3, offset: 0 },
+  luma: { channels: 1, offset: -1 },
+  r: { channels: 1, offset: 0 },
+  g: { channels: 1, offset: 1 },
+  b: { channels: 1, offset: 2 },
+};
+
+function createFrameRing(options) {
+  const format = FRAME_RING_FORMATS[options.format || 'rgba'];
+  if (!format) throw new Error(`Frame ring: unknown format ${options.format}`);
+  if (!options.maxBytes) throw new Error('Frame ring: maxBytes is required');
+  const scale = options.scale || 1;
+  const frames = Math.max(1, Math.floor(options.frames) || 1); // whole slots
+  let sourceW = 0, sourceH = 0;
+  let xs = null, ys = null; // source column and row of every stored pixel
+  let slots = [];
+  let slots32 = [];
+  let newest = -1;
+  let mapKey = '';
+  let map = null;
+
+  const ring = {
+    width: 0,
+    height: 0,
+    channels: format.channels,
+    capacity: 0,
+    length: 0, // frames pushed so far, up to capacity
+    bytes: 0,
+    data: null,
+    data32: null,
+
+    push(frame = grabFrame()) {
+      if (frame.width !== sourceW || frame.height !== sourceH) allocate(frame.width, frame.height);
+      newest = (newest + 1) % ring.capacity;
+      store(frame, slots[newest]);
+      if (ring.length < ring.capacity) ring.length++;
+      return slots[newest];
+    },
+
+    get(age) {
+      // Ages past the oldest frame give the oldest frame
+      if (ring.length === 0) return null;
+      return slots[slotOf(age)];
+    },
+
+    get32(age) {
+      if (ring.length === 0) return null;
+      return slots32[slotOf(age)];
+    },
+
+    index(age) {
+      return slotOf(age);
+    },
+
+    pixelMap(w, h) {
+      const key = [w, h, ring.width, ring.height].join();
+      if (key === mapKey) return map;
+      mapKey = key;
+      map = null;
+      if (ring.width === w && ring.height === h) return map;
+      map = new Int32Array(w * h);
+      for (let y = 0, p = 0; y < h; y++) {
+        const row = Math.min(ring.height - 1, Math.floor((y + 0.5) * ring.height / h)) * ring.width;
+        for (let x = 0; x < w; x++, p++) map[p] = row + Math.min(ring.width - 1, Math.floor((x + 0.5) * ring.width / w));
+      }
+      return map;
+    },
+
+    clear() {
+      ring.length = 0;
+      newest = -1;
+    },
+  };
+
+  function slotOf(age) {
+    age = Math.min(Math.max(age | 0, 0), ring.length - 1);
+    return (newest - age + ring.capacity) % ring.capacity;
+  }
+
+  function allocate(w, h) {
+    sourceW = w;
+    sourceH = h;
+    ring.width = Math.max(1, Math.round(w * scale));
+    ring.height = Math.max(1, Math.round(h * scale));
+    const wanted = ring.width * ring.height * format.channels * frames;
+    if (options.keepFrames && wanted > options.maxBytes) {
+      const fit = Math.sqrt(options.maxBytes / (w * h * format.channels * frames));
+      ring.width = Math.max(1, Math.floor(w * fit));
+      ring.height = Math.max(1, Math.floor(h * fit));
+      console.log(`Frame ring: storing ${frames} frames at ${ring.width}x${ring.height} to fit ` +
+        `${(options.maxBytes / 1048576).toFixed(1)} MB`);
+    }
+    xs = new Int32Array(ring.width);
+    ys = new Int32Array(ring.height);
+    for (let x = 0; x < ring.width; x++) xs[x] = Math.min(w - 1, Math.floor((x + 0.5) * w / ring.width));
+    for (let y = 0; y < ring.height; y++) ys[y] = Math.min(h - 1, Math.floor((y + 0.5) * h / ring.height));
+
+    const frameBytes = ring.width * ring.height * format.channels;
+    ring.capacity = Math.max(1, Math.min(frames, Math.floor(options.maxBytes / frameBytes)));
+    if (ring.capacity < frames) {
+      console.warn(`Frame ring: ${frames} frames of ${ring.width}x${ring.height} need ` +
+        `${(frames * frameBytes / 1048576).toFixed(1)} MB, keeping ${ring.capacity} within ` +
+        `${(options.maxBytes / 1048576).toFixed(1)} MB`);
+    }
+    ring.data = ring.data32 = null; // let the old slots go before allocating the new ones
+    slots = [];
+    slots32 = [];
+    const data = new Uint8ClampedArray(ring.capacity * frameBytes);
+    for (let k = 0; k < ring.capacity; k++) {
+      slots.push(data.subarray(k * frameBytes, (k + 1) * frameBytes));
+      if (format.channels === 4) slots32.push(new Uint32Array(data.buffer, k * frameBytes, frameBytes >> 2));
+    }
+    ring.data = data;
+    ring.data32 = format.channels === 4 ? new Uint32Array(data.buffer) : null;
+    ring.bytes = data.length;
+    ring.clear();
+  }
+
+  function store(frame, slot) {
+    const src = frame.rgba;
+    if (format.channels === 4 && ring.width === sourceW && ring.height === sourceH) {
+      slot.set(src);
+      return;
+    }
+    const channels = format.channels, offset = format.offset;
+    for (let y = 0, o = 0; y < ring.height; y++) {
+      const row = ys[y] * sourceW;
+      for (let x = 0; x < ring.width; x++, o += channels) {
+        const i = (row + xs[x]) * 4;
+        if (offset < 0) {
+          slot[o] = (src[i] + src[i + 1] + src[i + 2]) / 3;
+        } else if (channels === 1) {
+          slot[o] = src[i + offset];
+        } else {
+          for (let c = 0; c < channels; c++) slot[o + c] = src[i + c];
+        }
+      }
+    }
+  }
+
+  return ring;
+}
+
+function createFrameSum(options) {
+  const ring = createFrameRing(options);
+  let data = null; // ring.data the sums were started on
+  let summed = 0; // the sums hold ages 0 .. summed - 1
+
+  function add(age, sign) {
+    const frame = ring.get(age), sum = frameSum.sum;
+    if (sign > 0) {
+      for (let j = 0; j < sum.length; j++) sum[j] += frame[j];
+    } else {
+      for (let j = 0; j < sum.length; j++) sum[j] -= frame[j];
+    }
+  }
+
+  const frameSum = {
+    ring,
+    sum: null,
+    count: 0,
+
+    push(length, frame = grabFrame()) {
+      // A window as long as the ring loses its oldest frame to this push
+      if (summed > 0 && summed === ring.length && ring.length === ring.capacity) add(--summed, -1);
+      ring.push(frame);
+      if (ring.data !== data || ring.length <= summed) {
+        // First frame, or the ring was reallocated or cleared and forgot its frames
+        data = ring.data;
+        frameSum.sum = new Uint32Array(ring.width * ring.height * ring.channels);
+        summed = 0;
+      }
+      // The frames summed so far are now one age older
+      add(0, 1);
+      summed++;
+      // A ring cut short by maxBytes holds fewer frames than asked for
+      const count = Math.max(1, Math.min(length, ring.length));
+      while (summed > count) add(--summed, -1);
+      while (summed < count) add(summed++, 1);
+      frameSum.count = count;
+      return frameSum.sum;
+    },
+  };
+  return frameSum;
+}
@@ -0,0 +1,135 @@
+// Fragment-shader path for effects with a @glsl section
+//
+// The camera is uploaded as a texture and the effect's GLSL runs once per
+// output pixel in an offscreen WEBGL p5.Graphics, which is then drawn onto
+// the sketch's 2D canvas, so overlays and the help screen work as usual and
+// no pixels are read back to the CPU. The body is spliced into main() of
+// GLSL_FRAGMENT and sees:
+//
+//   color        vec4, the camera pixel at xy (0..1); the body updates it
+//   xy           vec2, the pixel's integer coordinates, (0, 0) top left
+//   resolution   vec2, width and height of the canvas
+//   paramA, paramB, frameCount
+//   sampleVideo(xy)      the camera pixel at xy, rounded down; opaque black
+//                        outside the frame
+//   random(lo, hi)       a value per pixel and frame, like p5's random()
+//   map(v, a, b, c, d)   p5's map() without clamping
+//
+// Only GLSL ES 1.00 without extensions is used, so the shaders also compile
+// on software rasterisers (SwiftShader, llvmpipe). pass.draw() returns false
+// when there's no WebGL or the shader doesn't compile; the sketch then runs
+// its CPU draw loop instead. ?glsl=0 forces the CPU path.
+const GLSL_ENABLED = new URLSearchParams(location.search).get('glsl') !== '0';
+
+// p5 draws rect() as a unit quad, so aPosition spans 0..1 across the canvas
+const GLSL_VERTEX = `
+attribute vec3 aPosition;
+varying vec2 vUv;
+void main() {
+  vUv = vec2(aPosition.x, 1.0 - aPosition.y);
+  gl_Position = vec4(aPosition.xy * 2.0 - 1.0, 0.0, 1.0);
+}`;
+
+const GLSL_FRAGMENT = `
+#ifdef GL_FRAGMENT_PRECISION_HIGH
+precision highp float;
+#else
+precision mediump float;
+#endif
+uniform sampler2D video;
+uniform vec2 resolution;
+uniform float paramA;
+uniform float paramB;
+uniform float frameCount;
+varying vec2 vUv;
+
+const float PI = 3.14159265358979;
+const float TWO_PI = 6.28318530717959;
+const float HALF_PI = 1.57079632679490;
+
+vec4 sampleVideo(vec2 xy) {
+  xy = floor(xy);
+  if (xy.x < 0.0 || xy.y < 0.0 || xy.x >= resolution.x || xy.y >= resolution.y) return vec4(0.0, 0.0, 0.0, 1.0);
+  // Texel centres, so linear filtering returns the texel itself
+  return texture2D(video, (xy + 0.5) / resolution);
+}
+
+float random(float lo, float hi) {
+  // Hash of the pixel and frame (no sin(), whose precision varies between GPUs)
+  vec3 p = fract(vec3(gl_FragCoord.xy, mod(frameCount, 1024.0)) * vec3(0.1031, 0.1030, 0.0973));
+  p += dot(p, p.yzx + 33.33);
+  return lo + fract((p.x + p.y) * p.z) * (hi - lo);
+}
+
+float map(float v, float a, float b, float c, float d) {
+  return c + (v - a) / (b - a) * (d - c);
+}
+
+void main() {
+  vec2 xy = floor(vUv * resolution);
+  vec4 color = sampleVideo(xy);
+  {
+BODY
+  }
+  gl_FragColor = vec4(color.rgb, 1.0);
+}`;
+
+function createGlslPass(body) {
+  let pass; // undefined until the first draw, null once the CPU path is chosen
+  let g = null;
+  let program = null;
+
+  function compiles(gl, type, source) {
+    const shader = gl.createShader(type);
+    gl.shaderSource(shader, source);
+    gl.compileShader(shader);
+    const ok = gl.getShaderParameter(shader, gl.COMPILE_STATUS);
+    if (!ok) console.warn(`GLSL: ${gl.getShaderInfoLog(shader)}`);
+    gl.deleteShader(shader);
+    return ok;
+  }
+
+  function init() {
+    if (!GLSL_ENABLED) return null;
+    if (!document.createElement('canvas').getContext('webgl')) {
+      console.warn('GLSL: no WebGL here, running the CPU loop');
+      return null;
+    }
+    const fragment = GLSL_FRAGMENT.replace('BODY', () => body);
+    try {
+      g = createGraphics(width, height, WEBGL);
+    } catch (error) {
+      console.warn(`GLSL: ${error.message}, running the CPU loop`);
+      return null;
+    }
+    g.pixelDensity(1);
+    g.noStroke();
+    // p5 only logs a shader that fails to compile, so check both first
+    const gl = g.drawingContext;
+    if (!compiles(gl, gl.VERTEX_SHADER, GLSL_VERTEX) || !compiles(gl, gl.FRAGMENT_SHADER, fragment)) {
+      g.remove();
+      return null;
+    }
+    program = g.createShader(GLSL_VERTEX, fragment);
+    const info = gl.getExtension('WEBGL_debug_renderer_info'); // e.g. SwiftShader on machines without a GPU
+    console.log(`GLSL: running on ${gl.getParameter(info ? info.UNMASKED_RENDERER_WEBGL : gl.RENDERER)}`);
+    return true;
+  }
+
+  return {
+    draw() {
+      if (pass === undefined) pass = init();
+      if (!pass) return false;
+      if (g.width !== width || g.height !== height) g.resizeCanvas(width, height);
+      g.shader(program);
+      program.setUniform('video', video);
+      program.setUniform('resolution', [width, height]);
+      program.setUniform('paramA', paramA);
+      program.setUniform('paramB', paramB);
+      program.setUniform('frameCount', frameCount);
+      g.rect(0, 0, width, height);
+      drawingContext.drawImage(g.elt, 0, 0, width, height);
+      return true;
+    },
+  };
+}
@@ -0,0 +1,44 @@
+// Lookup tables baked by luts.py at build time
+
+// 1D tables and luma palettes are embedded in the sketch as base64
+function decodeLut(b64) {
+  const bytes = atob(b64);
+  const table = new Uint8Array(bytes.length);
+  for (let k = 0; k < bytes.length; k++) table[k] = bytes.charCodeAt(k);
+  return table;
+}
+
+// 3D tables ship as binary assets: size^3 RGB entries per paramA bin, red
+// varying slowest. applyLut3d() interpolates one colour tetrahedrally (4
+// taps instead of trilinear's 8) and leaves the result in lut3dRGB, so the
+// per-pixel path allocates nothing.
+const lut3dRGB = new Float32Array(3);
+
+function applyLut3d(cube, base, size, r, g, b) {
+  const top = size - 1;
+  const scale = top / 255;
+  let fr = r * scale, fg = g * scale, fb = b * scale;
+  fr = fr < 0 ? 0 : fr > top ? top : fr;
+  fg = fg < 0 ? 0 : fg > top ? top : fg;
+  fb = fb < 0 ? 0 : fb > top ? top : fb;
+  let ir = Math.min(fr | 0, top - 1), ig = Math.min(fg | 0, top - 1), ib = Math.min(fb | 0, top - 1);
+  const dr = fr - ir, dg = fg - ig, db = fb - ib;
+
+  const sr = size * size * 3, sg = size * 3, sb = 3;
+  const c000 = base + ir * sr + ig * sg + ib * sb;
+  const c111 = c000 + sr + sg + sb;
+  // Pick the tetrahedron containing (dr, dg, db): two inner corners and weights
+  let c1, c2, w0, w1, w2, w3;
+  if (dr >= dg) {
+    if (dg >= db) { c1 = c000 + sr; c2 = c000 + sr + sg; w0 = 1 - dr; w1 = dr - dg; w2 = dg - db; w3 = db; }
+    else if (dr >= db) { c1 = c000 + sr; c2 = c000 + sr + sb; w0 = 1 - dr; w1 = dr - db; w2 = db - dg; w3 = dg; }
+    else { c1 = c000 + sb; c2 = c000 + sr + sb; w0 = 1 - db; w1 = db - dr; w2 = dr - dg; w3 = dg; }
+  } else {
+    if (db >= dg) { c1 = c000 + sb; c2 = c000 + sg + sb; w0 = 1 - db; w1 = db - dg; w2 = dg - dr; w3 = dr; }
+    else if (db >= dr) { c1 = c000 + sg; c2 = c000 + sg + sb; w0 = 1 - dg; w1 = dg - db; w2 = db - dr; w3 = dr; }
+    else { c1 = c000 + sg; c2 = c000 + sr + sg; w0 = 1 - dg; w1 = dg - dr; w2 = dr - db; w3 = db; }
+  }
+  lut3dRGB[0] = cube[c000] * w0 + cube[c1] * w1 + cube[c2] * w2 + cube[c111] * w3;
+  lut3dRGB[1] = cube[c000 + 1] * w0 + cube[c1 + 1] * w1 + cube[c2 + 1] * w2 + cube[c111 + 1] * w3;
+  lut3dRGB[2] = cube[c000 + 2] * w0 + cube[c1 + 2] * w1 + cube[c2 + 2] * w2 + cube[c111 + 2] * w3;
+}
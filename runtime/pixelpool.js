@@ -0,0 +1,141 @@
+// Splits each frame across a pool of Web Workers sharing its memory
+//
+// Built by `generator.py build/chain --worker --workers N`. Every worker runs
+// processBand() on its own horizontal strip of the frame; neighbourhood
+// stages recompute the few halo rows they read across a strip's edge, so the
+// strips never wait on each other. Frames live in SharedArrayBuffers and the
+// workers sleep in Atomics.wait() until the page bumps the generation
+// counter, then count themselves off in POOL_DONE. Two frame slots let the
+// next camera frame be grabbed while the pool works on the current one.
+//
+// SharedArrayBuffer needs a cross-origin isolated page (the COOP/COEP
+// headers server.py sends); anywhere else this falls back to the single
+// transferring worker of runtime/pixelworker.js.
+//
+// ?workers=N overrides the pool size. ?scaling=1 times the pool on one
+// frame with 1, 2, 4, ... workers, logs speedup and efficiency per core
+// count and POSTs them to /scaling.
+const POOL_GENERATION = 0, POOL_DONE = 1, POOL_SLOT = 2, POOL_WIDTH = 3, POOL_HEIGHT = 4, POOL_ACTIVE = 5;
+const POOL_CONTROL_SIZE = 6; // Int32s; same layout as BAND_* in runtime/pixelworker_scope.js
+const POOL_SLOTS = 2;
+const SCALING_WARMUP = 5; // frames dropped per worker count
+const SCALING_FRAMES = 30; // frames timed per worker count
+
+function createPixelPool(url, size) {
+  if (!self.crossOriginIsolated) {
+    console.warn('Pixel pool: the page is not cross-origin isolated, so SharedArrayBuffer is off; using one worker');
+    return createPixelWorker(url);
+  }
+  const query = new URLSearchParams(location.search);
+  const count = Number(query.get('workers')) || size || navigator.hardwareConcurrency || 4;
+  const bytes = DISPLAY_WIDTH * DISPLAY_HEIGHT * 4; // the largest canvas any render scale gives
+  const control = new Int32Array(new SharedArrayBuffer(POOL_CONTROL_SIZE * 4));
+  const params = new Float64Array(new SharedArrayBuffer(2 * 8));
+  const finished = new Float64Array(new SharedArrayBuffer(count * 8)); // when each worker last finished its band
+  const frames = [];
+  for (let k = 0; k < POOL_SLOTS; k++) frames.push({ input: new SharedArrayBuffer(bytes), output: new SharedArrayBuffer(bytes) });
+
+  let failed = false;
+  for (let index = 0; index < count; index++) {
+    const worker = new Worker(url);
+    worker.onerror = (event) => {
+      failed = true;
+      console.error(`Pixel pool: ${event.message}`);
+    };
+    worker.postMessage({ control: control.buffer, params: params.buffer, finished: finished.buffer, frames, index });
+  }
+  console.log(`Pixel pool: ${count} workers`);
+
+  let running = null; // the job the pool is working on
+  let pending = null; // a grabbed frame waiting for the pool
+  let last = null; // the last job run, replayed while measuring scaling
+  let shown = null; // the outputFrame() ImageData holding a result
+  let sent = null; // inputs of the last frame grabbed, as in needsRedraw()
+  const scaling = query.has('scaling') ? { counts: scalingCounts(count), k: 0, samples: [], rows: [] } : null;
+
+  function capture(a, b) {
+    const inputs = [currentVideoFrame(), a, b, width];
+    if (sent && inputs.every((value, k) => value === sent[k])) return;
+    sent = inputs;
+    const frame = grabFrame();
+    const slot = running && running.slot === 0 ? 1 : 0;
+    new Uint8ClampedArray(frames[slot].input, 0, frame.rgba.length).set(frame.rgba);
+    pending = { slot, width: frame.width, height: frame.height, paramA: a, paramB: b, active: count };
+  }
+
+  function kick(job) {
+    control[POOL_SLOT] = job.slot;
+    control[POOL_WIDTH] = job.width;
+    control[POOL_HEIGHT] = job.height;
+    control[POOL_ACTIVE] = job.active;
+    params[0] = job.paramA;
+    params[1] = job.paramB;
+    Atomics.store(control, POOL_DONE, 0);
+    job.kicked = performance.timeOrigin + performance.now();
+    Atomics.add(control, POOL_GENERATION, 1);
+    Atomics.notify(control, POOL_GENERATION);
+    running = job;
+  }
+
+  function measure(ms) {
+    // One timed replay of the last frame at scaling.counts[k] workers
+    scaling.samples.push(ms);
+    if (scaling.samples.length < SCALING_WARMUP + SCALING_FRAMES) return;
+    const timed = scaling.samples.slice(SCALING_WARMUP).sort((p, q) => p - q);
+    scaling.rows.push({ workers: scaling.counts[scaling.k], ms: timed[timed.length >> 1] });
+    scaling.samples = [];
+    scaling.k++;
+    if (scaling.k === scaling.counts.length) reportScaling(scaling.rows, last);
+  }
+
+  return {
+    frame(a, b) {
+      if (failed) return;
+      const out = outputFrame();
+      if (running && Atomics.load(control, POOL_DONE) === running.active) {
+        const job = running;
+        running = null;
+        if (job.measured) measure(Math.max(...finished.subarray(0, job.active)) - job.kicked);
+        if (job.width === out.width && job.height === out.height) {
+          out.rgba.set(new Uint8ClampedArray(frames[job.slot].output, 0, out.rgba.length));
+          shown = out.image;
+        }
+      }
+      if (scaling && last && scaling.k < scaling.counts.length) {
+        // Same input, params and slot every time, so only the worker count varies
+        if (!running) kick(Object.assign({}, last, { active: scaling.counts[scaling.k], measured: true }));
+      } else {
+        capture(a, b);
+        if (!running && pending) {
+          kick(pending);
+          last = pending;
+          pending = null;
+        }
+      }
+      // Repainted every draw, so overlays and the help screen never stack up
+      if (shown === out.image) presentFrame();
+    },
+  };
+}
+
+function scalingCounts(count) {
+  const counts = [];
+  for (let n = 1; n < count; n *= 2) counts.push(n);
+  counts.push(count);
+  return counts;
+}
+
+function reportScaling(rows, job) {
+  // Efficiency: how much of n workers' time went into the frame, t1 / (n * tn)
+  const t1 = rows[0].ms;
+  const table = rows.map((row) => ({
+    workers: row.workers,
+    ms: +row.ms.toFixed(3),
+    speedup: +(t1 / row.ms).toFixed(2),
+    efficiency: +(t1 / (row.workers * row.ms)).toFixed(2),
+  }));
+  console.log(`Pixel pool scaling on a ${job.width}x${job.height} frame (median of ${SCALING_FRAMES}):`);
+  console.table(table);
+  const report = { page: location.pathname, width: job.width, height: job.height, cores: navigator.hardwareConcurrency, rows: table };
+  navigator.sendBeacon('/scaling', JSON.stringify(report));
+}
@@ -0,0 +1,73 @@
+// Runs an effect's fused pixel passes in a Web Worker
+//
+// Built by `generator.py build/chain --worker` (compose.compile_worker). The
+// draw loop only hands the grabbed frame to the worker and shows the newest
+// frame it has sent back, so the buttons and paramA/paramB stay responsive
+// however slow the effect is. Up to PIXEL_WORKER_DEPTH frames are in flight:
+// while the worker processes frame N, the next draw() already grabs frame
+// N + 1 and queues it behind, so capture overlaps processing. Buffers are
+// transferred, never cloned, and come back to a pool for reuse.
+const PIXEL_WORKER_DEPTH = 2;
+
+function createPixelWorker(url) {
+  const worker = new Worker(url);
+  const spare = []; // ArrayBuffers back from the worker
+  let inFlight = 0;
+  let latest = null; // newest result not yet copied to the canvas
+  let shown = null; // the outputFrame() ImageData holding a result
+  let sent = null; // inputs of the last frame sent, as in needsRedraw()
+  let failed = false;
+
+  function recycle(buffer) {
+    spare.push(buffer);
+    if (spare.length > PIXEL_WORKER_DEPTH * 2) spare.shift(); // e.g. sized for an earlier render scale
+  }
+
+  function take(bytes) {
+    const k = spare.findIndex((buffer) => buffer.byteLength === bytes);
+    return k >= 0 ? spare.splice(k, 1)[0] : new ArrayBuffer(bytes);
+  }
+
+  worker.onmessage = (event) => {
+    const job = event.data;
+    inFlight--;
+    recycle(job.input);
+    if (latest) recycle(latest.output); // superseded before it was shown
+    latest = job;
+  };
+  worker.onerror = (event) => {
+    failed = true;
+    console.error(`Pixel worker: ${event.message}`);
+  };
+
+  function send(a, b) {
+    // Only new camera frames or params are worth the worker's time
+    const inputs = [currentVideoFrame(), a, b, width];
+    if (sent && inputs.every((value, k) => value === sent[k])) return;
+    sent = inputs;
+    const frame = grabFrame();
+    const input = take(frame.rgba.byteLength);
+    new Uint8ClampedArray(input).set(frame.rgba);
+    const output = take(frame.rgba.byteLength);
+    inFlight++;
+    worker.postMessage({ input, output, width: frame.width, height: frame.height, paramA: a, paramB: b }, [input, output]);
+  }
+
+  return {
+    frame(a, b) {
+      // Queue the next frame first, so the worker never waits on this draw()
+      if (!failed && inFlight < PIXEL_WORKER_DEPTH) send(a, b);
+      const out = outputFrame();
+      if (latest) {
+        if (latest.width === out.width && latest.height === out.height) {
+          out.rgba.set(new Uint8ClampedArray(latest.output));
+          shown = out.image;
+        }
+        recycle(latest.output);
+        latest = null;
+      }
+      // Repainted every draw, so overlays and the help screen never stack up
+      if (shown === out.image) presentFrame();
+    },
+  };
+}
@@ -0,0 +1,99 @@
+// Worker side of runtime/pixelworker.js and runtime/pixelpool.js
+//
+// The generated code that follows this file defines processBand(input,
+// output, width, height, paramA, paramB, y0, y1), the fused kernels of
+// compose.compile_worker() writing rows y0..y1 of output. Kernels are written
+// against p5's globals, which don't exist in a worker, so the helpers they
+// may call are defined here with p5's semantics (random() is not seeded).
+// loadBytes() fetches a lookup table the way p5's preload would; no frame is
+// processed before every load has landed.
+//
+// A single worker gets whole frames as transferred buffers and sends them
+// back. A pool worker is set up once with shared buffers and then serves
+// its band of every frame the page announces through Atomics.
+const PI = Math.PI, TWO_PI = Math.PI * 2, HALF_PI = Math.PI / 2;
+const { abs, atan2, ceil, cos, exp, floor, log, max, min, pow, round, sin, sqrt, tan } = Math;
+
+function constrain(n, low, high) {
+  return Math.max(Math.min(n, high), low);
+}
+
+function map(n, start1, stop1, start2, stop2, withinBounds) {
+  const value = (n - start1) / (stop1 - start1) * (stop2 - start2) + start2;
+  if (!withinBounds) return value;
+  return start2 < stop2 ? constrain(value, start2, stop2) : constrain(value, stop2, start2);
+}
+
+function lerp(start, stop, amount) {
+  return amount * (stop - start) + start;
+}
+
+function dist(x1, y1, x2, y2) {
+  return Math.hypot(x2 - x1, y2 - y1);
+}
+
+function mag(x, y) {
+  return Math.hypot(x, y);
+}
+
+function sq(n) {
+  return n * n;
+}
+
+function random(min, max) {
+  const value = Math.random();
+  if (min === undefined) return value;
+  if (Array.isArray(min)) return min[Math.floor(value * min.length)];
+  if (max === undefined) return value * min;
+  return value * (max - min) + min;
+}
+
+const workerLoads = [];
+
+function loadBytes(url) {
+  const file = {};
+  workerLoads.push(fetch(url)
+    .then((response) => {
+      if (!response.ok) throw new Error(`${url}: HTTP ${response.status}`);
+      return response.arrayBuffer();
+    })
+    .then((buffer) => { file.bytes = new Uint8Array(buffer); }));
+  return file;
+}
+
+// Same layout as POOL_* in runtime/pixelpool.js
+const BAND_GENERATION = 0, BAND_DONE = 1, BAND_SLOT = 2, BAND_WIDTH = 3, BAND_HEIGHT = 4, BAND_ACTIVE = 5;
+
+function serveBands(setup) {
+  // Never returns: the worker sleeps in Atomics.wait() between frames
+  const control = new Int32Array(setup.control);
+  const params = new Float64Array(setup.params);
+  const finished = new Float64Array(setup.finished);
+  let generation = 0;
+  for (;;) {
+    Atomics.wait(control, BAND_GENERATION, generation);
+    generation = Atomics.load(control, BAND_GENERATION);
+    const active = control[BAND_ACTIVE]; // fewer than the pool while measuring scaling
+    if (setup.index >= active) continue;
+    const w = control[BAND_WIDTH], h = control[BAND_HEIGHT];
+    const frame = setup.frames[control[BAND_SLOT]];
+    const y0 = Math.floor(h * setup.index / active);
+    const y1 = Math.floor(h * (setup.index + 1) / active);
+    processBand(new Uint8ClampedArray(frame.input, 0, w * h * 4), new Uint8ClampedArray(frame.output, 0, w * h * 4),
+      w, h, params[0], params[1], y0, y1);
+    finished[setup.index] = performance.timeOrigin + performance.now();
+    Atomics.add(control, BAND_DONE, 1);
+  }
+}
+
+onmessage = async (event) => {
+  await Promise.all(workerLoads);
+  const job = event.data;
+  if (job.control) {
+    serveBands(job);
+    return;
+  }
+  processBand(new Uint8ClampedArray(job.input), new Uint8ClampedArray(job.output), job.width, job.height,
+    job.paramA, job.paramB, 0, job.height);
+  postMessage(job, [job.input, job.output]);
+};
@@ -0,0 +1,127 @@
+// Cached geometric remap tables
+//
+// Lens and warp effects only decide, for every output pixel, which source
+// pixel to read, and that choice depends on nothing but the canvas size and
+// the params. createRemap() turns such an effect into a table built once per
+// quantised param state: an Int32Array of source pixel indices (-1 = leave
+// black), plus 8-bit fixed-point fractions when bilinear sampling is on. A
+// small LRU keeps the last few tables, so a still or wiggling mouse never
+// rebuilds, and each frame is a single gather loop.
+//
+//   const warp = createRemap({
+//     bins: 64,              // quantisation steps per param
+//     params: 1,             // how many of paramA, paramB the mapping uses
+//     build: (w, h, a, b) => (x, y, out) => {
+//       out[0] = ...; out[1] = ...;   // source coordinates for (x, y)
+//       return true;                  // false leaves (x, y) black
+//     }
+//   });
+//   warp.apply(grabFrame().rgba, outputFrame().rgba, width, height, paramA, paramB);
+//   presentFrame();
+//
+// Open the sketch with ?remap=bilinear for the smooth quality mode.
+const REMAP_CACHE_SIZE = 6;
+const REMAP_BILINEAR = new URLSearchParams(window.location.search).get('remap') === 'bilinear';
+const OPAQUE_BLACK = 0xff000000; // little-endian RGBA (0, 0, 0, 255)
+
+function createRemap(options) {
+  const bins = options.bins || 64;
+  const params = options.params === undefined ? 1 : options.params;
+  const bilinear = options.bilinear === undefined ? REMAP_BILINEAR : options.bilinear;
+  const cache = new Map(); // insertion order doubles as LRU order
+  const coords = new Float64Array(2);
+
+  function quantise(value) {
+    return Math.round(constrain(value, 0, 1) * (bins - 1));
+  }
+
+  function build(w, h, qa, qb) {
+    const sourceOf = options.build(w, h, qa / (bins - 1), qb / (bins - 1));
+    const table = {
+      index: new Int32Array(w * h),
+      fx: bilinear ? new Uint8Array(w * h) : null,
+      fy: bilinear ? new Uint8Array(w * h) : null,
+    };
+    for (let y = 0, p = 0; y < h; y++) {
+      for (let x = 0; x < w; x++, p++) {
+        if (!sourceOf(x, y, coords)) {
+          table.index[p] = -1;
+          continue;
+        }
+        const sx = Math.floor(coords[0]);
+        const sy = Math.floor(coords[1]);
+        if (sx < 0 || sx >= w || sy < 0 || sy >= h) {
+          table.index[p] = -1;
+          continue;
+        }
+        table.index[p] = sx + sy * w;
+        if (bilinear) {
+          // Zero weight towards a neighbour that would fall off the frame
+          table.fx[p] = sx < w - 1 ? Math.round((coords[0] - sx) * 255) : 0;
+          table.fy[p] = sy < h - 1 ? Math.round((coords[1] - sy) * 255) : 0;
+        }
+      }
+    }
+    return table;
+  }
+
+  function lookup(w, h, a, b) {
+    const qa = params > 0 ? quantise(a) : 0;
+    const qb = params > 1 ? quantise(b) : 0;
+    const key = w + 'x' + h + ':' + qa + ':' + qb;
+    let table = cache.get(key);
+    if (table) {
+      cache.delete(key);
+    } else {
+      table = build(w, h, qa, qb);
+      if (cache.size >= REMAP_CACHE_SIZE) cache.delete(cache.keys().next().value);
+    }
+    cache.set(key, table);
+    return table;
+  }
+
+  function gatherNearest(table, src, dst) {
+    const src32 = view32(src);
+    const dst32 = view32(dst);
+    const index = table.index;
+    for (let p = 0; p < index.length; p++) {
+      const s = index[p];
+      dst32[p] = s >= 0 ? (src32[s] | OPAQUE_BLACK) : OPAQUE_BLACK;
+    }
+  }
+
+  function gatherBilinear(table, src, dst, w) {
+    const { index, fx, fy } = table;
+    const row = w * 4;
+    for (let p = 0, o = 0; p < index.length; p++, o += 4) {
+      const s = index[p];
+      if (s < 0) {
+        dst[o] = dst[o + 1] = dst[o + 2] = 0;
+        dst[o + 3] = 255;
+        continue;
+      }
+      const i00 = s * 4;
+      const i10 = fx[p] ? i00 + 4 : i00;
+      const i01 = fy[p] ? i00 + row : i00;
+      const i11 = fx[p] ? i01 + 4 : i01;
+      const wx = fx[p], wy = fy[p];
+      for (let c = 0; c < 3; c++) {
+        const top = src[i00 + c] * (255 - wx) + src[i10 + c] * wx;
+        const bottom = src[i01 + c] * (255 - wx) + src[i11 + c] * wx;
+        dst[o + c] = (top * (255 - wy) + bottom * wy) / 65025;
+      }
+      dst[o + 3] = 255;
+    }
+  }
+
+  return {
+    apply(src, dst, w, h, a, b) {
+      const table = lookup(w, h, a, b);
+      if (bilinear) gatherBilinear(table, src, dst, w);
+      else gatherNearest(table, src, dst);
+    },
+    clear() {
+      cache.clear();
+    },
+  };
+}
@@ -0,0 +1,198 @@
+// Deterministic stand-in for the webcam
+//
+// Including this module makes createCapture(VIDEO) return an offscreen
+// p5.Graphics that shows a synthetic source instead of opening a camera.
+// It has the surface the effects use (pixels, loadPixels(), get(), width,
+// height, image(video, ...)) plus the element methods the sketch calls
+// (size, hide, pause, loop, elt.readyState).
+//
+// Frame N depends on N alone: patterns are drawn from the frame index,
+// randomSeed()/noiseSeed() are fixed, millis() runs on a virtual clock of
+// SYNTHETIC_FPS frames per second, and a clip is stepped one frame per
+// draw() by seeking (the sketch waits for each seek). Two runs therefore
+// render identical frames, so timings and output hashes can be compared.
+//
+// The generator sets SYNTHETIC_SOURCE, e.g. { pattern: 'noise' } or
+// { pattern: 'clip', clip: 'clip.mp4' }; ?source=<pattern> overrides it.
+const SYNTHETIC_SEED = 1;
+const SYNTHETIC_FPS = 30;
+
+function syntheticHash(x, y, n) {
+  // Integer hash -> 0..255
+  let h = Math.imul(x, 374761393) + Math.imul(y, 668265263) + Math.imul(n, 2147483647) + SYNTHETIC_SEED;
+  h = Math.imul(h ^ (h >>> 13), 1274126177);
+  return ((h ^ (h >>> 16)) >>> 0) & 255;
+}
+
+function syntheticFill(g, shade) {
+  // shade(x, y) -> [r, g, b] written straight into the graphics' pixels
+  g.loadOwnPixels();
+  const px = g.pixels;
+  for (let y = 0, i = 0; y < g.height; y++) {
+    for (let x = 0; x < g.width; x++, i += 4) {
+      const c = shade(x, y);
+      px[i] = c[0];
+      px[i + 1] = c[1];
+      px[i + 2] = c[2];
+      px[i + 3] = 255;
+    }
+  }
+  g.updatePixels();
+}
+
+const SYNTHETIC_PATTERNS = {
+  // Scrolling colour bars over a grey ramp, with a ball on a Lissajous path
+  bars(g, n) {
+    const colours = ['#ffffff', '#ffff00', '#00ffff', '#00ff00', '#ff00ff', '#ff0000', '#0000ff', '#000000'];
+    const barW = g.width / colours.length;
+    const shift = (n * 3) % barW;
+    g.background(0);
+    g.noStroke();
+    for (let k = -1; k < colours.length; k++) {
+      g.fill(colours[(k + colours.length + Math.floor(n * 3 / barW)) % colours.length]);
+      g.rect(k * barW + shift, 0, barW + 1, g.height * 0.7);
+    }
+    for (let x = 0; x < g.width; x += 4) {
+      g.fill(x / g.width * 255);
+      g.rect(x, g.height * 0.7, 4, g.height * 0.3);
+    }
+    g.fill(230, 60, 40);
+    g.circle(g.width * (0.5 + 0.4 * Math.sin(n * 0.031)), g.height * (0.5 + 0.4 * Math.sin(n * 0.047)), g.height * 0.2);
+  },
+
+  // Drifting value noise (32 px cells, smoothly interpolated) with a little grain
+  noise(g, n) {
+    const cell = 32;
+    const t = n / SYNTHETIC_FPS;
+    const ox = Math.floor(t * 40), oy = Math.floor(t * 25);
+    const cx0 = Math.floor(ox / cell), cy0 = Math.floor(oy / cell);
+    const cols = Math.ceil(g.width / cell) + 2, rows = Math.ceil(g.height / cell) + 2;
+    const lattice = new Uint8Array(cols * rows * 3);
+    for (let j = 0, k = 0; j < rows; j++) {
+      for (let i = 0; i < cols; i++) {
+        for (let c = 0; c < 3; c++, k++) lattice[k] = syntheticHash(cx0 + i, cy0 + j, c);
+      }
+    }
+    const smooth = new Float32Array(cell);
+    for (let v = 0; v < cell; v++) smooth[v] = (v / cell) * (v / cell) * (3 - 2 * v / cell);
+
+    g.loadOwnPixels();
+    const px = g.pixels;
+    let grain = syntheticHash(n, 0, 0) + 1;
+    for (let y = 0, o = 0; y < g.height; y++) {
+      const py = y + oy - cy0 * cell;
+      const row = Math.floor(py / cell), fy = smooth[py % cell];
+      for (let x = 0; x < g.width; x++, o += 4) {
+        const pxx = x + ox - cx0 * cell;
+        const k = (row * cols + Math.floor(pxx / cell)) * 3, fx = smooth[pxx % cell];
+        const below = k + cols * 3;
+        grain = (Math.imul(grain, 1664525) + 1013904223) | 0;
+        const speck = (grain >>> 28) - 8;
+        for (let c = 0; c < 3; c++) {
+          const top = lattice[k + c] + (lattice[k + 3 + c] - lattice[k + c]) * fx;
+          const bottom = lattice[below + c] + (lattice[below + 3 + c] - lattice[below + c]) * fx;
+          px[o + c] = top + (bottom - top) * fy + speck;
+        }
+        px[o + 3] = 255;
+      }
+    }
+    g.updatePixels();
+  },
+
+  // Horizontal red and vertical green ramps under a blue band sweeping diagonally
+  gradient(g, n) {
+    const out = [0, 0, 0];
+    const period = g.width + g.height;
+    const band = (n * 6) % period;
+    syntheticFill(g, (x, y) => {
+      out[0] = x / g.width * 255;
+      out[1] = y / g.height * 255;
+      out[2] = Math.max(0, 255 - Math.abs(x + y - band) * 2);
+      return out;
+    });
+  },
+};
+
+let syntheticSource = null;
+
+function createSyntheticCapture(inst, options) {
+  const g = inst.createGraphics(inst.width, inst.height);
+  g.pixelDensity(1);
+  g.elt.readyState = 4; // HAVE_ENOUGH_DATA, like a playing <video>
+  g.frameIndex = 0;
+  g.playing = true;
+  g.size = (w, h) => { if (w !== g.width || h !== g.height) g.resizeCanvas(w, h); };
+  g.pause = () => { g.playing = false; };
+  g.loop = () => { g.playing = true; };
+  g.play = g.loop;
+  g.loadOwnPixels = g.loadPixels; // the sketch routes loadPixels() through its frame grabber
+
+  if (options.pattern === 'clip' && options.clip) {
+    // Stepped by seeking to frame N's timestamp; draw() is held until the seek lands
+    const clip = document.createElement('video');
+    clip.muted = true;
+    clip.preload = 'auto';
+    clip.src = options.clip;
+    g.clip = clip;
+    g.seeking = false;
+    const seek = () => {
+      g.seeking = true;
+      inst.noLoop();
+      clip.currentTime = (g.frameIndex / SYNTHETIC_FPS) % clip.duration;
+    };
+    g.advance = () => {
+      if (!clip.duration || g.seeking) return;
+      g.frameIndex++;
+      seek();
+    };
+    clip.addEventListener('seeked', () => {
+      g.drawingContext.drawImage(clip, 0, 0, g.width, g.height);
+      g.seeking = false;
+      inst.loop();
+    });
+    clip.addEventListener('loadeddata', seek);
+  } else {
+    const pattern = SYNTHETIC_PATTERNS[options.pattern] || SYNTHETIC_PATTERNS.bars;
+    const render = () => {
+      g.push();
+      pattern(g, g.frameIndex);
+      g.pop();
+    };
+    g.advance = () => {
+      g.frameIndex++;
+      render();
+    };
+    render();
+  }
+  return g;
+}
+
+function syntheticOptions() {
+  const options = Object.assign({ pattern: 'bars' }, typeof SYNTHETIC_SOURCE === 'undefined' ? {} : SYNTHETIC_SOURCE);
+  const override = new URLSearchParams(location.search).get('source');
+  if (override) options.pattern = override;
+  return options;
+}
+
+p5.prototype.createCapture = function () {
+  this.randomSeed(SYNTHETIC_SEED);
+  this.noiseSeed(SYNTHETIC_SEED);
+  syntheticSource = createSyntheticCapture(this, syntheticOptions());
+  return syntheticSource;
+};
+
+// Effects that animate on millis() see the virtual clock of the source
+const realMillis = p5.prototype.millis;
+p5.prototype.millis = function () {
+  return syntheticSource ? syntheticSource.frameIndex * 1000 / SYNTHETIC_FPS : realMillis.call(this);
+};
+
+// Patterns draw frame N + 1 just before draw(); a clip starts seeking to it
+// right after draw(), so the seek overlaps the browser's idle time
+p5.prototype.registerMethod('pre', function () {
+  if (syntheticSource && syntheticSource.playing && !syntheticSource.clip) syntheticSource.advance();
+});
+
+p5.prototype.registerMethod('post', function () {
+  if (syntheticSource && syntheticSource.playing && syntheticSource.clip) syntheticSource.advance();
+});
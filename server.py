@@ -0,0 +1,292 @@
+"""
+PixelSynth Server
+Serves the generated sketches from output/.
+
+One thread per connection with HTTP/1.1 keep-alive, so several viewers (or a
+gallery of sketches) never wait on each other. Small files are answered from
+an in-memory LRU cache that is invalidated by mtime; large files (3D LUTs, video
+clips) are streamed with zero-copy sendfile. Every response carries an ETag
+and Last-Modified so browsers can revalidate with a 304, and precompressed
+.br / .gz siblings (written by the generator) are picked by Accept-Encoding.
+
+Sketches talk back through POST endpoints registered in POST_ROUTES, and
+GET_ROUTES holds dynamic pages such as /shutdown, which stops the server.
+
+Pages are served cross-origin isolated (COOP/COEP), which is what lets
+worker pools share frames through SharedArrayBuffer.
+"""
+import os
+import re
+import json
+import collections
+import time
+import functools
+import threading
+import mimetypes
+import email.utils
+import http.server
+import urllib.parse
+from telemetry import TELEMETRY
+
+CACHE_MAX_FILE = 4 * 1024 * 1024
+CACHE_MAX_TOTAL = 64 * 1024 * 1024
+TTFF_LOG = "ttff.jsonl"
+SCALING_LOG = "scaling.jsonl"
+CROSS_ORIGIN_ISOLATION = {
+    "Cross-Origin-Opener-Policy": "same-origin",
+    "Cross-Origin-Embedder-Policy": "require-corp",
+}
+IMMUTABLE = re.compile(r"\.[0-9a-f]{12}\.")  # content-addressed names, e.g. p5.<hash>.min.js
+ENCODINGS = (("br", ".br", "br"), ("gzip", ".gz", "gz"))  # Content-Encoding, file suffix, ETag suffix
+
+class FileCache:
+    """path -> (mtime_ns, size, bytes), refreshed whenever the file's mtime or size changes.
+    Holds at most max_total bytes, dropping the least recently served files first."""
+
+    def __init__(self, max_file=CACHE_MAX_FILE, max_total=CACHE_MAX_TOTAL):
+        self.max_file = max_file
+        self.max_total = max_total
+        self.total = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path, stat):
+        if stat.st_size > self.max_file:
+            return None
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                self._entries.move_to_end(path)
+                return entry[2]
+        with open(path, "rb") as f:
+            data = f.read()
+        with self._lock:
+            old = self._entries.pop(path, None)
+            if old:
+                self.total -= len(old[2])
+            self._entries[path] = (stat.st_mtime_ns, stat.st_size, data)
+            self.total += len(data)
+            while self.total > self.max_total:
+                _, evicted = self._entries.popitem(last=False)
+                self.total -= len(evicted[2])
+        return data
+
+def accepted_encodings(header):
+    """Accept-Encoding as {coding: q}; q=0 refuses a coding, "*" covers the rest."""
+    accepted = {}
+    for item in header.split(","):
+        name, *params = [part.strip() for part in item.split(";")]
+        q = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if name:
+            accepted[name.lower()] = q
+    return accepted
+
+def report_ttff(handler, report):
+    # Time-to-first-frame beacon sent by every sketch once the camera shows up
+    report["timestamp"] = time.time()
+    print(f"⏱ First frame after {report.get('firstFrameMs', 0):.0f} ms "
+          f"(p5 ready {report.get('setupMs', 0):.0f} ms) on {report.get('page', '?')}")
+    with open(os.path.join(handler.directory, TTFF_LOG), "a") as f:
+        f.write(json.dumps(report) + "\n")
+
+def report_scaling(handler, report):
+    # Worker pool scaling sent by runtime/pixelpool.js on ?scaling=1
+    report["timestamp"] = time.time()
+    # Formatted before anything is printed, so a malformed row (a 400) prints nothing
+    lines = [f"   {row['workers']:>3} workers  {row['ms']:8.2f} ms  x{row['speedup']:.2f}  "
+             f"{row['efficiency'] * 100:.0f}% efficient" for row in report.get("rows", [])]
+    print(f"🧵 Worker scaling on {report.get('page', '?')} ({report.get('width')}x{report.get('height')}, "
+          f"{report.get('cores')} cores)")
+    for line in lines:
+        print(line)
+    with open(os.path.join(handler.directory, SCALING_LOG), "a") as f:
+        f.write(json.dumps(report) + "\n")
+
+# Called once before the process exits, whether through /shutdown or Ctrl+C
+SHUTDOWN_HOOKS = [TELEMETRY.write_report]
+
+def run_shutdown_hooks():
+    while SHUTDOWN_HOOKS:
+        SHUTDOWN_HOOKS.pop(0)()
+
+def shutdown(handler):
+    handler.send_bytes(b"Server shutting down...", "text/plain")
+    print("\nRemote shutdown requested. Exiting.")
+
+    def exit_now():
+        run_shutdown_hooks()
+        os._exit(0)
+
+    threading.Timer(0.5, exit_now).start()
+
+# path -> fn(handler, decoded JSON body); may return a JSON-serialisable reply
+POST_ROUTES = {
+    "/ttff": report_ttff,
+    "/metrics": TELEMETRY.record,
+    "/scaling": report_scaling,
+}
+
+# path -> fn(handler); writes the whole response itself
+GET_ROUTES = {
+    "/shutdown": shutdown,
+    "/metrics": TELEMETRY.serve,
+}
+
+class Handler(http.server.SimpleHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    cache = FileCache()
+    extra_headers = {}
+
+    def do_POST(self):
+        route = POST_ROUTES.get(urllib.parse.urlsplit(self.path).path)
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length) if length else b""
+        if route is None:
+            self.send_error(404)
+            return
+        try:
+            reply = route(self, json.loads(body or b"{}"))
+        except (ValueError, TypeError, KeyError) as e:  # malformed JSON or payload
+            self.send_error(400, str(e))
+            return
+        if reply is None:
+            self.send_response(204)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        else:
+            self.send_bytes(json.dumps(reply).encode("utf-8"), "application/json")
+
+    def do_GET(self):
+        route = GET_ROUTES.get(urllib.parse.urlsplit(self.path).path)
+        if route is not None:
+            route(self)
+        else:
+            self.serve_file(head_only=False)
+
+    def do_HEAD(self):
+        self.serve_file(head_only=True)
+
+    def end_headers(self):
+        for name, value in self.extra_headers.items():
+            self.send_header(name, value)
+        super().end_headers()
+
+    def send_bytes(self, data, content_type, status=200):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def serve_file(self, head_only):
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            if not urllib.parse.urlsplit(self.path).path.endswith("/"):
+                # Relative URLs in index.html need the trailing slash
+                parts = urllib.parse.urlsplit(self.path)
+                self.send_response(301)
+                self.send_header("Location", urllib.parse.urlunsplit(parts._replace(path=parts.path + "/")))
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            index = os.path.join(path, "index.html")
+            if not os.path.isfile(index):
+                # Directory listing doubles as the gallery of built sketches
+                listing = self.list_directory(path)
+                if listing is not None and not head_only:
+                    self.wfile.write(listing.read())
+                return
+            path = index
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self.send_error(404, "File not found")
+            return
+
+        # Prefer a precompressed sibling. Content-addressed files never change,
+        # and the generator writes their siblings before the file itself; any
+        # other sibling must be at least as new as the file.
+        content_type = self.guess_type(path)
+        immutable = bool(IMMUTABLE.search(os.path.basename(path)))
+        encoding, body_path, body_stat = None, path, stat
+        etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+        accepted = accepted_encodings(self.headers.get("Accept-Encoding", ""))
+        for name, suffix, tag in ENCODINGS:
+            if accepted.get(name, accepted.get("*", 0)) > 0:
+                try:
+                    sibling = os.stat(path + suffix)
+                except OSError:
+                    continue
+                if immutable or sibling.st_mtime_ns >= stat.st_mtime_ns:
+                    # Each byte stream gets its own strong ETag
+                    encoding, body_path, body_stat = name, path + suffix, sibling
+                    etag = etag[:-1] + f'-{tag}"'
+                    break
+
+        if self.not_modified(etag, stat.st_mtime):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(body_stat.st_size))
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", email.utils.formatdate(stat.st_mtime, usegmt=True))
+        self.send_header("Vary", "Accept-Encoding")
+        if immutable:
+            self.send_header("Cache-Control", "public, max-age=31536000, immutable")
+        else:
+            self.send_header("Cache-Control", "no-cache")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.end_headers()
+        if head_only:
+            return
+
+        data = self.cache.get(body_path, body_stat)
+        if data is not None:
+            self.wfile.write(data)
+        else:
+            with open(body_path, "rb") as f:
+                self.connection.sendfile(f)
+
+    def not_modified(self, etag, mtime):
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None:
+            return etag in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*"
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if if_modified_since:
+            try:
+                since = email.utils.parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+            return int(mtime) <= since
+        return False
+
+    def guess_type(self, path):
+        content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        if content_type.startswith("text/") or content_type in ("application/javascript", "application/json"):
+            content_type += "; charset=utf-8"
+        return content_type
+
+class ReusableThreadingServer(http.server.ThreadingHTTPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+def make_server(directory, port, headers=None):
+    """Binds (and starts listening on) the port straight away; call
+    serve_forever() on the result to start answering. headers are sent with
+    every response, on top of CROSS_ORIGIN_ISOLATION."""
+    handler = type("BoundHandler", (Handler,), {"extra_headers": dict(CROSS_ORIGIN_ISOLATION, **(headers or {}))})
+    return ReusableThreadingServer(("", port), functools.partial(handler, directory=directory))
@@ -3,18 +3,75 @@ let paramA = 0.0; // MouseX normalized (0.0 to 1.0)
 let paramB = 0.0; // MouseY normalized (0.0 to 1.0)
 let helpVisible = false;
 let isPaused = false;
+let setupMs = 0;
+let firstFrameReported = false;
+const METRICS_BATCH = 120; // frames per POST to /metrics
+let phaseMs = { loadPixels: 0, updatePixels: 0 };
+let metricsBatch = [];
+
+// Effects run at DISPLAY size * renderScale and the canvas is stretched back
+// to DISPLAY size with CSS. ?scale= sets the starting scale and ?fps= the
+// frame rate the controller defends; effects that keep per-pixel state
+// between frames keep their starting scale. ?adaptive=0 turns it off.
+const DISPLAY_WIDTH = 1000, DISPLAY_HEIGHT = 750;
+const RENDER_SCALES = [1, 0.75, 0.5, 0.375, 0.25];
+const SCALE_WINDOW = 30; // frames averaged per decision
+const ADAPTIVE_SCALE = {{ADAPTIVE_SCALE}} && new URLSearchParams(location.search).get('adaptive') !== '0';
+let renderScale = 1;
+let pendingScale = 0;
+let targetFps = 60;
+let scaleWindowMs = 0;
+let scaleWindowFrames = 0;
+
+// Cameras deliver ~30 fps while draw() runs at display rate. Effects that are
+// a pure function of the camera frame and paramA/B (no frameCount, millis,
+// random or noise, no state between frames) only redraw when one of those
+// changed; otherwise the canvas keeps showing the last output.
+const FRAME_GATED = {{FRAME_GATED}};
+let videoFrames = 0; // frames announced by requestVideoFrameCallback
+let presented = null; // inputs of the output currently on the canvas
+
+// Frame acquisition. video.loadPixels() reads the camera through one canvas
+// created with willReadFrequently (kept in CPU memory, so the readback is a
+// copy instead of a GPU sync), at most once per draw(). Effects that write
+// every output pixel take outputFrame(), a persistent ImageData the size of
+// the canvas, and show it with presentFrame(): no canvas readback and no
+// per-frame buffers. Both hand out Uint8ClampedArray and Uint32Array views.
+const grabbed = { rgba: null, rgba32: null, width: 0, height: 0, frame: -1 };
+const output = { rgba: null, rgba32: null, width: 0, height: 0, image: null };
+const views32 = new WeakMap();
+let readVideo = null;
+
+// [INJECTED RUNTIME START]
+{{RUNTIME}}
+// [INJECTED RUNTIME END]
 
 // [INJECTED GLOBAL VARIABLES START]
 {{GLOBAL_VARS}}
 // [INJECTED GLOBAL VARIABLES END]
 
+function preload() {
+  // [INJECTED PRELOAD START]
+  {{PRELOAD}}
+  // [INJECTED PRELOAD END]
+}
+
 function setup() {
-  createCanvas(1000, 750);
+  setupMs = performance.now(); // p5 and all preloads are in
+  const settings = new URLSearchParams(location.search);
+  renderScale = constrain(Number(settings.get('scale')) || 1, 0.1, 1);
+  targetFps = Number(settings.get('fps')) || 60;
+  frameRate(targetFps);
+  createCanvas(round(DISPLAY_WIDTH * renderScale), round(DISPLAY_HEIGHT * renderScale));
   pixelDensity(1); // Ensure 1:1 pixel mapping for performance
+  fitCanvas();
   
   video = createCapture(VIDEO);
   video.size(width, height);
   video.hide(); // Hide the default HTML video element
+  installFrameGrabber();
+  watchVideoFrames();
+  instrumentPixels();
   
   noStroke();
 
@@ -33,28 +90,33 @@ function setup() {
 
   let btnExit = createButton('Exit');
   btnExit.position(160, 10);
-  btnExit.mousePressed(() => {
-    console.log("Exiting sketch...");
-    noLoop();
-    video.pause();
-    fetch('/shutdown').finally(() => window.close());
-  });
+  btnExit.mousePressed(exitSketch);
+
+  // Send what's left of the batch when the tab goes away
+  window.addEventListener('pagehide', flushMetrics);
 }
 
 function draw() {
+  if (!firstFrameReported && video.elt.readyState >= 2) reportFirstFrame();
+
   // Standardized Input Mapping
   // Map mouseX to paramA (0.0 to 1.0)
   paramA = constrain(mouseX / width, 0.0, 1.0);
   // Map mouseY to paramB (0.0 to 1.0)
   paramB = constrain(mouseY / height, 0.0, 1.0);
 
-  // [INJECTED DRAW LOOP LOGIC START]
+  if (pendingScale) applyRenderScale();
+
   push();
-  if (!isPaused) {
-    {{DRAW_LOOP_LOGIC}}
+  if (!isPaused && needsRedraw()) {
+    const start = performance.now();
+    phaseMs.loadPixels = phaseMs.updatePixels = 0;
+    drawEffect();
+    const frameMs = performance.now() - start;
+    if (firstFrameReported) recordFrame(frameMs);
+    if (ADAPTIVE_SCALE && firstFrameReported) adaptRenderScale(frameMs);
   }
   pop();
-  // [INJECTED DRAW LOOP LOGIC END]
 
   if (helpVisible) {
     push();
@@ -68,6 +130,188 @@ function draw() {
   }
 }
 
+// Kept as its own function so the dev server can hot-swap it
+function drawEffect() {
+  // [INJECTED DRAW LOOP LOGIC START]
+  {{DRAW_LOOP_LOGIC}}
+  // [INJECTED DRAW LOOP LOGIC END]
+}
+
+function installFrameGrabber() {
+  if (video.elt instanceof HTMLVideoElement) {
+    const canvas = document.createElement('canvas');
+    const context = canvas.getContext('2d', { willReadFrequently: true });
+    readVideo = (w, h) => {
+      if (canvas.width !== w || canvas.height !== h) {
+        canvas.width = w;
+        canvas.height = h;
+      }
+      context.drawImage(video.elt, 0, 0, w, h);
+      return context.getImageData(0, 0, w, h).data;
+    };
+  } else {
+    // A stand-in source (runtime/synthetic.js) already holds its frame in a canvas
+    const loadSource = video.loadPixels.bind(video);
+    readVideo = () => {
+      loadSource();
+      return video.pixels;
+    };
+  }
+  video.loadPixels = () => {
+    video.pixels = grabFrame().rgba;
+  };
+}
+
+function view32(rgba) {
+  // One Uint32Array (little-endian ABGR) per buffer, made on first use
+  let view = views32.get(rgba.buffer);
+  if (!view) {
+    view = new Uint32Array(rgba.buffer, rgba.byteOffset, rgba.length >> 2);
+    views32.set(rgba.buffer, view);
+  }
+  return view;
+}
+
+function grabFrame() {
+  // The current camera frame at video size; read once, then shared by every caller this frame
+  if (grabbed.frame === frameCount && grabbed.width === video.width && grabbed.height === video.height) return grabbed;
+  const start = performance.now();
+  grabbed.rgba = readVideo(video.width, video.height);
+  grabbed.rgba32 = view32(grabbed.rgba);
+  grabbed.width = video.width;
+  grabbed.height = video.height;
+  grabbed.frame = frameCount;
+  phaseMs.loadPixels += performance.now() - start;
+  return grabbed;
+}
+
+function outputFrame() {
+  // Write-only: the contents are whatever the last presentFrame() showed, not the canvas
+  if (output.width !== width || output.height !== height) {
+    output.image = drawingContext.createImageData(width, height);
+    output.rgba = output.image.data;
+    output.rgba32 = view32(output.rgba);
+    output.width = width;
+    output.height = height;
+  }
+  return output;
+}
+
+function presentFrame() {
+  const start = performance.now();
+  drawingContext.putImageData(output.image, 0, 0);
+  phaseMs.updatePixels += performance.now() - start;
+}
+
+function watchVideoFrames() {
+  const elt = video.elt;
+  if (!elt.requestVideoFrameCallback) return;
+  const onFrame = () => {
+    videoFrames++;
+    elt.requestVideoFrameCallback(onFrame);
+  };
+  elt.requestVideoFrameCallback(onFrame);
+}
+
+function currentVideoFrame() {
+  // requestVideoFrameCallback when it fires, else the media timestamp; a
+  // source without one (e.g. runtime/synthetic.js) has a new frame every draw
+  if (videoFrames > 0) return videoFrames;
+  if (typeof video.elt.currentTime === 'number') return video.elt.currentTime;
+  return frameCount;
+}
+
+function needsRedraw() {
+  if (!FRAME_GATED) return true;
+  const inputs = [currentVideoFrame(), paramA, paramB, helpVisible, width];
+  // The help overlay is translucent, so it needs a fresh frame underneath every time
+  if (!helpVisible && presented && inputs.every((value, k) => value === presented[k])) return false;
+  presented = inputs;
+  return true;
+}
+
+function fitCanvas() {
+  // p5 resets the canvas' CSS size on every resize
+  const canvas = document.querySelector('canvas');
+  canvas.style.width = DISPLAY_WIDTH + 'px';
+  canvas.style.height = DISPLAY_HEIGHT + 'px';
+}
+
+function adaptRenderScale(frameMs) {
+  scaleWindowMs += frameMs;
+  if (++scaleWindowFrames < SCALE_WINDOW) return;
+  const average = scaleWindowMs / scaleWindowFrames;
+  scaleWindowMs = scaleWindowFrames = 0;
+
+  // Pixel work grows with the square of the scale; step up only when the
+  // larger scale is predicted to fit with room to spare
+  const budget = 1000 / targetFps;
+  const step = RENDER_SCALES.findIndex((scale) => scale <= renderScale + 1e-6);
+  if (average > budget * 0.9 && step < RENDER_SCALES.length - 1) {
+    pendingScale = RENDER_SCALES[step + 1];
+  } else if (step > 0 && average * (RENDER_SCALES[step - 1] / renderScale) ** 2 < budget * 0.7) {
+    pendingScale = RENDER_SCALES[step - 1];
+  }
+}
+
+function applyRenderScale() {
+  // Applied at the start of a frame so the resize never shows as a blank frame
+  console.log(`Render scale ${renderScale} -> ${pendingScale} (target ${targetFps} fps)`);
+  renderScale = pendingScale;
+  pendingScale = 0;
+  resizeCanvas(round(DISPLAY_WIDTH * renderScale), round(DISPLAY_HEIGHT * renderScale));
+  video.size(width, height);
+  fitCanvas();
+}
+
+function reportFirstFrame() {
+  // Time from navigation start to the first draw() with camera data
+  firstFrameReported = true;
+  const report = { page: location.pathname, setupMs: setupMs, firstFrameMs: performance.now() };
+  console.log(`Time to first frame: ${report.firstFrameMs.toFixed(0)} ms (p5 ready at ${setupMs.toFixed(0)} ms)`);
+  navigator.sendBeacon('/ttff', JSON.stringify(report));
+}
+
+function instrumentPixels() {
+  // Effects call these themselves, so time them by wrapping the functions;
+  // grabFrame() and presentFrame() time themselves
+  timePhase(window, 'loadPixels', 'loadPixels');
+  timePhase(window, 'updatePixels', 'updatePixels');
+}
+
+function timePhase(target, method, phase) {
+  const original = target[method].bind(target);
+  target[method] = function () {
+    const start = performance.now();
+    const result = original(...arguments);
+    phaseMs[phase] += performance.now() - start;
+    return result;
+  };
+}
+
+function recordFrame(frameMs) {
+  // [loadPixels, effect logic, updatePixels, whole frame, interval since the previous frame]
+  const drawMs = frameMs - phaseMs.loadPixels - phaseMs.updatePixels;
+  metricsBatch.push([phaseMs.loadPixels, drawMs, phaseMs.updatePixels, frameMs, deltaTime]
+    .map((ms) => Math.round(ms * 1000) / 1000));
+  if (metricsBatch.length >= METRICS_BATCH) flushMetrics();
+}
+
+function flushMetrics() {
+  if (!metricsBatch.length) return;
+  const batch = { page: location.pathname, targetFrameRate: getTargetFrameRate(), scale: renderScale, samples: metricsBatch };
+  metricsBatch = [];
+  navigator.sendBeacon('/metrics', JSON.stringify(batch));
+}
+
+function exitSketch() {
+  console.log("Exiting sketch...");
+  noLoop();
+  video.pause();
+  flushMetrics();
+  fetch('/shutdown').finally(() => window.close());
+}
+
 function togglePause() {
   isPaused = !isPaused;
   if (isPaused) video.pause();
@@ -78,9 +322,5 @@ function keyPressed() {
   if (key === 's' || key === 'S') saveCanvas('pixelsynth_output', 'png');
   if (key === 'p' || key === 'P') togglePause();
   if (key === 'h' || key === 'H') helpVisible = !helpVisible;
-  if (key === 'e' || key === 'E') {
-    noLoop();
-    video.pause();
-    fetch('/shutdown').finally(() => window.close());
-  }
+  if (key === 'e' || key === 'E') exitSketch();
 }
\ No newline at end of file
@@ -0,0 +1,145 @@
+"""
+PixelSynth Frame Telemetry
+Collects the per-frame timings sketches POST to /metrics.
+
+Every sketch times the phases of its draw loop (video/canvas loadPixels, the
+effect's own logic, updatePixels, the whole frame) plus the interval between
+frames, and sends them in batches. Samples are folded into HDR-style
+histograms as they arrive: log-linear buckets with a fixed relative error, so
+memory stays constant however long a kiosk runs and p50/p95/p99 can be read
+at any time. GET /metrics returns the live report, and a JSON report is
+written to output/metrics/ when the server shuts down.
+"""
+import os
+import json
+import time
+import threading
+
+SUB_BUCKET_BITS = 7  # 64..127 sub-buckets per power of two: under 1.6% error
+PHASES = ("loadPixels", "draw", "updatePixels", "frame")
+QUANTILES = (0.5, 0.95, 0.99)
+DROP_FACTOR = 1.5  # a frame interval this many times the target counts as dropped frames
+SUMMARY_INTERVAL = 10.0
+REPORT_DIR = "metrics"
+
+class Histogram:
+    """Durations in ms, stored as integer microseconds in log-linear buckets."""
+
+    def __init__(self):
+        self.counts = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    @staticmethod
+    def bucket(us):
+        shift = max(us.bit_length() - SUB_BUCKET_BITS, 0)
+        return (shift << SUB_BUCKET_BITS) + (us >> shift)
+
+    @staticmethod
+    def bucket_value(index):
+        # Middle of the bucket's range, back in ms
+        shift, sub = index >> SUB_BUCKET_BITS, index & ((1 << SUB_BUCKET_BITS) - 1)
+        return ((sub << shift) + ((1 << shift) - 1) / 2) / 1000
+
+    def record(self, ms):
+        index = self.bucket(max(int(round(ms * 1000)), 0))
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += ms
+        self.max = max(self.max, ms)
+
+    def quantile(self, q):
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(self.bucket_value(index), self.max)
+        return self.max
+
+    def summary(self):
+        out = {f"p{round(q * 100)}": round(self.quantile(q), 3) for q in QUANTILES}
+        out["mean"] = round(self.total / self.count, 3) if self.count else 0.0
+        out["max"] = round(self.max, 3)
+        return out
+
+class PageStats:
+    def __init__(self):
+        self.phases = {phase: Histogram() for phase in PHASES}
+        self.interval = Histogram()
+        self.dropped = 0
+        self.scale = 1
+        self.last_summary = time.monotonic()
+
+    def record(self, sample, target_fps):
+        for phase, ms in zip(PHASES, sample):
+            self.phases[phase].record(ms)
+        if len(sample) > len(PHASES):
+            interval = sample[len(PHASES)]
+            self.interval.record(interval)
+            expected = 1000 / target_fps
+            if interval > DROP_FACTOR * expected:
+                self.dropped += round(interval / expected) - 1
+
+    def summary(self):
+        return {
+            "frames": self.phases["frame"].count,
+            "dropped": self.dropped,
+            "scale": self.scale,
+            "phases": {phase: histogram.summary() for phase, histogram in self.phases.items()},
+            "interval": self.interval.summary(),
+        }
+
+class Telemetry:
+    def __init__(self):
+        self.pages = {}
+        self.directory = None
+        self._lock = threading.Lock()
+
+    def record(self, handler, batch):
+        # POST /metrics: {"page": "/40/", "targetFrameRate": 60, "scale": 1, "samples": [[loadPixels, draw, updatePixels, frame, interval], ...]}
+        if not isinstance(batch, dict) or not isinstance(batch.get("samples"), list):
+            raise ValueError("expected an object with a list of samples")
+        page = str(batch.get("page", "?"))
+        samples = batch["samples"]
+        target_fps = float(batch.get("targetFrameRate") or 60)
+        with self._lock:
+            self.directory = handler.directory
+            stats = self.pages.setdefault(page, PageStats())
+            stats.scale = float(batch.get("scale", stats.scale))  # render scale the latest frames ran at
+            for sample in samples:
+                stats.record([float(value) for value in sample], target_fps)
+            if time.monotonic() - stats.last_summary >= SUMMARY_INTERVAL:
+                stats.last_summary = time.monotonic()
+                frame = stats.phases["frame"].summary()
+                print(f"📈 {page} frame p50 {frame['p50']:.1f} / p95 {frame['p95']:.1f} / p99 {frame['p99']:.1f} ms, "
+                      f"{stats.dropped} dropped in {stats.phases['frame'].count} frames")
+
+    def report(self):
+        with self._lock:
+            return {
+                "generated": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "pages": {page: stats.summary() for page, stats in self.pages.items()},
+            }
+
+    def serve(self, handler):
+        # GET /metrics: the live report
+        handler.send_bytes(json.dumps(self.report(), indent=2).encode("utf-8"), "application/json")
+
+    def write_report(self):
+        """Writes the report to output/metrics/<timestamp>.json; returns its path, or None without samples."""
+        if not self.pages or self.directory is None:
+            return None
+        report = self.report()
+        directory = os.path.join(self.directory, REPORT_DIR)
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, time.strftime("%Y%m%d-%H%M%S") + ".json")
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"📈 Frame timing report written to {path}")
+        return path
+
+TELEMETRY = Telemetry()
@@ -0,0 +1,56 @@
+import re
+
+import pytest
+
+import compose
+from compose import ChainError, band_rows, compile_chain, load_stages, rename, split_passes, top_level_declarations
+
+def test_top_level_declarations_skip_nested_blocks():
+    code = "let a = f(1, 2), b = [3, 4];\nconst c = 5;\nif (a) {\n  let d = 6;\n}\nvar e;"
+    assert top_level_declarations(code) == ["a", "b", "c", "e"]
+
+def test_rename_leaves_strings_comments_keys_and_members_alone():
+    code = "let h = 1; f({h: h}, 'h', \"h\"); // h\nx = c ? h : o.h; /* h */"
+    assert rename(code, ["h"], "s1_") == "let s1_h = 1; f({h: s1_h}, 'h', \"h\"); // h\nx = c ? s1_h : o.h; /* h */"
+
+def test_rename_matches_whole_names_only():
+    assert rename("hue2rgb(h, hh, $h, h$)", ["h"], "s0_") == "hue2rgb(s0_h, hh, $h, h$)"
+
+def test_compile_chain_prefixes_setup_variables_per_stage():
+    draw = compile_chain(["25", "25"], use_luts=False)["draw_loop"]
+    assert "let s0_hue2rgb" in draw and "let s1_hue2rgb" in draw
+    assert not re.search(r"(?<![\w$])hue2rgb\b", draw)
+
+def test_compile_chain_fuses_pixel_stages_into_one_pass():
+    effect = compile_chain(["20", "29", "30"], use_luts=False)
+    assert "1 pass(es) over the frame for 3 effect(s)" in effect["draw_loop"]
+    assert effect["name"] == "Solarization + Luma Keying + False Color"
+    assert effect["runtime"] == [] and effect["assets"] == {}
+
+@pytest.mark.skipif(compose.luts is None, reason="NumPy is not installed")
+def test_compile_chain_ships_lut_assets():
+    effect = compile_chain(["21", "25"])
+    assert effect["runtime"] == ["luts"]
+    assert list(effect["assets"]) == ["lut3d_25.bin"]
+
+def test_compile_chain_rejects_bad_keys():
+    with pytest.raises(ChainError, match="at least one effect"):
+        compile_chain([])
+    with pytest.raises(ChainError, match="Unknown effect id: 9999"):
+        compile_chain(["9999"])
+    with pytest.raises(ChainError, match="cannot be chained"):
+        compile_chain(["1"])
+
+def test_neighbour_stages_start_a_new_pass():
+    passes = split_passes(load_stages(["20", "91", "105", "21"], use_luts=False))
+    assert [[stage["key"] for stage in group] for group in passes] == [["20"], ["91"], ["105", "21"]]
+
+def test_band_rows_add_the_halo_of_later_neighbour_passes():
+    # 91 reads one row either side; 105 declares no halo
+    passes = split_passes(load_stages(["20", "91", "105", "21"], use_luts=False))
+    assert band_rows(passes) == [("Math.max(0, y0 - 1)", "Math.min(h, y1 + 1)"), ("y0", "y1"), ("y0", "y1")]
+
+def test_band_rows_sum_halos():
+    passes = split_passes(load_stages(["20", "68", "91"], use_luts=False))
+    assert band_rows(passes) == [("Math.max(0, y0 - 2)", "Math.min(h, y1 + 2)"),
+                                 ("Math.max(0, y0 - 1)", "Math.min(h, y1 + 1)"), ("y0", "y1")]
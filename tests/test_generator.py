@@ -0,0 +1,19 @@
+import pytest
+
+from effects_library import EFFECTS
+from generator import parse_selection
+
+def test_parse_selection_defaults_to_every_effect():
+    assert parse_selection([]) == list(EFFECTS.keys())
+    assert parse_selection(["21", "all"]) == list(EFFECTS.keys())
+
+def test_parse_selection_ranges_and_lists_keep_order():
+    assert parse_selection(["23-25", "21"]) == ["23", "24", "25", "21"]
+    assert parse_selection(["30,21", " 22 ,"]) == ["30", "21", "22"]
+
+def test_parse_selection_drops_duplicates():
+    assert parse_selection(["21-23", "22", "21"]) == ["21", "22", "23"]
+
+def test_parse_selection_rejects_unknown_ids():
+    with pytest.raises(ValueError, match="Unknown effect id: 9999"):
+        parse_selection(["9999"])
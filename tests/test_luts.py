@@ -0,0 +1,151 @@
+import math
+
+import pytest
+
+pytest.importorskip("numpy")
+
+import luts
+from compose import compile_chain
+
+def js_map(value, start1, stop1, start2, stop2):
+    return (value - start1) / (stop1 - start1) * (stop2 - start2) + start2
+
+def js_store(value):
+    """What writing value into a Uint8ClampedArray keeps."""
+    return round(min(max(value, 0), 255))
+
+def param_of(n, bins=luts.LUT_BINS):
+    return n / (bins - 1)
+
+# Straight transcriptions of the effects' JS, one value at a time
+
+def posterize(v, param_a):
+    levels = math.floor(js_map(param_a, 0, 1, 2, 8))
+    return math.floor(v / 255 * (levels - 1) + 0.5) * (255 / (levels - 1))
+
+def heatmap(r, g, b, param_a):
+    val = min(max((r + g + b) / 3 + js_map(param_a, 0, 1, -50, 50), 0), 255)
+    if val < 128:
+        return 0, js_map(val, 0, 128, 0, 255), js_map(val, 0, 128, 255, 0)
+    return js_map(val, 128, 255, 0, 255), js_map(val, 128, 255, 255, 0), 0
+
+def test_channel_table_matches_the_effect():
+    table, offsets = luts.build_table("21", "channel")
+    assert len(offsets) == luts.LUT_BINS
+    for n in range(0, luts.LUT_BINS, 7):
+        for v in range(256):
+            assert table[offsets[n] + v] == js_store(posterize(v, param_of(n))), (n, v)
+
+def test_channel_tables_share_identical_bins():
+    # floor(map(paramA, 0, 1, 2, 8)) only takes the values 2..8
+    table, offsets = luts.build_table("21", "channel")
+    assert len(table) == 7 * 256
+    assert sorted(set(offsets)) == [n * 256 for n in range(7)]
+
+def test_luma_palette_matches_the_effect():
+    table, offsets = luts.build_table("22", "luma")
+    for n in (0, 20, 45, luts.LUT_BINS - 1):
+        for r, g, b in ((0, 0, 0), (255, 255, 255), (10, 200, 90), (128, 127, 129), (77, 3, 250)):
+            base = offsets[n] + (r + g + b) * 3
+            expected = [js_store(c) for c in heatmap(r, g, b, param_of(n))]
+            assert list(table[base:base + 3]) == expected, (n, r, g, b)
+
+def test_unknown_kinds_are_rejected():
+    assert luts.has_table("21", "channel") and not luts.has_table("21", "luma")
+    with pytest.raises(ValueError, match="Unknown LUT kind"):
+        luts.build_table("21", "cube")
+
+def test_chained_lookups_clamp_their_inputs():
+    # Only the first stage reads bytes straight from the frame
+    draw = compile_chain(["21", "22", "27"])["draw_loop"]
+    assert "s0_lut[s0_lutBase + r]" in draw
+    assert "((Math.min(255, Math.max(0, r)) + 0.5) | 0)" in draw
+    assert "s2_lut[s2_lutBase + ((Math.min(255, Math.max(0, b)) + 0.5) | 0)]" in draw
+
+def inverted_luma(r, g, b, param_a):
+    rn, gn, bn = r / 255, g / 255, b / 255
+    high, low = max(rn, gn, bn), min(rn, gn, bn)
+    h, s, l = 0, 0, (high + low) / 2
+    if high != low:
+        d = high - low
+        s = d / (2 - high - low) if l > 0.5 else d / (high + low)
+        if high == rn:
+            h = (gn - bn) / d + (6 if gn < bn else 0)
+        elif high == gn:
+            h = (bn - rn) / d + 2
+        else:
+            h = (rn - gn) / d + 4
+        h /= 6
+    l = 1 - l
+    if s == 0:
+        return l * 255, l * 255, l * 255
+
+    def hue2rgb(p, q, t):
+        t = t + 1 if t < 0 else t - 1 if t > 1 else t
+        if t < 1 / 6:
+            return p + (q - p) * 6 * t
+        if t < 1 / 2:
+            return q
+        if t < 2 / 3:
+            return p + (q - p) * (2 / 3 - t) * 6
+        return p
+
+    q = l * (1 + s) if l < 0.5 else l + s - l * s
+    p = 2 * l - q
+    return hue2rgb(p, q, h + 1 / 3) * 255, hue2rgb(p, q, h) * 255, hue2rgb(p, q, h - 1 / 3) * 255
+
+def sepia(r, g, b, param_a):
+    amount = js_map(param_a, 0, 1, 0.5, 1.0)
+    tr = r * 0.393 + g * 0.769 + b * 0.189
+    tg = r * 0.349 + g * 0.686 + b * 0.168
+    tb = r * 0.272 + g * 0.534 + b * 0.131
+    return tuple(c + (min(max(t, 0), 255) - c) * amount for c, t in ((r, tr), (g, tg), (b, tb)))
+
+def apply_lut3d(cube, base, r, g, b):
+    """Port of applyLut3d (runtime/luts.js): tetrahedral interpolation."""
+    size = luts.LUT3D_SIZE
+    top = size - 1
+    f = [min(max(c * top / 255, 0), top) for c in (r, g, b)]
+    corner = [min(int(c), top - 1) for c in f]
+    frac = [c - i for c, i in zip(f, corner)]
+    strides = (size * size * 3, size * 3, 3)
+    order = sorted(range(3), key=lambda axis: -frac[axis])
+    weights = [1 - frac[order[0]], frac[order[0]] - frac[order[1]], frac[order[1]] - frac[order[2]], frac[order[2]]]
+    index = base + sum(i * stride for i, stride in zip(corner, strides))
+    corners = [index]
+    for axis in order:
+        index += strides[axis]
+        corners.append(index)
+    return [sum(w * cube[c + channel] for w, c in zip(weights, corners)) for channel in range(3)]
+
+CUBE_REFERENCES = {"23": sepia, "25": inverted_luma}
+
+@pytest.mark.parametrize("key", sorted(luts.COLOR_CUBES))
+def test_cube_grid_points_hold_the_effect(key):
+    fn, bins = luts.COLOR_CUBES[key]
+    table, offsets = luts.build_table(key, "3d")
+    size = luts.LUT3D_SIZE
+    assert len(offsets) == bins
+    n = bins - 1
+    for i, j, k in ((0, 0, 0), (size - 1, size - 1, size - 1), (3, 17, 30), (32, 0, 9), (11, 11, 12)):
+        r, g, b = (c * 255 / (size - 1) for c in (i, j, k))
+        expected = [js_store(float(c)) for c in fn(r, g, b, param_of(n, bins) if bins > 1 else 0.0)]
+        base = offsets[n] + ((i * size + j) * size + k) * 3
+        assert list(table[base:base + 3]) == expected, (i, j, k)
+
+@pytest.mark.parametrize("key", sorted(CUBE_REFERENCES))
+def test_cube_interpolation_stays_close_to_the_effect(key):
+    # Smooth grades interpolate to within a few levels, the worst being where
+    # a channel starts to clip
+    bins = luts.COLOR_CUBES[key][1]
+    table, offsets = luts.build_table(key, "3d")
+    worst = 0
+    for n in sorted({0, bins - 1}):
+        param_a = param_of(n, bins) if bins > 1 else 0.0
+        for r in range(0, 256, 15):
+            for g in range(3, 256, 21):
+                for b in range(7, 256, 25):
+                    expected = [min(max(c, 0), 255) for c in CUBE_REFERENCES[key](r, g, b, param_a)]
+                    got = apply_lut3d(table, offsets[n], r, g, b)
+                    worst = max(worst, *(abs(x - y) for x, y in zip(expected, got)))
+    assert worst < 3
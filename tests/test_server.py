@@ -0,0 +1,120 @@
+import os
+import http.client
+import threading
+
+import pytest
+
+import server
+from server import FileCache, accepted_encodings, make_server
+
+def test_accepted_encodings_parse_q_values():
+    assert accepted_encodings("") == {}
+    assert accepted_encodings("gzip, br;q=0.5, *;q=0") == {"gzip": 1.0, "br": 0.5, "*": 0.0}
+    assert accepted_encodings("GZIP;Q=0 , identity;q=oops") == {"gzip": 0.0, "identity": 0.0}
+
+def test_file_cache_refreshes_changed_files(tmp_path):
+    path = tmp_path / "a.js"
+    path.write_bytes(b"one")
+    cache = FileCache()
+    assert cache.get(str(path), os.stat(path)) == b"one"
+    path.write_bytes(b"three")
+    assert cache.get(str(path), os.stat(path)) == b"three"
+    assert cache.total == 5
+
+def test_file_cache_skips_large_files_and_evicts_least_recent(tmp_path):
+    paths = []
+    for name in "abcd":
+        paths.append(str(tmp_path / name))
+        with open(paths[-1], "wb") as f:
+            f.write(name.encode() * 4)
+    cache = FileCache(max_file=4, max_total=8)
+    get = lambda path: cache.get(path, os.stat(path))
+    big = tmp_path / "big"
+    big.write_bytes(b"x" * 5)
+    assert get(str(big)) is None and cache.total == 0
+
+    get(paths[0])
+    get(paths[1])
+    get(paths[0])  # b is now the least recently served
+    get(paths[2])
+    assert list(cache._entries) == [paths[0], paths[2]] and cache.total == 8
+
+@pytest.fixture
+def site(tmp_path):
+    httpd = make_server(str(tmp_path), 0)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+
+    def request(path, method="GET", **headers):
+        connection = http.client.HTTPConnection("127.0.0.1", httpd.server_address[1], timeout=5)
+        connection.request(method, path, headers=headers)
+        response = connection.getresponse()
+        body = response.read()
+        connection.close()
+        return response, body
+
+    yield tmp_path, request
+    httpd.shutdown()
+    httpd.server_close()
+
+def write(path, data, mtime):
+    path.write_bytes(data)
+    os.utime(path, ns=(mtime, mtime))
+
+def test_precompressed_siblings_follow_accept_encoding(site):
+    root, request = site
+    write(root / "sketch.js", b"plain", 2_000_000_000_000_000_000)
+    write(root / "sketch.js.br", b"brotli", 2_000_000_000_000_000_000)
+    write(root / "sketch.js.gz", b"gzipped", 2_000_000_000_000_000_000)
+
+    response, body = request("/sketch.js", **{"Accept-Encoding": "gzip, br"})
+    assert body == b"brotli" and response.getheader("Content-Encoding") == "br"
+    assert response.getheader("Vary") == "Accept-Encoding"
+    assert response.getheader("Content-Type") == "text/javascript; charset=utf-8"
+    assert response.getheader("Cache-Control") == "no-cache"
+    br_etag = response.getheader("ETag")
+    assert br_etag.endswith('-br"')
+
+    response, body = request("/sketch.js", **{"Accept-Encoding": "gzip, br;q=0"})
+    assert body == b"gzipped" and response.getheader("ETag").endswith('-gz"')
+
+    response, body = request("/sketch.js", **{"Accept-Encoding": "*;q=0"})
+    plain_etag = response.getheader("ETag")
+    assert body == b"plain" and response.getheader("Content-Encoding") is None
+    assert br_etag == plain_etag[:-1] + '-br"'  # same file, one tag per byte stream
+
+def test_etags_revalidate_per_encoding(site):
+    root, request = site
+    write(root / "sketch.js", b"plain", 2_000_000_000_000_000_000)
+    write(root / "sketch.js.gz", b"gzipped", 2_000_000_000_000_000_000)
+    etag = request("/sketch.js", **{"Accept-Encoding": "gzip"})[0].getheader("ETag")
+
+    response, body = request("/sketch.js", **{"Accept-Encoding": "gzip", "If-None-Match": etag})
+    assert response.status == 304 and body == b"" and response.getheader("ETag") == etag
+    response, body = request("/sketch.js", **{"If-None-Match": etag})
+    assert response.status == 200 and body == b"plain"
+
+def test_stale_siblings_are_ignored_unless_content_addressed(site):
+    root, request = site
+    write(root / "sketch.js", b"new", 2_000_000_000_000_000_000)
+    write(root / "sketch.js.gz", b"old", 1_000_000_000_000_000_000)
+    write(root / "p5.0123456789ab.min.js", b"p5", 2_000_000_000_000_000_000)
+    write(root / "p5.0123456789ab.min.js.gz", b"p5 gzipped", 1_000_000_000_000_000_000)
+
+    assert request("/sketch.js", **{"Accept-Encoding": "gzip"})[1] == b"new"
+    response, body = request("/p5.0123456789ab.min.js", **{"Accept-Encoding": "gzip"})
+    assert body == b"p5 gzipped"
+    assert response.getheader("Cache-Control") == "public, max-age=31536000, immutable"
+
+def test_head_and_cross_origin_headers(site):
+    root, request = site
+    (root / "40").mkdir()
+    write(root / "40" / "index.html", b"<html></html>", 2_000_000_000_000_000_000)
+    response, _ = request("/40")
+    assert response.status == 301 and response.getheader("Location") == "/40/"
+
+    response, body = request("/40/", method="HEAD")
+    assert response.status == 200 and body == b"" and response.getheader("Content-Length") == "13"
+    for name, value in server.CROSS_ORIGIN_ISOLATION.items():
+        assert response.getheader(name) == value
+    assert request("/missing.js")[0].status == 404
@@ -0,0 +1,57 @@
+import json
+import types
+
+import pytest
+
+import telemetry
+from telemetry import Histogram, PageStats, Telemetry
+
+def test_small_durations_get_exact_buckets():
+    for us in range(1 << telemetry.SUB_BUCKET_BITS):
+        assert Histogram.bucket(us) == us
+
+def test_buckets_are_monotonic_with_bounded_error():
+    previous = -1
+    for us in list(range(1, 5000)) + list(range(5000, 10_000_000, 997)):
+        index = Histogram.bucket(us)
+        assert index >= previous
+        previous = index
+        assert Histogram.bucket_value(index) * 1000 == pytest.approx(us, rel=1 / (1 << (telemetry.SUB_BUCKET_BITS - 1)))
+
+def test_quantiles_of_a_uniform_spread():
+    histogram = Histogram()
+    for ms in range(1, 1001):
+        histogram.record(ms)
+    summary = histogram.summary()
+    assert summary["p50"] == pytest.approx(500, rel=0.016)
+    assert summary["p95"] == pytest.approx(950, rel=0.016)
+    assert summary["p99"] == pytest.approx(990, rel=0.016)
+    assert summary["mean"] == 500.5 and summary["max"] == 1000
+
+def test_quantiles_never_exceed_the_maximum():
+    histogram = Histogram()
+    histogram.record(0.2001)
+    assert histogram.quantile(0.99) == pytest.approx(0.2001)
+    assert Histogram().summary() == {"p50": 0.0, "p95": 0.0, "p99": 0.0, "mean": 0.0, "max": 0.0}
+
+def test_long_intervals_count_dropped_frames():
+    stats = PageStats()
+    stats.record([1, 2, 3, 6, 16.7], 60)
+    stats.record([1, 2, 3, 6, 50], 60)  # two frames missed at 60 fps
+    stats.record([1, 2, 3, 6], 60)  # first frame: no interval yet
+    assert stats.dropped == 2
+    assert stats.phases["frame"].count == 3 and stats.interval.count == 2
+
+def test_batches_are_validated_and_reported(tmp_path):
+    metrics = Telemetry()
+    handler = types.SimpleNamespace(directory=str(tmp_path))
+    with pytest.raises(ValueError):
+        metrics.record(handler, {"page": "/21/"})
+    assert metrics.write_report() is None
+
+    metrics.record(handler, {"page": "/21/", "targetFrameRate": 30, "scale": 0.5, "samples": [[1, 2, 3, 7, 33]]})
+    page = metrics.report()["pages"]["/21/"]
+    assert page["frames"] == 1 and page["scale"] == 0.5 and page["dropped"] == 0
+
+    with open(metrics.write_report()) as f:
+        assert json.load(f)["pages"]["/21/"]["phases"]["frame"]["max"] == 7